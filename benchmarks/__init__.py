@@ -0,0 +1,7 @@
+"""Benchmarks for FastHotkeyExecuter. Run them from the project root, e.g.
+
+    python -m benchmarks.memory_records
+
+benchmarks.suite covers the load, search and render paths and writes JSON
+results that can be compared between runs.
+"""
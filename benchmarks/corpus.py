@@ -0,0 +1,57 @@
+"""Synthetic hotkey corpora shared by the benchmarks."""
+import json
+import os
+import random
+
+WORDS = ['new', 'open', 'close', 'tab', 'window', 'save', 'file', 'edit', 'view', 'zoom',
+         'select', 'all', 'next', 'previous', 'line', 'go', 'to', 'bookmark', 'history', 'panel']
+MODIFIERS = ['ctrl', 'shift', 'alt', 'win']
+KEYS = [chr(c) for c in range(ord('a'), ord('z') + 1)] + [f'f{i}' for i in range(1, 13)]
+
+
+def generate_items(count, seed=1):
+    """Generate JSON hotkey items: mostly single hotkeys, some sequences and run entries."""
+    rng = random.Random(seed)
+
+    def hotkey():
+        modifiers = rng.sample(MODIFIERS, rng.randint(0, 2))
+        return '+'.join(modifiers + [rng.choice(KEYS)])
+
+    items = []
+    for _ in range(count):
+        name = ' '.join(rng.choice(WORDS) for _ in range(rng.randint(2, 6))).capitalize()
+        roll = rng.random()
+        if roll < 0.1:
+            actions = []
+            for _ in range(rng.randint(2, 6)):
+                actions.append({'hotkey': hotkey()})
+                actions.append({'sleep': rng.choice([50, 100, 200])})
+            items.append({'name': name, 'hotkeys': actions})
+        elif roll < 0.12:
+            items.append({'name': name, 'run': f'scripts/{rng.choice(WORDS)}.ahk'})
+        else:
+            items.append({'name': name, 'hotkey': hotkey()})
+    return items
+
+
+def write_app(data_dir, app_name, count, entries_per_file=500, seed=1):
+    """Write a generated app directory with count entries split over several JSON files.
+
+    Every other file uses the metadata format with a name prefix; the others
+    are plain lists, so both file formats are exercised.
+
+    Returns:
+        str: The app directory.
+    """
+    app_dir = os.path.join(data_dir, app_name)
+    os.makedirs(app_dir, exist_ok=True)
+    items = generate_items(count, seed)
+    for number, start in enumerate(range(0, count, entries_per_file)):
+        chunk = items[start:start + entries_per_file]
+        if number % 2:
+            content = {'metadata': {'prefix': WORDS[number % len(WORDS)].capitalize()}, 'hotkeys': chunk}
+        else:
+            content = chunk
+        with open(os.path.join(app_dir, f'{app_name}_{number:04d}.json'), 'w', encoding='utf-8') as f:
+            json.dump(content, f)
+    return app_dir
@@ -0,0 +1,317 @@
+"""Headless show -> search -> execute runs through the simulated backend.
+
+Each scenario focuses a window of a simulated application, fires the
+toggle hotkey through HotkeyManager, types a query into a real
+SearchManager and executes the best match through ExecutionWorker and
+HotkeyExecutor. Only the OS and Tk are replaced: SimulatedBackend records
+every focus change and key event with its timestamp, and the popup hands
+focus to an unrelated window when it hides, like Windows may do.
+
+The hotkeys are preloaded from the simulated process list first, as at
+startup. Every run is checked:
+
+    - the query selects the expected entry (and window_title scoped files
+      only apply to matching windows)
+    - focus is back on the target window before the first key event
+    - the key events are exactly those of the entry's action plans
+    - no key event comes earlier than the timing profile allows
+
+and timed per stage:
+
+    show     toggle hotkey until the initial results are rendered
+    search   query set until its results are rendered
+    handoff  execute until the first key event reaches the target
+    inject   first until last key event
+    total    toggle hotkey until the last key event
+    late     largest delay of a key event behind its planned time
+
+    python -m benchmarks.end_to_end --repeat 10
+"""
+import argparse
+import contextlib
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+from src.app_modules.hotkey_entry import KIND_HOTKEY
+from src.app_modules.hotkey_loader import HotkeyLoader
+from src.app_modules.hotkey_preloader import HotkeyPreloader
+from src.backends.simulated import SimulatedBackend, EVENT_FOCUS, EVENT_PRESS, EVENT_RELEASE, EVENT_WHEEL
+from src.gui.search_manager import SearchManager
+from src.hotkeys.action_plan import play_plan
+from src.hotkeys.execution_worker import ExecutionWorker
+from src.hotkeys.hotkey_executor import HotkeyExecutor
+from src.hotkeys.hotkey_manager import HotkeyManager
+from src.hotkeys.timing_profiles import TIMING_PROFILES, get_timing_profile
+from src.process.process_manager import ProcessManager
+from .headless import HeadlessEventManager, HeadlessTheme, HeadlessUIManager, HeadlessWindow
+
+APP_NAME = 'benchapp'
+TOGGLE_HOTKEY = 'f1'
+MAX_RESULTS = 100
+KEY_EVENTS = (EVENT_PRESS, EVENT_RELEASE, EVENT_WHEEL)
+STAGES = ('show', 'search', 'handoff', 'inject', 'total', 'late')
+
+# Key events may come this much earlier than planned (clock and sleep granularity)
+TOLERANCE = 0.002
+# Upper bound for one execution before the run counts as hung
+EXECUTION_TIMEOUT = 10.0
+
+APP_FILES = {
+    'editor.json': {
+        'hotkeys': [
+            {'name': 'Save file', 'hotkey': 'ctrl+s'},
+            {'name': 'Command palette', 'hotkey': 'ctrl+shift+p'},
+            {'name': 'Zoom in', 'hotkey': 'ctrl+wheelup'},
+            {'name': 'Refresh', 'hotkey': 'f5'},
+            {'name': 'Duplicate line twice', 'hotkeys': [
+                {'hotkey': 'ctrl+d'}, {'sleep': 30}, {'hotkey': 'ctrl+d'},
+            ]},
+        ],
+    },
+    'diff.json': {
+        'metadata': {'window_title': 'Diff:*'},
+        'hotkeys': [
+            {'name': 'Next change', 'hotkey': 'alt+f5'},
+        ],
+    },
+}
+
+WINDOWS = {
+    'editor': 'main.py - Benchapp',
+    'diff': 'Diff: main.py - Benchapp',
+}
+
+# (window, query, expected entry name or None if nothing may match)
+SCENARIOS = [
+    ('editor', 'save', 'Save file'),
+    ('editor', 'palette', 'Command palette'),
+    ('editor', 'zoom in', 'Zoom in'),
+    ('editor', 'dup', 'Duplicate line twice'),
+    ('editor', 'next change', None),
+    ('diff', 'next change', 'Next change'),
+]
+
+
+class SimulatedWindowManager:
+    """The WindowManager methods used by the popup path, over a SimulatedBackend.
+
+    Showing gives the popup focus; hiding hands focus to an unrelated
+    window, so the executor has to bring the target back itself.
+    """
+
+    def __init__(self, backend, process_manager, popup_hwnd, fallback_hwnd):
+        self.window = HeadlessWindow()
+        self.backend = backend
+        self.process_manager = process_manager
+        self.popup_hwnd = popup_hwnd
+        self.fallback_hwnd = fallback_hwnd
+        self.current_context = None
+
+    def resolve_context(self):
+        return self.process_manager.get_active_window_context()
+
+    def show(self, context=None):
+        if context is None:
+            context = self.resolve_context()
+        if not context:
+            return False
+        self.current_context = context
+        self.backend.focus(self.popup_hwnd)
+        return True
+
+    def hide(self):
+        self.current_context = None
+        self.backend.focus(self.fallback_hwnd)
+
+    def get_current_app(self):
+        return self.current_context['name'] if self.current_context else None
+
+    def get_current_window(self):
+        return self.current_context['hwnd'] if self.current_context else None
+
+    def get_current_window_title(self):
+        return self.current_context['title'] if self.current_context else None
+
+
+def planned_events(entry, profile):
+    """Return [(planned offset in seconds, kind, value), ...] of the key events of an entry."""
+    clock = [0.0]
+    events = []
+
+    def recorder(kind):
+        return lambda value: events.append((clock[0], kind, value))
+
+    def sleep(seconds):
+        clock[0] += seconds
+
+    press, release, wheel = recorder(EVENT_PRESS), recorder(EVENT_RELEASE), recorder(EVENT_WHEEL)
+    if entry.kind == KIND_HOTKEY:
+        play_plan(entry.plan, profile, press, release, wheel, sleep)
+    else:
+        for action in entry.actions:
+            if action.sleep is not None:
+                sleep(action.sleep / 1000)
+            elif action.plan is not None:
+                play_plan(action.plan, profile, press, release, wheel, sleep)
+    return events
+
+
+class EndToEndBench:
+    """A simulated desktop with the popup path wired up for one timing profile."""
+
+    def __init__(self, root, profile_name):
+        data_dir = os.path.join(root, 'hotkeys')
+        app_dir = os.path.join(data_dir, APP_NAME)
+        os.makedirs(app_dir, exist_ok=True)
+        for filename, data in APP_FILES.items():
+            with open(os.path.join(app_dir, filename), 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+
+        self.profile = get_timing_profile(profile_name)
+        self.backend = SimulatedBackend()
+        pid = 4000
+        self.windows = {name: self.backend.add_window('Benchapp.exe', title, pid=pid)
+                        for name, title in WINDOWS.items()}
+        popup = self.backend.add_window('FastHotkeyExecuter.exe', 'FastHotkeyExecuter')
+        fallback = self.backend.add_window('explorer.exe', 'Desktop')
+
+        self.loader = HotkeyLoader(data_dir, os.path.join(root, 'hotkeys.snapshot'))
+        # Warm the cache from the running processes, as the application does at startup
+        preloaded = HotkeyPreloader(self.loader, 0, self.backend).preload_running_apps()
+        assert preloaded == [APP_NAME], f"preloaded {preloaded}, expected [{APP_NAME!r}]"
+        self.window_manager = SimulatedWindowManager(self.backend, ProcessManager(self.backend), popup, fallback)
+        self.ui_manager = HeadlessUIManager(self.window_manager.window, HeadlessTheme())
+        event_manager = HeadlessEventManager(None, self.ui_manager.get_results_view(), None, None, None)
+        self.worker = ExecutionWorker(HotkeyExecutor(self.profile.name, self.backend))
+        self.search_manager = SearchManager(
+            self.loader, self.ui_manager, event_manager, self.window_manager, self.worker,
+            None, lambda: None, max_results=MAX_RESULTS, debounce_ms=0
+        )
+        # Kept referenced: HotkeyManager unregisters its hotkeys when it is collected
+        self.hotkey_manager = HotkeyManager(self.backend)
+        self.hotkey_manager.register_hotkey(TOGGLE_HOTKEY, self._on_toggle)
+
+    def _on_toggle(self):
+        """What SearchWindow.show does, without the hop to the Tk thread."""
+        context = self.window_manager.resolve_context()
+        results = self.search_manager.prepare_initial_results(context) if context else None
+        if self.window_manager.show(context):
+            self.search_manager.show_initial_results(results)
+
+    def _wait_idle(self):
+        deadline = time.perf_counter() + EXECUTION_TIMEOUT
+        while self.worker.is_busy():
+            if time.perf_counter() > deadline:
+                raise AssertionError("Execution did not finish")
+            time.sleep(0.0005)
+
+    def run_scenario(self, window, query, expected):
+        """Run one scenario, check it and return {stage: seconds} (empty if nothing executes)."""
+        target = self.windows[window]
+        self.backend.focus(target)
+        self.backend.clear_events()
+        clock = self.backend.clock
+
+        start = clock()
+        self.backend.trigger(TOGGLE_HOTKEY)
+        shown = clock()
+        assert self.window_manager.get_current_window() == target, f"{window}: popup shown for another window"
+
+        self.ui_manager.get_search_var().set(query)
+        searched = clock()
+        results = self.search_manager.get_current_results()
+        names = [result.name for result in results]
+        if expected is None:
+            assert not names, f"{window} {query!r}: expected no match, got {names}"
+            self.window_manager.hide()
+            return {}
+        assert names and names[0] == expected, f"{window} {query!r}: expected {expected!r}, got {names[:3]}"
+
+        executed = clock()
+        self.search_manager.execute_selected_hotkey(0)
+        self._wait_idle()
+
+        events = [event for event in self.backend.events if event[0] >= executed]
+        key_events = [event for event in events if event[1] in KEY_EVENTS]
+        assert key_events, f"{expected}: no key events"
+        first_key = events.index(key_events[0])
+        focus = [value for _, kind, value in events[:first_key] if kind == EVENT_FOCUS]
+        assert focus and focus[-1] == target, f"{expected}: keys sent before focus returned ({events[:first_key]})"
+
+        planned = planned_events(results[0], self.profile)
+        actual = [(kind, value) for _, kind, value in key_events]
+        assert actual == [(kind, value) for _, kind, value in planned], \
+            f"{expected}: sent {actual}, planned {[(kind, value) for _, kind, value in planned]}"
+
+        first = key_events[0][0]
+        late = 0.0
+        for (timestamp, kind, value), (offset, _, _) in zip(key_events, planned):
+            actual_offset = timestamp - first
+            assert actual_offset >= offset - TOLERANCE, \
+                f"{expected}: {kind} {value} after {actual_offset * 1000:.2f} ms, planned {offset * 1000:.2f} ms"
+            late = max(late, actual_offset - offset)
+
+        last = key_events[-1][0]
+        return {
+            'show': shown - start,
+            'search': searched - shown,
+            'handoff': first - executed,
+            'inject': last - first,
+            'total': last - start,
+            'late': late,
+        }
+
+    def run(self, repeat):
+        """Run every scenario repeat times; return {stage: [seconds, ...]}."""
+        durations = {stage: [] for stage in STAGES}
+        for _ in range(repeat):
+            for scenario in SCENARIOS:
+                for stage, seconds in self.run_scenario(*scenario).items():
+                    durations[stage].append(seconds)
+        return durations
+
+
+def run_end_to_end(profiles, repeat):
+    """Run the scenarios for each timing profile; return {profile: {stage: [seconds, ...]}}.
+
+    Raises:
+        AssertionError: If a run selects, focuses or sends the wrong thing.
+    """
+    root = tempfile.mkdtemp(prefix='hotkey_e2e_')
+    try:
+        return {profile: EndToEndBench(os.path.join(root, profile), profile).run(repeat) for profile in profiles}
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--profiles', default=','.join(TIMING_PROFILES), help='Comma separated timing profiles')
+    parser.add_argument('--repeat', type=int, default=5, help='Runs of every scenario')
+    args = parser.parse_args()
+
+    profiles = [profile.strip() for profile in args.profiles.split(',') if profile.strip()]
+    try:
+        # The managers log every step; keep the output for the results
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            results = run_end_to_end(profiles, args.repeat)
+    except AssertionError as e:
+        print(f"FAIL: {e}")
+        sys.exit(1)
+
+    print(f"{'profile':10}{'stage':10}{'n':>5}{'p50 ms':>10}{'p95 ms':>10}{'max ms':>10}")
+    for profile, durations in results.items():
+        for stage in STAGES:
+            values = sorted(seconds * 1000 for seconds in durations[stage])
+            p95 = values[min(len(values) - 1, int(len(values) * 0.95))]
+            print(f"{profile:10}{stage:10}{len(values):>5}{values[(len(values) - 1) // 2]:>10.3f}"
+                  f"{p95:>10.3f}{values[-1]:>10.3f}")
+    print("OK")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,96 @@
+"""In-memory stand-ins for the Tk widgets, so the GUI managers run without a display."""
+from src.gui.event_manager import EventManager
+from src.gui.results_view import ResultsView
+from src.gui.ui_manager import UIManager
+
+
+class HeadlessListbox:
+    """The tk.Listbox methods used by ResultsView, over a plain list of rows."""
+
+    def __init__(self):
+        self.rows = []
+
+    def _index(self, index):
+        return len(self.rows) if index == 'end' else int(index)
+
+    def delete(self, first, last=None):
+        first = self._index(first)
+        last = first if last is None else self._index(last)
+        del self.rows[first:last + 1]
+
+    def insert(self, index, *items):
+        index = self._index(index)
+        self.rows[index:index] = items
+
+    def size(self):
+        return len(self.rows)
+
+    def nearest(self, y):
+        return 0
+
+    def itemconfig(self, *args, **kwargs):
+        pass
+
+    def selection_clear(self, *args):
+        pass
+
+    def selection_set(self, *args):
+        pass
+
+    def see(self, *args):
+        pass
+
+    def configure(self, **kwargs):
+        pass
+
+
+class HeadlessVar:
+    """A tk.StringVar stand-in that calls its traces synchronously."""
+
+    def __init__(self):
+        self.value = ''
+        self.callbacks = []
+
+    def get(self):
+        return self.value
+
+    def set(self, value):
+        self.value = value
+        for callback in self.callbacks:
+            callback('', '', 'w')
+
+    def trace(self, mode, callback):
+        self.callbacks.append(callback)
+
+
+class HeadlessWindow:
+    """The toplevel methods used by the managers."""
+
+    def geometry(self, geometry=None):
+        pass
+
+    def after(self, ms, callback):
+        raise RuntimeError("The headless benchmarks run without debouncing")
+
+    def after_cancel(self, after_id):
+        pass
+
+
+class HeadlessTheme:
+    settings = {'width': 800, 'height': 40}
+
+
+class HeadlessUIManager(UIManager):
+    """UIManager whose widgets are in-memory; update_results is the real code."""
+
+    def _create_ui(self):
+        self.search_var = HeadlessVar()
+        self.results_listbox = HeadlessListbox()
+        self.results_view = ResultsView(self.results_listbox)
+
+
+class HeadlessEventManager(EventManager):
+    """EventManager without widget bindings; selection handling is the real code."""
+
+    def _bind_events(self):
+        pass
@@ -0,0 +1,178 @@
+"""Measure the CPU and latency cost of watching for abort keys.
+
+The old executor installed keyboard.on_press_key('esc', ...) at startup, so
+every keystroke on the system went through a Python callback. The executor
+now starts an AbortKeyWatcher only while a sequence runs. This script
+measures, in one process:
+
+    watcher    a sequence run through HotkeyExecutor, once with the
+               AbortKeyWatcher polling and once with a watcher that never
+               starts; reports CPU per sequence and how late the key events
+               came against the timing profile
+    idle       idle CPU and CPU per injected keystroke without a hook and
+               with the previous global esc hook (Windows only)
+
+The keyboard library cannot remove its OS hook once installed, so the
+global hook is measured last. The watcher runs on the simulated backend by
+default; --backend windows injects real Shift taps (harmless in most
+windows) and polls the real key state.
+
+    python -m benchmarks.hook_overhead --runs 20
+"""
+import argparse
+import contextlib
+import os
+import sys
+import time
+
+from src.app_modules.hotkey_entry import HotkeyEntry
+from src.backends import BACKEND_SIMULATED, BACKEND_WINDOWS
+from src.backends.simulated import SimulatedBackend, EVENT_PRESS, EVENT_RELEASE, EVENT_WHEEL
+from src.hotkeys import hotkey_executor
+from src.hotkeys.abort_watcher import AbortKeyWatcher
+from src.hotkeys.hotkey_executor import HotkeyExecutor
+from src.hotkeys.timing_profiles import get_timing_profile
+from .end_to_end import planned_events
+
+KEY_EVENTS = (EVENT_PRESS, EVENT_RELEASE, EVENT_WHEEL)
+PROFILE = 'fast'
+
+# Ten Shift taps 50 ms apart: long enough for the watcher to poll a few dozen times
+SEQUENCE = HotkeyEntry.from_json({
+    'name': 'Shift taps',
+    'hotkeys': [{'hotkey': 'shift'}] + [step for _ in range(9) for step in ({'sleep': 50}, {'hotkey': 'shift'})],
+})
+
+
+class IdleAbortKeyWatcher(AbortKeyWatcher):
+    """An AbortKeyWatcher that never starts polling, as the baseline."""
+
+    def start(self):
+        pass
+
+
+def create_recording_backend(name):
+    """Create a backend that keeps (timestamp, kind, value) of every key event in .events."""
+    if name != BACKEND_WINDOWS:
+        return SimulatedBackend()
+    from src.backends.windows import WindowsBackend
+
+    class RecordingWindowsBackend(WindowsBackend):
+        def __init__(self):
+            super().__init__()
+            self.events = []
+
+        def press_key(self, key):
+            self.events.append((time.perf_counter(), EVENT_PRESS, key))
+            super().press_key(key)
+
+        def release_key(self, key):
+            self.events.append((time.perf_counter(), EVENT_RELEASE, key))
+            super().release_key(key)
+
+        def scroll_wheel(self, delta):
+            self.events.append((time.perf_counter(), EVENT_WHEEL, delta))
+            super().scroll_wheel(delta)
+
+    return RecordingWindowsBackend()
+
+
+def run_sequences(backend, runs, watcher_class):
+    """Run SEQUENCE runs times with watcher_class as the executor's abort watcher.
+
+    Returns:
+        tuple: (CPU seconds per sequence, wall seconds per sequence, [lateness in seconds of every key event])
+    """
+    executor = HotkeyExecutor(PROFILE, backend)
+    planned = planned_events(SEQUENCE, get_timing_profile(PROFILE))
+    late = []
+    cpu = wall = 0.0
+    original = hotkey_executor.AbortKeyWatcher
+    hotkey_executor.AbortKeyWatcher = watcher_class
+    try:
+        for _ in range(runs):
+            backend.events.clear()
+            start_cpu, start = time.process_time(), time.perf_counter()
+            # The executor logs every step; keep the output for the results
+            with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+                executor.execute_hotkey(SEQUENCE)
+            cpu += time.process_time() - start_cpu
+            wall += time.perf_counter() - start
+
+            key_events = [event for event in backend.events if event[1] in KEY_EVENTS]
+            if [event[1:] for event in key_events] != [event[1:] for event in planned]:
+                raise AssertionError(f"Sequence was cut short: {len(key_events)} of {len(planned)} key events")
+            first = key_events[0][0]
+            late.extend((timestamp - first) - offset for (timestamp, _, _), (offset, _, _) in zip(key_events, planned))
+    finally:
+        hotkey_executor.AbortKeyWatcher = original
+    return cpu / runs, wall / runs, late
+
+
+def measure_watcher(backend_name, runs):
+    """Return {case: (CPU ms per sequence, CPU %, late p50 ms, late max ms)}."""
+    backend = create_recording_backend(backend_name)
+    results = {}
+    for name, watcher_class in (('watcher off', IdleAbortKeyWatcher), ('watcher polling', AbortKeyWatcher)):
+        cpu, wall, late = run_sequences(backend, runs, watcher_class)
+        late = sorted(seconds * 1000 for seconds in late)
+        results[name] = (cpu * 1000, cpu / wall * 100, late[(len(late) - 1) // 2], late[-1])
+    return results
+
+
+def cpu_seconds():
+    """User plus system CPU time of the process."""
+    return time.process_time()
+
+
+def measure_idle(keyboard, keystrokes, idle_seconds):
+    """Return (idle CPU %, CPU microseconds per injected keystroke)."""
+    start_cpu = cpu_seconds()
+    time.sleep(idle_seconds)
+    idle_percent = (cpu_seconds() - start_cpu) / idle_seconds * 100
+
+    start_cpu = cpu_seconds()
+    for _ in range(keystrokes):
+        keyboard.send('shift')
+    time.sleep(0.5)  # Let the hook thread drain its queue
+    per_key = (cpu_seconds() - start_cpu) / keystrokes * 1e6
+    return idle_percent, per_key
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=20, help='Sequences per watcher case')
+    parser.add_argument('--backend', choices=(BACKEND_SIMULATED, BACKEND_WINDOWS), default=BACKEND_SIMULATED,
+                        help='Backend the watcher sequences run on')
+    parser.add_argument('--keystrokes', type=int, default=2000, help='Injected keystrokes per idle run')
+    parser.add_argument('--idle', type=float, default=10.0, help='Seconds of idle measurement per run')
+    args = parser.parse_args()
+
+    try:
+        watcher = measure_watcher(args.backend, args.runs)
+    except AssertionError as e:
+        print(f"FAIL: {e}")
+        sys.exit(1)
+    print(f"{len(SEQUENCE.actions)}-step sequence, {PROFILE} timing, {args.backend} backend, {args.runs} runs")
+    for name, (cpu_ms, cpu_percent, late_p50, late_max) in watcher.items():
+        print(f"{name:30} {cpu_ms:8.2f} ms CPU per sequence ({cpu_percent:5.2f} %)   "
+              f"late p50 {late_p50:6.3f} ms   max {late_max:6.3f} ms")
+    off, polling = watcher['watcher off'], watcher['watcher polling']
+    print(f"{'watcher cost':30} {polling[0] - off[0]:+8.2f} ms CPU per sequence   "
+          f"late p50 {polling[2] - off[2]:+6.3f} ms   max {polling[3] - off[3]:+6.3f} ms")
+
+    if sys.platform != 'win32':
+        print("Idle hook measurement skipped (Windows only)")
+        return
+    import keyboard
+
+    results = {'scoped (no hook while idle)': measure_idle(keyboard, args.keystrokes, args.idle)}
+    keyboard.on_press_key('esc', lambda e: None)
+    results['global esc hook (previous)'] = measure_idle(keyboard, args.keystrokes, args.idle)
+
+    for name, (idle_percent, per_key) in results.items():
+        print(f"{name:30} idle CPU {idle_percent:6.3f} %   {per_key:8.1f} us CPU per keystroke")
+
+
+if __name__ == '__main__':
+    main()
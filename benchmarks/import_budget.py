@@ -0,0 +1,89 @@
+"""Check that starting the GUI does not import heavy modules and stays within a time budget.
+
+Imports main.py (which forwards to a resident instance) and the resident
+application in a fresh interpreter with -X importtime and fails (exit
+code 1) when a module of the hotkey import pipeline is loaded, or when the
+total import time exceeds the budget. The slowest imports are listed to
+show where the time goes.
+
+    python -m benchmarks.import_budget --budget-ms 400
+
+tests/test_import_budget.py runs the forbidden-module check under pytest;
+this script adds the time budget and the breakdown.
+"""
+import argparse
+import os
+import re
+import subprocess
+import sys
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Only needed by the --name/--url import path
+FORBIDDEN_MODULES = (
+    'selenium', 'openai', 'bs4', 'html2text', 'pycountry', 'langdetect', 'httpx', 'pydantic',
+    'src.import_hotkeys.__main__', 'src.import_hotkeys.web.ChromeWebCrawler',
+    'src.import_hotkeys.openai.api_client', 'src.utils.StringUtils',
+)
+
+# "import time:       self [us] |  cumulative | imported package"
+_IMPORT_LINE = re.compile(r'^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)')
+
+
+def measure_imports(statement):
+    """Run statement in a fresh interpreter; return [(module, self us, cumulative us, depth), ...]."""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', statement],
+        cwd=PROJECT_ROOT, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"'{statement}' failed:\n{result.stderr.strip().splitlines()[-1]}")
+    imports = []
+    for line in result.stderr.splitlines():
+        match = _IMPORT_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            imports.append((module, int(self_us), int(cumulative_us), (len(indent) - 1) // 2))
+    return imports
+
+
+def is_forbidden(module):
+    """Return whether module is, or is inside, a forbidden module."""
+    return any(module == name or module.startswith(name + '.') for name in FORBIDDEN_MODULES)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--budget-ms', type=float, default=400.0, help='Maximum total import time')
+    parser.add_argument('--statement', default='import main, src.application', help='Statement whose imports are checked')
+    parser.add_argument('--top', type=int, default=10, help='Number of slowest imports to list')
+    args = parser.parse_args()
+
+    try:
+        imports = measure_imports(args.statement)
+    except RuntimeError as e:
+        print(f"[ERROR] {e}")
+        sys.exit(2)
+
+    total_ms = sum(cumulative for _, _, cumulative, depth in imports if depth == 0) / 1000
+    forbidden = sorted({module for module, _, _, _ in imports if is_forbidden(module)})
+
+    print(f"{args.statement!r}: {len(imports)} modules, {total_ms:.1f} ms (budget {args.budget_ms:.0f} ms)")
+    print("Slowest imports (self time):")
+    for module, self_us, cumulative_us, _ in sorted(imports, key=lambda item: item[1], reverse=True)[:args.top]:
+        print(f"  {module:50} {self_us / 1000:8.1f} ms   {cumulative_us / 1000:8.1f} ms cumulative")
+
+    failed = False
+    if forbidden:
+        print(f"FAIL: heavy modules imported: {', '.join(forbidden)}")
+        failed = True
+    if total_ms > args.budget_ms:
+        print(f"FAIL: import time {total_ms:.1f} ms exceeds the budget of {args.budget_ms:.0f} ms")
+        failed = True
+    if failed:
+        sys.exit(1)
+    print("OK")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+"""Measure the gaps between injected key events with each timing profile.
+
+Every hotkey is executed through HotkeyExecutor on the simulated backend,
+which records a timestamp per key event. The gaps between consecutive
+events of one replay are compared with the pauses the profile plans, so
+the numbers show what the profile and the replay loop add, without the
+operating system.
+
+    python -m benchmarks.injection_latency --repeat 50
+"""
+import argparse
+import contextlib
+import os
+import sys
+
+from src.app_modules.hotkey_entry import HotkeyEntry
+from src.backends.simulated import SimulatedBackend, EVENT_PRESS, EVENT_RELEASE, EVENT_WHEEL
+from src.hotkeys.hotkey_executor import HotkeyExecutor
+from src.hotkeys.timing_profiles import TIMING_PROFILES
+from .end_to_end import planned_events
+
+HOTKEYS = ['f5', 'ctrl+c', 'ctrl+shift+p', 'ctrl+shift+alt+x', 'ctrl+wheelup']
+KEY_EVENTS = (EVENT_PRESS, EVENT_RELEASE, EVENT_WHEEL)
+
+
+def percentile(values, fraction):
+    """Nearest-rank percentile of sorted values."""
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+
+def measure(profile, repeat):
+    """Replay every hotkey repeat times with a profile.
+
+    Returns:
+        tuple: ([gap in ms between consecutive key events], [gap minus planned pause in ms])
+    """
+    backend = SimulatedBackend()
+    executor = HotkeyExecutor(profile.name, backend)
+    gaps, excess = [], []
+    for hotkey in HOTKEYS:
+        entry = HotkeyEntry.from_json({'name': hotkey, 'hotkey': hotkey})
+        planned = planned_events(entry, profile)
+        for _ in range(repeat):
+            backend.clear_events()
+            # The executor logs every hotkey; keep the output for the results
+            with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+                executor.execute_hotkey(entry)
+            events = [event for event in backend.events if event[1] in KEY_EVENTS]
+            if [event[1:] for event in events] != [event[1:] for event in planned]:
+                raise AssertionError(f"{hotkey}: sent {[event[1:] for event in events]}")
+            for index in range(1, len(events)):
+                gap = events[index][0] - events[index - 1][0]
+                gaps.append(gap * 1000)
+                excess.append((gap - (planned[index][0] - planned[index - 1][0])) * 1000)
+    return sorted(gaps), sorted(excess)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=20, help='Replays per hotkey and profile')
+    args = parser.parse_args()
+
+    print(f"{'profile':10}{'series':8}{'n':>6}{'min':>9}{'p50':>9}{'p95':>9}{'p99':>9}{'max':>9}")
+    for name, profile in TIMING_PROFILES.items():
+        try:
+            series = measure(profile, args.repeat)
+        except AssertionError as e:
+            print(f"FAIL: {name}: {e}")
+            sys.exit(1)
+        for label, values in zip(('gap', 'excess'), series):
+            print(f"{name:10}{label:8}{len(values):>6}{values[0]:>9.3f}{percentile(values, 0.5):>9.3f}"
+                  f"{percentile(values, 0.95):>9.3f}{percentile(values, 0.99):>9.3f}{values[-1]:>9.3f}")
+    print("(milliseconds between consecutive key events; excess is the gap minus the planned pause)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,50 @@
+"""Compare the memory of hotkey entries kept as parsed JSON dicts and as HotkeyEntry records."""
+import argparse
+import gc
+import json
+import tracemalloc
+
+from src.app_modules.hotkey_entry import HotkeyEntry
+from .corpus import generate_items
+
+
+def measure(build, payload):
+    """Return (peak bytes, retained bytes) of building entries from a JSON payload."""
+    gc.collect()
+    tracemalloc.start()
+    entries = build(json.loads(payload))
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del entries
+    return peak, retained
+
+
+def build_dicts(items):
+    """The previous representation: prefixed copies of the parsed dicts."""
+    return [dict(item, name=f"App {item['name']}") for item in items]
+
+
+def build_records(items):
+    """The current representation: HotkeyEntry records."""
+    return [HotkeyEntry.from_json(item, 'App', 'data/hotkeys/app') for item in items]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--entries', type=int, default=100000, help='Number of generated entries')
+    args = parser.parse_args()
+
+    payload = json.dumps(generate_items(args.entries))
+    results = {
+        'dicts': measure(build_dicts, payload),
+        'records': measure(build_records, payload),
+    }
+    print(f"{args.entries} entries")
+    for name, (peak, retained) in results.items():
+        print(f"  {name:8} retained {retained / 1024 / 1024:8.2f} MiB   peak {peak / 1024 / 1024:8.2f} MiB")
+    saving = 1 - results['records'][1] / results['dicts'][1]
+    print(f"  records retain {saving:.0%} less memory than dicts")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,285 @@
+"""Headless benchmarks of the load, search and render paths.
+
+For every corpus size a synthetic app is written to a temporary hotkeys
+directory and measured through the real entry points:
+
+    load_cold        HotkeyLoader.get_hotkeys_for_app, JSON files only
+    load_snapshot    HotkeyLoader.get_hotkeys_for_app, from the snapshot
+    load_cached      HotkeyLoader.get_hotkeys_for_app, already in memory
+    search           HotkeyLoader.search_hotkeys per keystroke
+    on_search_change SearchManager.on_search_change per keystroke
+    update_results   UIManager.update_results per keystroke
+
+After the corpora, the show -> search -> execute scenarios of
+benchmarks.end_to_end run through the simulated backend for each timing
+profile and are reported as e2e_<profile>_<stage>; a scenario that sends
+the wrong keys, too early or to the wrong window fails the suite.
+
+The per-keystroke benchmarks replay the recorded typing sessions of
+typing_sessions.json. Tk widgets are replaced by in-memory rows, so no
+display is needed. Results are printed (or written with --output) as
+JSON with p50/p95/p99 latencies in milliseconds and the peak traced
+memory of each benchmark, setup included; --compare prints the change
+against a previous result file.
+
+    python -m benchmarks.suite --sizes 100,10000 --output before.json
+    python -m benchmarks.suite --sizes 100,10000 --compare before.json
+"""
+import argparse
+import contextlib
+import gc
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+from src.app_modules.hotkey_loader import HotkeyLoader
+from src.gui.search_manager import SearchManager
+from .corpus import write_app
+from .end_to_end import SCENARIOS, STAGES, run_end_to_end
+from .headless import HeadlessEventManager, HeadlessTheme, HeadlessUIManager, HeadlessWindow
+
+DEFAULT_SIZES = '100,1000,10000,100000'
+SESSIONS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'typing_sessions.json')
+APP_NAME = 'benchapp'
+MAX_RESULTS = 100
+
+
+class HeadlessWindowManager:
+    """The WindowManager methods used by SearchManager, for a fixed app."""
+
+    def __init__(self, app_name):
+        self.window = HeadlessWindow()
+        self.app_name = app_name
+
+    def get_current_app(self):
+        return self.app_name
+
+    def get_current_window_title(self):
+        return None
+
+    def hide(self):
+        pass
+
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an ascending list."""
+    if not sorted_values:
+        return None
+    rank = max(0, min(len(sorted_values) - 1, int(round(fraction * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[rank]
+
+
+def summarize(name, size, durations, peak_bytes):
+    """Build the result record of one benchmark from durations in seconds."""
+    values = sorted(duration * 1000 for duration in durations)
+    return {
+        'benchmark': name,
+        'size': size,
+        'count': len(values),
+        'p50_ms': percentile(values, 0.50),
+        'p95_ms': percentile(values, 0.95),
+        'p99_ms': percentile(values, 0.99),
+        'mean_ms': sum(values) / len(values) if values else None,
+        'max_ms': values[-1] if values else None,
+        'peak_memory_kib': round(peak_bytes / 1024, 1),
+    }
+
+
+def traced(run):
+    """Run a benchmark once under tracemalloc and return the peak traced bytes.
+
+    Timing runs happen separately, since tracing slows allocation heavy code
+    down by a large factor.
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        run()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def load_sessions(path):
+    """Return the typed texts of each recorded session."""
+    with open(path, encoding='utf-8') as f:
+        sessions = json.load(f)['sessions']
+    return [[text for _, text in session['events']] for session in sessions]
+
+
+class CorpusBench:
+    """The benchmarks of one generated corpus."""
+
+    def __init__(self, root, size, sessions, search_mode, repeat):
+        self.size = size
+        self.sessions = sessions
+        self.search_mode = search_mode
+        self.repeat = repeat
+        self.data_dir = os.path.join(root, f'hotkeys_{size}')
+        self.snapshot_file = os.path.join(root, f'hotkeys_{size}.snapshot')
+        write_app(self.data_dir, APP_NAME, size)
+
+    def new_loader(self, keep_snapshot=True):
+        if not keep_snapshot and os.path.exists(self.snapshot_file):
+            os.remove(self.snapshot_file)
+        return HotkeyLoader(self.data_dir, self.snapshot_file, self.search_mode)
+
+    def loaded(self):
+        loader = self.new_loader()
+        loader.get_hotkeys_for_app(APP_NAME)
+        return loader
+
+    def timed(self, call):
+        start = time.perf_counter()
+        call()
+        return time.perf_counter() - start
+
+    def load(self, keep_snapshot):
+        """Durations of get_hotkeys_for_app on fresh loaders."""
+        if keep_snapshot:
+            self.loaded().save_snapshot()
+        durations = []
+        for _ in range(self.repeat):
+            loader = self.new_loader(keep_snapshot)
+            durations.append(self.timed(lambda: loader.get_hotkeys_for_app(APP_NAME)))
+        return durations
+
+    def load_cached(self):
+        loader = self.loaded()
+        return [self.timed(lambda: loader.get_hotkeys_for_app(APP_NAME)) for _ in range(self.repeat * 100)]
+
+    def search(self, loader=None):
+        loader = loader or self.loaded()
+        durations = []
+        for texts in self.sessions:
+            for text in texts:
+                durations.append(self.timed(lambda: loader.search_hotkeys(APP_NAME, text, MAX_RESULTS)))
+        return durations
+
+    def _search_manager(self, loader):
+        ui_manager = HeadlessUIManager(HeadlessWindow(), HeadlessTheme())
+        event_manager = HeadlessEventManager(None, ui_manager.get_results_view(), None, None, None)
+        return SearchManager(loader, ui_manager, event_manager, HeadlessWindowManager(APP_NAME),
+                             None, None, lambda: None, max_results=MAX_RESULTS, debounce_ms=0)
+
+    def on_search_change(self, loader=None):
+        search_manager = self._search_manager(loader or self.loaded())
+        search_var = search_manager.ui_manager.get_search_var()
+        durations = []
+        for texts in self.sessions:
+            search_var.set('')
+            for text in texts:
+                # Setting the variable runs the trace, i.e. on_search_change
+                durations.append(self.timed(lambda: search_var.set(text)))
+        return durations
+
+    def update_results(self, loader=None):
+        loader = loader or self.loaded()
+        results = [loader.search_hotkeys(APP_NAME, text, MAX_RESULTS)
+                   for texts in self.sessions for text in texts]
+        ui_manager = HeadlessUIManager(HeadlessWindow(), HeadlessTheme())
+        return [self.timed(lambda: ui_manager.update_results(result)) for result in results]
+
+    def run(self):
+        benchmarks = [
+            ('load_cold', lambda: self.load(keep_snapshot=False), lambda: self.new_loader(False).get_hotkeys_for_app(APP_NAME)),
+            ('load_snapshot', lambda: self.load(keep_snapshot=True), lambda: self.new_loader().get_hotkeys_for_app(APP_NAME)),
+            ('load_cached', self.load_cached, self.load_cached),
+            ('search', self.search, self.search),
+            ('on_search_change', self.on_search_change, self.on_search_change),
+            ('update_results', self.update_results, self.update_results),
+        ]
+        results = []
+        for name, timing_run, memory_run in benchmarks:
+            durations = timing_run()
+            peak = traced(memory_run)
+            results.append(summarize(name, self.size, durations, peak))
+            print(f"[bench] {self.size:>7} {name:17} p50 {results[-1]['p50_ms']:9.3f} ms   "
+                  f"p99 {results[-1]['p99_ms']:9.3f} ms   peak {results[-1]['peak_memory_kib']:10.1f} KiB",
+                  file=sys.stderr)
+        return results
+
+
+def compare(results, baseline_file):
+    """Print the p50/p95 change of every benchmark present in a baseline result file."""
+    with open(baseline_file, encoding='utf-8') as f:
+        baseline = {(r['benchmark'], r['size']): r for r in json.load(f)['results']}
+    print(f"{'benchmark':17} {'size':>7} {'p50':>16} {'p95':>16} {'peak memory':>16}", file=sys.stderr)
+    for result in results:
+        old = baseline.get((result['benchmark'], result['size']))
+        if old is None:
+            continue
+        cells = []
+        for key in ('p50_ms', 'p95_ms', 'peak_memory_kib'):
+            if old[key]:
+                cells.append(f"{(result[key] / old[key] - 1) * 100:+15.1f}%")
+            else:
+                cells.append(f"{'n/a':>16}")
+        print(f"{result['benchmark']:17} {result['size']:>7} {' '.join(cells)}", file=sys.stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', default=DEFAULT_SIZES, help='Comma separated entries per generated app')
+    parser.add_argument('--repeat', type=int, default=5, help='Repetitions of the load benchmarks')
+    parser.add_argument('--mode', default='fuzzy', choices=['fuzzy', 'substring'], help='Search mode')
+    parser.add_argument('--sessions', default=SESSIONS_FILE, help='Recorded typing sessions (JSON)')
+    parser.add_argument('--e2e-profiles', default='safe,fast,batched',
+                        help='Timing profiles of the end-to-end scenarios (empty to skip them)')
+    parser.add_argument('--output', help='Write the JSON results to this file instead of stdout')
+    parser.add_argument('--compare', help='Previous JSON results to compare against')
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(',') if size.strip()]
+    sessions = load_sessions(args.sessions)
+    root = tempfile.mkdtemp(prefix='hotkey_bench_')
+    results = []
+    try:
+        for size in sizes:
+            # The loader logs every file it parses; keep stdout for the results
+            with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+                results.extend(CorpusBench(root, size, sessions, args.mode, args.repeat).run())
+
+        profiles = [profile.strip() for profile in args.e2e_profiles.split(',') if profile.strip()]
+        try:
+            with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+                end_to_end = run_end_to_end(profiles, args.repeat)
+        except AssertionError as e:
+            print(f"[bench] end-to-end FAIL: {e}", file=sys.stderr)
+            sys.exit(1)
+        for profile, durations in end_to_end.items():
+            for stage in STAGES:
+                results.append(summarize(f'e2e_{profile}_{stage}', len(SCENARIOS), durations[stage], 0))
+                print(f"[bench] e2e {profile:8} {stage:8} p50 {results[-1]['p50_ms']:9.3f} ms   "
+                      f"p99 {results[-1]['p99_ms']:9.3f} ms", file=sys.stderr)
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+    report = {
+        'meta': {
+            'created': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'search_mode': args.mode,
+            'repeat': args.repeat,
+            'sessions': os.path.basename(args.sessions),
+        },
+        'results': results,
+    }
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,19 +1,18 @@
 import sys
-import os
 import argparse
-from src.app_modules.config_manager import ConfigManager
-import src.import_hotkeys
-from src.app_modules.hotkey_loader import HotkeyLoader
-from src.hotkeys.hotkey_executor import HotkeyExecutor
-from src.hotkeys.hotkey_manager import HotkeyManager
-from src.process.process_manager import ProcessManager
-from src.gui.search_window import SearchWindow
+from src.process.single_instance import (
+    send_command, COMMAND_SHOW, COMMAND_TOGGLE, COMMAND_RELOAD, COMMAND_SEARCH
+)
 
 def parse_arguments():
     """Parse command line arguments."""
     parser = argparse.ArgumentParser(description='FastHotkeyExecuter')
     parser.add_argument('--name', help='Name of the application for importing hotkeys')
     parser.add_argument('--url', help='URL of the webpage containing hotkeys')
+    control = parser.add_mutually_exclusive_group()
+    control.add_argument('--toggle', action='store_true', help='Show or hide the search window of the running instance')
+    control.add_argument('--reload', action='store_true', help='Reload changed hotkey files in the running instance')
+    control.add_argument('--search', metavar='TEXT', help='Show the search window with TEXT already entered')
     return parser.parse_args()
 
 def prompt_for_missing_args(args):
@@ -24,48 +23,48 @@ def prompt_for_missing_args(args):
         args.url = input("Please enter the URL containing hotkeys: ")
     return args
 
+def get_instance_command(args):
+    """Return (command, text) for the resident instance, or (None, None) for a plain start."""
+    if args.toggle:
+        return COMMAND_TOGGLE, None
+    if args.reload:
+        return COMMAND_RELOAD, None
+    if args.search is not None:
+        return COMMAND_SEARCH, args.search
+    return None, None
+
 def main():
     try:
         # Parse arguments
         args = parse_arguments()
-        
+
         # If either name or url is provided, assume we're in import mode
         if args.name or args.url:
             args = prompt_for_missing_args(args)
             sys.argv = [sys.argv[0], '--name', args.name, '--url', args.url]
-            import_hotkeys.main()
+            # Imported only here: the import pipeline loads selenium, openai and bs4
+            from src.import_hotkeys.__main__ import main as import_hotkeys_main
+            import_hotkeys_main()
+            return
+
+        # Forward to the resident instance if one is running; this path never loads Tk
+        command, text = get_instance_command(args)
+        reply = send_command(command or COMMAND_SHOW, text)
+        if reply is not None:
+            if not reply.get('ok'):
+                print(f"[ERROR] {reply.get('error', 'Command was not accepted')}")
+                sys.exit(1)
+            if command is None:
+                print("[DEBUG] FastHotkeyExecuter is already running; showed its search window")
             return
 
-        # Initialize components for normal operation
-        config_manager = ConfigManager()
-        process_manager = ProcessManager()
-        hotkey_loader = HotkeyLoader()
-        hotkey_executor = HotkeyExecutor()
-        
-        # Create search window
-        search_window = SearchWindow(
-            config_manager,
-            process_manager,
-            hotkey_loader,
-            hotkey_executor
-        )
-        
-        # Get toggle hotkey from config
-        toggle_hotkey = config_manager.get_hotkey('toggle_search')
-        if not toggle_hotkey:
-            print("[ERROR] No toggle hotkey configured")
-            sys.exit(1)
-            
-        # Initialize hotkey manager and register toggle hotkey
-        hotkey_manager = HotkeyManager()
-        hotkey_manager.register_hotkey(toggle_hotkey, search_window.show)
-        
-        # Start main loop
-        search_window.run()
-        
+        # Become the resident instance; a toggle on a fresh start just shows the window
+        from src.application import run
+        run(COMMAND_SHOW if command == COMMAND_TOGGLE else command, text)
+
     except Exception as e:
         print(f"[ERROR] {e}")
         sys.exit(1)
-        
+
 if __name__ == '__main__':
     main()
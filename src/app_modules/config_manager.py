@@ -94,6 +94,21 @@ class ConfigManager:
         except:
             return None
             
+    def get_setting(self, section, name, default=None):
+        """Get a value from any section of the main configuration."""
+        try:
+            return self.config[section].get(name, default)
+        except:
+            return default
+
+    def get_float_setting(self, section, name, default):
+        """Get a numeric value from the main configuration, falling back to default."""
+        try:
+            return float(self.get_setting(section, name, default))
+        except (TypeError, ValueError):
+            print(f"[DEBUG] Invalid value for {section}.{name}, using {default}")
+            return default
+
     def get_window_settings(self):
         """Get all window-related settings."""
         try:
@@ -0,0 +1,78 @@
+"""Fuzzy subsequence scoring for hotkey names, modelled on fzf's v1 algorithm."""
+
+SCORE_MATCH = 16
+BONUS_BOUNDARY = 8
+BONUS_CONSECUTIVE = 4
+BONUS_FIRST_CHAR_MULTIPLIER = 2
+PENALTY_GAP_START = 3
+PENALTY_GAP_EXTENSION = 1
+
+# Substring occurrences inspected per word when looking for a word-boundary hit
+MAX_OCCURRENCES = 8
+
+
+def _score_positions(text, positions):
+    """Score a match of characters at the given positions of text."""
+    score = 0
+    chunk_bonus = 0
+    previous = -2
+    for i, position in enumerate(positions):
+        bonus = BONUS_BOUNDARY if position == 0 or not text[position - 1].isalnum() else 0
+        if position == previous + 1:
+            # Consecutive characters share the best bonus of their chunk
+            chunk_bonus = max(chunk_bonus, bonus, BONUS_CONSECUTIVE)
+            bonus = chunk_bonus
+        else:
+            if i:
+                gap = position - previous - 1
+                score -= PENALTY_GAP_START + PENALTY_GAP_EXTENSION * (gap - 1)
+            chunk_bonus = bonus
+        if i == 0:
+            bonus *= BONUS_FIRST_CHAR_MULTIPLIER
+        score += SCORE_MATCH + bonus
+        previous = position
+    return score
+
+
+def _subsequence_positions(word, text):
+    """Return positions of the shortest subsequence match ending at the first possible end, or None."""
+    # Forward pass: find where the earliest complete match ends
+    position = -1
+    for char in word:
+        position = text.find(char, position + 1)
+        if position < 0:
+            return None
+    # Backward pass: tighten the start of the match towards that end
+    positions = []
+    for char in reversed(word):
+        position = text.rfind(char, 0, position + 1)
+        positions.append(position)
+        position -= 1
+    positions.reverse()
+    return positions
+
+
+def fuzzy_score(word, text):
+    """Score how well word matches text as a subsequence.
+
+    Both arguments must already be lowercase. Returns None when word is not a
+    subsequence of text; otherwise a higher score means a better match, with
+    bonuses for word boundaries and consecutive characters and penalties for
+    gaps.
+    """
+    if not word:
+        return 0
+    positions = _subsequence_positions(word, text)
+    if positions is None:
+        return None
+    best = _score_positions(text, positions)
+
+    # A contiguous occurrence usually beats the tightest scattered match
+    length = len(word)
+    start = text.find(word)
+    occurrences = 0
+    while start >= 0 and occurrences < MAX_OCCURRENCES:
+        best = max(best, _score_positions(text, range(start, start + length)))
+        start = text.find(word, start + 1)
+        occurrences += 1
+    return best
@@ -0,0 +1,141 @@
+"""Compact records for loaded hotkey entries."""
+import os
+import sys
+from src.hotkeys.action_plan import compile_hotkey
+
+KIND_HOTKEY = 'hotkey'
+KIND_SEQUENCE = 'sequence'
+KIND_RUN = 'run'
+
+
+def _compile(hotkey, name, errors):
+    """Compile a hotkey into an ActionPlan, recording a message and returning None if it is invalid."""
+    try:
+        return compile_hotkey(hotkey)
+    except ValueError as e:
+        if errors is not None:
+            errors.append(f"{name} ({hotkey}): {e}")
+        return None
+
+
+def _malformed(name, message, errors):
+    """Record why an entry is skipped and return None."""
+    if errors is not None:
+        errors.append(f"{name}: {message}")
+    return None
+
+
+def _is_number(value):
+    # bool is an int subclass, but true is no duration
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+class HotkeyAction:
+    """One step of a hotkey sequence: either a hotkey or a sleep in milliseconds."""
+
+    __slots__ = ('hotkey', 'sleep', 'plan')
+
+    def __init__(self, hotkey=None, sleep=None, plan=None):
+        self.hotkey = hotkey
+        self.sleep = sleep
+        self.plan = plan  # Compiled ActionPlan of hotkey, None if invalid
+
+    def __repr__(self):
+        if self.sleep is not None:
+            return f"HotkeyAction(sleep={self.sleep})"
+        return f"HotkeyAction(hotkey={self.hotkey!r})"
+
+
+class HotkeyEntry:
+    """A hotkey list entry: a single hotkey, a sequence of actions or a file to run.
+
+    Uses __slots__ instead of the parsed JSON dict so that thousands of
+    resident entries stay small; repeated hotkey strings are interned.
+    Hotkeys are compiled into ActionPlans when the entry is created; an
+    entry whose hotkey is invalid is still listed, with plan set to None.
+    """
+
+    __slots__ = ('name', 'kind', 'hotkey', 'actions', 'run', 'label', 'plan', 'timing')
+
+    def __init__(self, name, kind, hotkey=None, actions=(), run=None, plan=None, timing=None):
+        self.name = name
+        self.kind = kind
+        self.hotkey = hotkey
+        self.actions = actions
+        self.run = run
+        self.plan = plan
+        self.timing = timing  # Timing profile name from the file metadata, None for the default
+        self.label = self._build_label()
+
+    def _build_label(self):
+        """Build the text shown in the results list."""
+        if self.kind == KIND_SEQUENCE:
+            return f"{self.name} (sequence)"
+        if self.kind == KIND_RUN:
+            return f"{self.name} (run: {os.path.basename(self.run)})"
+        return f"{self.name} ({self.hotkey})"
+
+    def describe(self):
+        """Short description of what the entry does, for logging."""
+        if self.kind == KIND_RUN:
+            return f"run: {self.run}"
+        if self.kind == KIND_HOTKEY:
+            return self.hotkey
+        return 'sequence'
+
+    def __repr__(self):
+        return f"HotkeyEntry({self.name!r}, {self.describe()!r})"
+
+    @classmethod
+    def from_json(cls, data, prefix='', app_dir='', errors=None, timing=None):
+        """Create an entry from one parsed JSON item, or return None if it is not a hotkey.
+
+        Entries with values of the wrong type (e.g. a numeric hotkey or a
+        sequence step that is not an object) are skipped and reported
+        through errors, so the rest of the file still loads.
+
+        Args:
+            data: The JSON object of the entry.
+            prefix: Name prefix from the file metadata.
+            app_dir: The app's hotkey directory, used to resolve run paths.
+            errors: Optional list that receives a message per invalid hotkey.
+            timing: Timing profile name from the file metadata.
+        """
+        if not isinstance(data, dict) or 'name' not in data:
+            return None
+        if not isinstance(data['name'], str):
+            return _malformed(repr(data['name']), "name is not a string", errors)
+        name = f"{prefix} {data['name']}" if prefix else data['name']
+
+        # New format with array of actions
+        if 'hotkeys' in data:
+            if not isinstance(data['hotkeys'], list):
+                return _malformed(name, "hotkeys is not a list", errors)
+            actions = []
+            for action in data['hotkeys']:
+                if not isinstance(action, dict):
+                    return _malformed(name, f"sequence step {action!r} is not an object", errors)
+                if 'sleep' in action:
+                    if not _is_number(action['sleep']) or action['sleep'] < 0:
+                        return _malformed(name, f"sleep {action['sleep']!r} is not a number of milliseconds", errors)
+                    actions.append(HotkeyAction(sleep=action['sleep']))
+                elif 'hotkey' in action:
+                    if not isinstance(action['hotkey'], str):
+                        return _malformed(name, f"hotkey {action['hotkey']!r} is not a string", errors)
+                    hotkey = sys.intern(action['hotkey'].lower())
+                    actions.append(HotkeyAction(hotkey=hotkey, plan=_compile(hotkey, name, errors)))
+            return cls(name, KIND_SEQUENCE, actions=tuple(actions), timing=timing)
+
+        # Run file entries, resolved relative to the app's hotkey directory
+        if 'run' in data:
+            if not isinstance(data['run'], str) or not data['run']:
+                return _malformed(name, f"run {data['run']!r} is not a path", errors)
+            return cls(name, KIND_RUN, run=os.path.abspath(os.path.join(app_dir, data['run'])))
+
+        # Old format with single hotkey
+        if 'hotkey' in data:
+            if not isinstance(data['hotkey'], str):
+                return _malformed(name, f"hotkey {data['hotkey']!r} is not a string", errors)
+            hotkey = sys.intern(data['hotkey'])
+            return cls(name, KIND_HOTKEY, hotkey=hotkey, plan=_compile(hotkey, name, errors), timing=timing)
+        return None
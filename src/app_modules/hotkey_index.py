@@ -0,0 +1,180 @@
+"""Inverted token index over the hotkey names of one application."""
+import heapq
+from bisect import bisect_left
+from .fuzzy_matcher import fuzzy_score
+
+# Sorts after every character, used as the upper bound of a prefix range
+_MAX_CHAR = chr(0x10FFFF)
+
+
+class HotkeyIndex:
+    """Answers "every search word is a substring of the name" queries without a full scan.
+
+    Names are split into whitespace-separated tokens. Since search words never
+    contain whitespace, a word is a substring of a name exactly when it is a
+    substring of one of its tokens, i.e. a prefix of one of the token's
+    suffixes. All token suffixes are kept sorted, so the tokens containing a
+    word are found with two binary searches; their posting lists give the
+    matching entries. Ranked fuzzy queries scan the lowercase names instead,
+    skipping entries that lack any of the query characters.
+    """
+
+    MAX_CACHED_WORDS = 1024
+    MAX_QUERY_HISTORY = 32
+
+    def __init__(self, hotkeys):
+        """Build the index for a list of HotkeyEntry records."""
+        self.hotkeys = hotkeys
+        self.names = [hotkey.name.lower() for hotkey in hotkeys]
+        self.char_sets = [frozenset(name) for name in self.names]  # cheap fuzzy prefilter
+        self.postings = {}  # token -> list of entry positions
+        for position, name in enumerate(self.names):
+            for token in set(name.split()):
+                self.postings.setdefault(token, []).append(position)
+
+        suffixes = sorted(
+            (token[start:], token)
+            for token in self.postings
+            for start in range(len(token))
+        )
+        self._suffixes = [suffix for suffix, _ in suffixes]
+        self._suffix_tokens = [token for _, token in suffixes]
+        self._word_cache = {}  # word -> frozenset of entry positions
+        self._query_history = {}  # mode -> [(query text, matching positions), ...]
+        self._name_positions = None  # original name -> positions, built on first use of boosts
+
+    def _positions_for_word(self, word):
+        """Return the positions of all entries whose name contains word."""
+        positions = self._word_cache.get(word)
+        if positions is not None:
+            return positions
+
+        start = bisect_left(self._suffixes, word)
+        end = bisect_left(self._suffixes, word + _MAX_CHAR, start)
+        matched = set()
+        for token in set(self._suffix_tokens[start:end]):
+            matched.update(self.postings[token])
+        positions = frozenset(matched)
+
+        if len(self._word_cache) >= self.MAX_CACHED_WORDS:
+            self._word_cache.clear()
+        self._word_cache[word] = positions
+        return positions
+
+    def _narrow(self, mode, search_text, match):
+        """Return the matches of search_text, reusing earlier result sets.
+
+        Appending characters to a query can only shrink its matches, so when
+        the previous query is a prefix of search_text only its matches are
+        re-checked. The queries typed so far are kept as a stack: backspacing
+        pops back to the longest cached prefix, and an exact hit is returned
+        without any matching at all.
+
+        Args:
+            mode: Name of the matching semantics; each keeps its own history.
+            search_text: Lowercase query text as typed.
+            match: Callable(previous_matches) returning the new matches, called
+                with None to match against every entry.
+        """
+        history = self._query_history.setdefault(mode, [])
+        while history and not search_text.startswith(history[-1][0]):
+            history.pop()
+        if history and history[-1][0] == search_text:
+            return history[-1][1]
+
+        positions = match(history[-1][1] if history else None)
+        if len(history) >= self.MAX_QUERY_HISTORY:
+            del history[0]
+        history.append((search_text, positions))
+        return positions
+
+    def search(self, search_text):
+        """Return the entries whose name contains every word of search_text, in original order."""
+        search_words = search_text.lower().split()
+        if not search_words:
+            return list(self.hotkeys)
+
+        def match(candidates):
+            if candidates is not None:
+                names = self.names
+                return [p for p in candidates if all(word in names[p] for word in search_words)]
+            # Intersect starting with the rarest word to keep the working set small
+            candidate_sets = sorted((self._positions_for_word(word) for word in search_words), key=len)
+            positions = set(candidate_sets[0])
+            for word_positions in candidate_sets[1:]:
+                positions &= word_positions
+            return sorted(positions)
+
+        positions = self._narrow('substring', search_text.lower(), match)
+        return [self.hotkeys[position] for position in positions]
+
+    def _boost_positions(self, boosts):
+        """Map {entry name: bonus} to {position: bonus}."""
+        if self._name_positions is None:
+            self._name_positions = {}
+            for position, hotkey in enumerate(self.hotkeys):
+                self._name_positions.setdefault(hotkey.name, []).append(position)
+        by_position = {}
+        for name, bonus in boosts.items():
+            for position in self._name_positions.get(name, ()):
+                by_position[position] = bonus
+        return by_position
+
+    def fuzzy_search(self, search_text, limit=None, boosts=None):
+        """Return the entries fuzzy-matching every word of search_text, best first.
+
+        Every word must be a subsequence of the name; the entry score is the sum
+        of the word scores plus the entry's bonus in boosts (e.g. its usage).
+        Only the best limit entries are selected with a heap and sorted, so a
+        short visible list never pays for a full sort. Ties keep shorter names
+        first, then file order. Without search words, boosted entries come
+        first, by bonus, followed by the rest in file order.
+        """
+        boosted = self._boost_positions(boosts) if boosts else {}
+        search_words = search_text.lower().split()
+        if not search_words:
+            if not boosted:
+                hotkeys = self.hotkeys if limit is None else self.hotkeys[:limit]
+                return list(hotkeys)
+            first = sorted(boosted, key=lambda position: (-boosted[position], position))
+            ordered = [self.hotkeys[position] for position in first]
+            for position, hotkey in enumerate(self.hotkeys):
+                if limit is not None and len(ordered) >= limit:
+                    break
+                if position not in boosted:
+                    ordered.append(hotkey)
+            return ordered[:limit]
+
+        required_chars = frozenset(''.join(search_words))
+
+        def match(previous):
+            # Matches are (score, -name length, -position) tuples
+            if previous is None:
+                candidates = range(len(self.names))
+            else:
+                candidates = [-item[2] for item in previous]
+            scored = []
+            for position in candidates:
+                if not required_chars <= self.char_sets[position]:
+                    continue
+                name = self.names[position]
+                total = 0
+                for word in search_words:
+                    score = fuzzy_score(word, name)
+                    if score is None:
+                        break
+                    total += score
+                else:
+                    scored.append((total, -len(name), -position))
+            return scored
+
+        scored = self._narrow('fuzzy', search_text.lower(), match)
+        if boosted:
+            # Bonuses are applied after narrowing, so cached match sets stay valid
+            scored = [(total + boosted.get(-position, 0), length, position)
+                      for total, length, position in scored]
+        if limit is None or limit >= len(scored):
+            best = sorted(scored, reverse=True)
+        else:
+            best = heapq.nlargest(limit, scored)
+        return [self.hotkeys[-position] for _, _, position in best]
@@ -1,115 +1,367 @@
 import os
+import re
 import json
-from pathlib import Path
+import fnmatch
+import glob
+import threading
+from .hotkey_snapshot import HotkeySnapshot, scan_app_dir
+from .hotkey_index import HotkeyIndex
+from .hotkey_entry import HotkeyEntry, KIND_HOTKEY
+
+
+def compile_title_pattern(pattern):
+    """Compile a metadata window_title pattern, or return None if it is empty.
+
+    Patterns match case-insensitively anywhere in the window title; * and ?
+    act as wildcards.
+    """
+    if not isinstance(pattern, str) or not pattern.strip():
+        return None
+    pattern = pattern.strip()
+    if '*' not in pattern and '?' not in pattern:
+        # A plain title is matched literally, brackets included
+        pattern = glob.escape(pattern)
+    # Surrounding wildcards let the pattern match anywhere; use match(), the regex spans the whole title
+    return re.compile(fnmatch.translate(f'*{pattern}*'), re.IGNORECASE)
+
 
 class HotkeyLoader:
-    def __init__(self, data_dir='data/hotkeys'):
-        """Initialize the hotkey loader."""
+    def __init__(self, data_dir='data/hotkeys', snapshot_file=None, search_mode='fuzzy'):
+        """Initialize the hotkey loader.
+
+        Args:
+            data_dir: Directory containing one hotkey directory per application.
+            snapshot_file: Path of the compiled snapshot (defaults to data/hotkeys.snapshot).
+            search_mode: 'fuzzy' for ranked subsequence matching or 'substring'
+                for plain matching in file order.
+        """
         self.data_dir = data_dir
+        self.search_mode = search_mode
         self.hotkey_cache = {}  # Cache loaded hotkeys
-        
-    def get_hotkeys_for_app(self, app_name):
-        """Get all hotkeys for a specific application."""
+        self.index_cache = {}  # app name -> HotkeyIndex over its cached hotkeys
+        self.app_dirs = {}  # app name -> resolved directory of cached apps
+        self.file_cache = {}  # app directory -> {filename: (signature, data)}
+        self.title_patterns = {}  # app directory -> ((filename, compiled window_title or None), ...)
+        self.window_sets = {}  # (app name, matching filenames) -> (hotkeys, HotkeyIndex)
+        self.known_dirs = self._list_app_dirs()
+        self._lock = threading.RLock()
+        if snapshot_file is None:
+            # Keep the snapshot next to the hotkeys tree, e.g. data/hotkeys.snapshot
+            snapshot_file = os.path.join(os.path.dirname(os.path.abspath(data_dir)), 'hotkeys.snapshot')
+        self.snapshot = HotkeySnapshot(snapshot_file)
+
+    def get_hotkeys_for_app(self, app_name, window_title=None):
+        """Get the hotkeys of an application.
+
+        Args:
+            app_name: Process name of the application.
+            window_title: Title of the foreground window. Files whose metadata
+                sets a window_title pattern only apply when it matches; None
+                applies all files.
+        """
+        return self._get_hotkey_set(app_name, window_title)[0]
+
+    def _get_hotkey_set(self, app_name, window_title):
+        """Return (hotkeys, HotkeyIndex) of the files of an app that apply to a window."""
         try:
-            # Return cached hotkeys if available
-            if app_name in self.hotkey_cache:
-                return self.hotkey_cache[app_name]
-                
-            # Construct app directory path
-            app_dir = os.path.join(self.data_dir, app_name)
-            
-            # Check if directory exists
-            if not os.path.exists(app_dir):
-                # Try case-insensitive match
-                app_dir = None
-                if os.path.exists(self.data_dir):
-                    for entry in os.listdir(self.data_dir):
-                        if entry.lower() == app_name.lower() and os.path.isdir(os.path.join(self.data_dir, entry)):
-                            app_dir = os.path.join(self.data_dir, entry)
-                            break
-                if not app_dir:
-                    print(f"[DEBUG] No hotkey directory found for {app_name}")
-                    self.hotkey_cache[app_name] = []  # Cache empty result
-                    return []
-            
-            # Load and combine all JSON files in the app directory, ignoring duplicates
-            all_hotkeys = []
-            seen_hotkeys = set()  # Track seen hotkey combinations
-            json_files = Path(app_dir).glob('*.json')
-            
-            for json_file in json_files:
-                try:
-                    with open(json_file, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                        # Handle both old format (array) and new format (object with metadata)
-                        if isinstance(data, dict) and 'hotkeys' in data:
-                            hotkeys = data['hotkeys']
-                            # Get prefix from metadata if it exists
-                            prefix = data.get('metadata', {}).get('prefix', '')
-                        else:
-                            hotkeys = data
-                            prefix = ''
-                        
-                        if isinstance(hotkeys, list):
-                            for hotkey in hotkeys:
-                                # Handle new format with array of actions
-                                if 'hotkeys' in hotkey:
-                                    if prefix:
-                                        hotkey['name'] = f"{prefix} {hotkey['name']}"
-                                    all_hotkeys.append(hotkey)
-                                # Handle run file entries
-                                elif 'run' in hotkey:
-                                    if prefix:
-                                        hotkey['name'] = f"{prefix} {hotkey['name']}"
-                                    # Resolve absolute path relative to the app's hotkey directory
-                                    hotkey['run'] = os.path.abspath(os.path.join(app_dir, hotkey['run']))
-                                    all_hotkeys.append(hotkey)
-                                # Handle old format with single hotkey
-                                elif 'hotkey' in hotkey and hotkey['hotkey'] not in seen_hotkeys:
-                                    seen_hotkeys.add(hotkey['hotkey'])
-                                    if prefix:
-                                        hotkey['name'] = f"{prefix} {hotkey['name']}"
-                                    all_hotkeys.append(hotkey)
-                        else:
-                            print(f"[DEBUG] Invalid hotkey format in {json_file}")
-                except json.JSONDecodeError as e:
-                    print(f"[DEBUG] Error parsing hotkey file {json_file}: {e}")
-                    continue
-            
-            self.hotkey_cache[app_name] = all_hotkeys  # Cache results
-            return all_hotkeys
-                
+            with self._lock:
+                hotkeys = self._load_app(app_name)
+                app_dir = self.app_dirs.get(app_name)
+                filenames = self._files_for_window(app_dir, window_title)
+                if filenames is None:
+                    return hotkeys, self.index_cache.get(app_name)
+
+                # Tabs of the same app usually select the same files, so merged
+                # sets are kept per file combination rather than per title
+                key = (app_name, filenames)
+                window_set = self.window_sets.get(key)
+                if window_set is None:
+                    files = self.file_cache[app_dir]
+                    subset = self._merge_hotkeys(app_dir, [(name, files[name][1]) for name in filenames], False)
+                    window_set = self.window_sets[key] = (subset, HotkeyIndex(subset))
+                return window_set
+
         except Exception as e:
             print(f"[DEBUG] Error loading hotkeys: {e}")
+            return [], None
+
+    def _load_app(self, app_name):
+        """Return all hotkeys of an app, loading them on first use. The caller holds the lock."""
+        # Return cached hotkeys if available
+        if app_name in self.hotkey_cache:
+            return self.hotkey_cache[app_name]
+
+        app_dir = self._find_app_dir(app_name)
+        if not app_dir:
+            print(f"[DEBUG] No hotkey directory found for {app_name}")
+            self.hotkey_cache[app_name] = []  # Cache empty result until the directory appears
             return []
-            
+
+        all_hotkeys = self._merge_hotkeys(app_dir, self._load_app_files(app_dir))
+        self.app_dirs[app_name] = app_dir
+        self._cache_app(app_name, all_hotkeys)
+        return all_hotkeys
+
+    def _files_for_window(self, app_dir, window_title):
+        """Return the filenames of an app that apply to a window title.
+
+        Returns:
+            tuple: Matching filenames, or None if all files apply. Files
+            selected by their pattern come first, so that their hotkeys win
+            over duplicates in the general files.
+        """
+        if app_dir is None or window_title is None:
+            return None
+        patterns = self.title_patterns.get(app_dir)
+        if not patterns:
+            return None
+        specific = tuple(filename for filename, pattern in patterns
+                         if pattern is not None and pattern.match(window_title))
+        general = tuple(filename for filename, pattern in patterns if pattern is None)
+        return specific + general
+
+    def _cache_app(self, app_name, hotkeys):
+        """Cache the merged hotkeys of an app together with their search index."""
+        self.hotkey_cache[app_name] = hotkeys
+        self.index_cache[app_name] = HotkeyIndex(hotkeys)
+        self._drop_window_sets(app_name)
+
+    def _drop_window_sets(self, app_name):
+        """Forget the per-window merged sets of an app."""
+        for key in [key for key in self.window_sets if key[0] == app_name]:
+            del self.window_sets[key]
+
+    def _cache_files(self, app_dir, signatures, files):
+        """Remember the parsed files of an app and compile their window title patterns."""
+        self.file_cache[app_dir] = {filename: (signatures[filename], data) for filename, data in files}
+        patterns = []
+        for filename, data in files:
+            if data is None:
+                continue  # Unreadable file, see _parse_files()
+            metadata = data.get('metadata') if isinstance(data, dict) else None
+            title = metadata.get('window_title') if isinstance(metadata, dict) else None
+            patterns.append((filename, compile_title_pattern(title)))
+        # Without any pattern every window gets all files, which needs no lookup
+        has_patterns = any(pattern is not None for _, pattern in patterns)
+        self.title_patterns[app_dir] = tuple(patterns) if has_patterns else ()
+
+    def is_cached(self, app_name):
+        """Return whether the hotkeys of an app are already loaded."""
+        with self._lock:
+            return app_name in self.hotkey_cache
+
+    def _find_app_dir(self, app_name):
+        """Return the hotkey directory for an app, matching case-insensitively."""
+        app_dir = os.path.join(self.data_dir, app_name)
+        if os.path.isdir(app_dir):
+            return app_dir
+        if os.path.exists(self.data_dir):
+            for entry in os.listdir(self.data_dir):
+                if entry.lower() == app_name.lower() and os.path.isdir(os.path.join(self.data_dir, entry)):
+                    return os.path.join(self.data_dir, entry)
+        return None
+
+    def _list_app_dirs(self):
+        """Return the names of all app directories in the data directory."""
+        try:
+            with os.scandir(self.data_dir) as entries:
+                return {entry.name for entry in entries if entry.is_dir()}
+        except OSError:
+            return set()
+
+    def _load_app_files(self, app_dir):
+        """Return [(filename, data), ...] for an app, from the snapshot when it is fresh."""
+        dir_name = os.path.basename(app_dir)
+        signatures = scan_app_dir(app_dir)
+        files = self.snapshot.load_app(dir_name, signatures)
+        if files is None:
+            # Snapshot is stale or missing this app - fall back to the JSON files
+            files = self._parse_files(app_dir, signatures, {})
+        self._cache_files(app_dir, signatures, files)
+        return files
+
+    def _parse_files(self, app_dir, signatures, previous):
+        """Parse the JSON files of an app, reusing entries of previous whose signature is unchanged.
+
+        A file that cannot be read is kept as (filename, None), so its
+        signature is cached and it is only parsed (and reported) again
+        once it changes on disk.
+
+        Args:
+            app_dir: The app's hotkey directory.
+            signatures: Current {filename: signature} of the directory.
+            previous: Earlier {filename: (signature, data)} for the directory.
+        """
+        files = []
+        complete = True
+        for filename in sorted(signatures, key=str.lower):
+            cached = previous.get(filename)
+            if cached and cached[0] == signatures[filename]:
+                files.append((filename, cached[1]))
+                continue
+            json_file = os.path.join(app_dir, filename)
+            try:
+                with open(json_file, 'r', encoding='utf-8') as f:
+                    files.append((filename, json.load(f)))
+                if previous:
+                    print(f"[DEBUG] Reloaded hotkey file {json_file}")
+            except (OSError, json.JSONDecodeError) as e:
+                print(f"[DEBUG] Error parsing hotkey file {json_file}: {e}")
+                files.append((filename, None))
+                complete = False
+
+        # Only snapshot complete reads so broken files keep being reported
+        if complete:
+            self.snapshot.update_app(os.path.basename(app_dir), signatures, files)
+        return files
+
+    def refresh(self):
+        """Re-read only the hotkey files that changed on disk since they were loaded.
+
+        Apps whose files changed are re-merged, apps whose directory vanished are
+        dropped, and cached "no hotkeys" results are expired when a matching
+        directory appears.
+
+        Returns:
+            list: Names of the apps whose cached hotkeys changed.
+        """
+        changed_apps = []
+        with self._lock:
+            current_dirs = self._list_app_dirs()
+            new_dirs = {name.lower() for name in current_dirs - self.known_dirs}
+            self.known_dirs = current_dirs
+            if new_dirs:
+                for app_name in list(self.hotkey_cache):
+                    if app_name not in self.app_dirs and app_name.lower() in new_dirs:
+                        del self.hotkey_cache[app_name]
+                        self.index_cache.pop(app_name, None)
+                        changed_apps.append(app_name)
+
+            for app_name, app_dir in list(self.app_dirs.items()):
+                previous = self.file_cache.get(app_dir, {})
+                if not os.path.isdir(app_dir):
+                    print(f"[DEBUG] Hotkey directory removed: {app_dir}")
+                    del self.app_dirs[app_name]
+                    self.hotkey_cache.pop(app_name, None)
+                    self.index_cache.pop(app_name, None)
+                    self.file_cache.pop(app_dir, None)
+                    self.title_patterns.pop(app_dir, None)
+                    self._drop_window_sets(app_name)
+                    changed_apps.append(app_name)
+                    continue
+
+                signatures = scan_app_dir(app_dir)
+                if {filename: cached[0] for filename, cached in previous.items()} == signatures:
+                    continue
+
+                files = self._parse_files(app_dir, signatures, previous)
+                self._cache_files(app_dir, signatures, files)
+                self._cache_app(app_name, self._merge_hotkeys(app_dir, files))
+                changed_apps.append(app_name)
+
+        if changed_apps:
+            print(f"[DEBUG] Hotkeys refreshed for: {', '.join(changed_apps)}")
+        return changed_apps
+
+    def _merge_hotkeys(self, app_dir, files, report=True):
+        """Combine the parsed files of an app into one list of HotkeyEntry records, ignoring duplicates.
+
+        Args:
+            app_dir: The app's hotkey directory.
+            files: [(filename, data), ...] in load order.
+            report: Print invalid hotkeys; off when re-merging files already reported.
+        """
+        all_hotkeys = []
+        seen_hotkeys = set()  # Track seen hotkey combinations
+        for filename, data in files:
+            if data is None:
+                continue  # Unreadable file, reported when it was parsed
+            # Handle both old format (array) and new format (object with metadata)
+            if isinstance(data, dict) and 'hotkeys' in data:
+                hotkeys = data['hotkeys']
+                # Get prefix and timing profile from metadata if they exist
+                metadata = data.get('metadata') or {}
+                prefix = metadata.get('prefix', '')
+                timing = metadata.get('timing')
+            else:
+                hotkeys = data
+                prefix = ''
+                timing = None
+
+            if isinstance(hotkeys, list):
+                errors = []
+                for hotkey in hotkeys:
+                    entry = HotkeyEntry.from_json(hotkey, prefix, app_dir, errors, timing)
+                    if entry is None:
+                        continue
+                    # Ignore duplicate single hotkey combinations
+                    if entry.kind == KIND_HOTKEY:
+                        if entry.hotkey in seen_hotkeys:
+                            continue
+                        seen_hotkeys.add(entry.hotkey)
+                    all_hotkeys.append(entry)
+                if errors and report:
+                    # Reported once at load time; malformed entries are skipped, entries with
+                    # an invalid hotkey are listed but cannot be executed
+                    print(f"[DEBUG] {len(errors)} invalid hotkeys in {os.path.join(app_dir, filename)}: {'; '.join(errors)}")
+            elif report:
+                print(f"[DEBUG] Invalid hotkey format in {os.path.join(app_dir, filename)}")
+        return all_hotkeys
+
+    def save_snapshot(self):
+        """Write the apps parsed since the last call to the snapshot file.
+
+        Must not be called with the loader lock held; loads and searches
+        continue while the file is written.
+
+        Returns:
+            bool: True if the snapshot file was rewritten.
+        """
+        return self.snapshot.flush(self.data_dir)
+
     def clear_cache(self):
         """Clear the hotkey cache to force re-read from disk."""
-        self.hotkey_cache = {}
+        with self._lock:
+            self.hotkey_cache = {}
+            self.index_cache = {}
+            self.app_dirs = {}
+            self.file_cache = {}
+            self.title_patterns = {}
+            self.window_sets = {}
+            self.known_dirs = self._list_app_dirs()
+            self.snapshot.clear()
+
+    def search_hotkeys(self, app_name, search_text, limit=None, window_title=None, boosts=None):
+        """Search hotkeys for an application by name.
 
-    def search_hotkeys(self, app_name, search_text):
-        """Search hotkeys for an application by name."""
+        Args:
+            app_name: Application to search.
+            search_text: Space separated search words.
+            limit: Maximum number of ranked fuzzy results (None for all). Substring
+                mode always returns every match in file order.
+            window_title: Title of the foreground window, see get_hotkeys_for_app().
+            boosts: Optional {entry name: ranking bonus} added to fuzzy match scores.
+        """
         try:
-            # Get all hotkeys for the app
-            hotkeys = self.get_hotkeys_for_app(app_name)
-            if not hotkeys:
+            # Get the hotkeys that apply to the window
+            hotkeys, index = self._get_hotkey_set(app_name, window_title)
+            if not hotkeys or index is None:
                 return []
-                
+
             # Convert search text to lowercase for case-insensitive search
             search_text = search_text.lower()
-            
-            # Split search text into words and filter hotkeys
+
+            # Split search text into words; all of them must match the hotkey name.
+            # The index narrows the previous result set when the query was only extended.
             search_words = search_text.split()
-            results = []
-            for hotkey in hotkeys:
-                hotkey_name = hotkey['name'].lower()
-                # Check if all search words appear in the hotkey name
-                if all(word.lower() in hotkey_name for word in search_words):
-                    results.append(hotkey)
-                    
+            if self.search_mode == 'fuzzy':
+                results = index.fuzzy_search(search_text, limit, boosts)
+            else:
+                results = index.search(search_text)
+
             print(f"[DEBUG] Found {len(results)} matching hotkeys for search terms: {search_words}")
             return results
-            
+
         except Exception as e:
             print(f"[DEBUG] Error searching hotkeys: {e}")
             return []
@@ -0,0 +1,76 @@
+"""Background preloading of hotkeys for running applications."""
+import os
+import threading
+from src.backends import get_backend
+
+
+class HotkeyPreloader:
+    """Parses the hotkeys of running applications ahead of the first popup.
+
+    At startup and then every interval seconds the running processes are
+    matched against the app directories in data/hotkeys, and every app that
+    is not cached yet is loaded on a worker thread. After each scan the apps
+    parsed since the last one (by the scan, the popup or a reload) are
+    written to the snapshot in one go.
+    """
+
+    def __init__(self, hotkey_loader, interval=30.0, backend=None):
+        """Initialize the preloader.
+
+        Args:
+            hotkey_loader: The HotkeyLoader to warm.
+            interval: Seconds between two process scans (0 scans only once).
+            backend: PlatformBackend listing the running processes (default: get_backend()).
+        """
+        self.hotkey_loader = hotkey_loader
+        self.interval = interval
+        self.backend = backend or get_backend()
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """Start preloading on a daemon thread."""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name='HotkeyPreloader', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop preloading."""
+        self._stop_event.set()
+        self._thread = None
+
+    def _run(self):
+        """Scan loop."""
+        while True:
+            try:
+                self.preload_running_apps()
+            except Exception as e:
+                print(f"[DEBUG] Error preloading hotkeys: {e}")
+            self.hotkey_loader.save_snapshot()
+            if self.interval <= 0 or self._stop_event.wait(self.interval):
+                return
+
+    def get_running_app_names(self):
+        """Return the process names of running applications, as used for hotkey lookup."""
+        # Same normalization as ProcessManager.get_active_window_context
+        return {os.path.splitext(name.lower())[0] for name in self.backend.list_process_names()}
+
+    def preload_running_apps(self):
+        """Load the hotkeys of every running application that has a hotkey directory.
+
+        Returns:
+            list: Names of the apps that were loaded by this call.
+        """
+        known_dirs = {name.lower() for name in self.hotkey_loader.known_dirs}
+        loaded = []
+        for app_name in sorted(self.get_running_app_names() & known_dirs):
+            if self._stop_event.is_set():
+                break
+            if self.hotkey_loader.is_cached(app_name):
+                continue
+            self.hotkey_loader.get_hotkeys_for_app(app_name)
+            loaded.append(app_name)
+        if loaded:
+            print(f"[DEBUG] Preloaded hotkeys for: {', '.join(loaded)}")
+        return loaded
@@ -0,0 +1,188 @@
+"""Compiled on-disk snapshot of the data/hotkeys tree."""
+import marshal
+import os
+import struct
+import sys
+import threading
+
+SNAPSHOT_MAGIC = b'FHKSNAP1'
+SNAPSHOT_VERSION = 1
+_HEADER = struct.Struct('<8sI')
+
+
+def scan_app_dir(app_dir):
+    """Return {filename: (mtime_ns, size)} for every JSON file in an app directory."""
+    signatures = {}
+    try:
+        with os.scandir(app_dir) as entries:
+            for entry in entries:
+                if entry.name.lower().endswith('.json') and entry.is_file():
+                    stat = entry.stat()
+                    signatures[entry.name] = (stat.st_mtime_ns, stat.st_size)
+    except OSError as e:
+        print(f"[DEBUG] Error scanning hotkey directory {app_dir}: {e}")
+    return signatures
+
+
+class HotkeySnapshot:
+    """Packed file holding the parsed JSON data of every app directory.
+
+    Parsed apps are collected in memory by update_app() and written
+    together by flush(), so loading many apps rewrites the file once.
+
+    Layout: magic, index length, marshalled index, then one marshalled blob
+    per app. The index maps an app directory name to the blob offset/length
+    and the (mtime_ns, size) signature of each JSON file it was built from,
+    so an app is only served from the snapshot while its files are unchanged.
+    """
+
+    def __init__(self, snapshot_file):
+        """Initialize the snapshot for the given file path."""
+        self.snapshot_file = snapshot_file
+        self._index = None  # Loaded lazily on first lookup
+        self._blob_start = 0
+        self._lock = threading.Lock()
+        # Serializes flush() without holding _lock during file I/O
+        self._flush_lock = threading.Lock()
+        self._pending = {}  # {dir_name: (signatures, blob)} not written yet
+
+    def _tag(self):
+        """Interpreter tag; marshal data is only valid for the same Python version."""
+        return f"{sys.version_info[0]}.{sys.version_info[1]}"
+
+    def _read_index(self):
+        """Read the snapshot index, or an empty index if the file is missing or invalid."""
+        if self._index is not None:
+            return self._index
+        self._index = {}
+        self._blob_start = 0
+        try:
+            with open(self.snapshot_file, 'rb') as f:
+                magic, index_length = _HEADER.unpack(f.read(_HEADER.size))
+                if magic != SNAPSHOT_MAGIC:
+                    raise ValueError("bad magic")
+                header = marshal.loads(f.read(index_length))
+                if header.get('version') != SNAPSHOT_VERSION or header.get('python') != self._tag():
+                    print("[DEBUG] Hotkey snapshot was built by another version, ignoring it")
+                    return self._index
+                self._index = header['apps']
+                self._blob_start = _HEADER.size + index_length
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"[DEBUG] Error reading hotkey snapshot: {e}")
+        return self._index
+
+    def load_app(self, dir_name, signatures):
+        """Return the stored [(filename, data), ...] for an app, or None if stale or missing.
+
+        Args:
+            dir_name: Name of the app directory inside data/hotkeys.
+            signatures: Current result of scan_app_dir() for that directory.
+        """
+        with self._lock:
+            pending = self._pending.get(dir_name)
+            if pending is not None:
+                return marshal.loads(pending[1]) if pending[0] == signatures else None
+            entry = self._read_index().get(dir_name)
+            if entry is None or entry['files'] != signatures:
+                return None
+            try:
+                with open(self.snapshot_file, 'rb') as f:
+                    f.seek(self._blob_start + entry['offset'])
+                    return marshal.loads(f.read(entry['length']))
+            except Exception as e:
+                print(f"[DEBUG] Error reading {dir_name} from hotkey snapshot: {e}")
+                return None
+
+    def update_app(self, dir_name, signatures, files):
+        """Store freshly parsed files for one app until the next flush().
+
+        Only marshals the files in memory, so it is cheap enough to call
+        while the loader lock is held.
+        """
+        blob = marshal.dumps(files)
+        with self._lock:
+            self._pending[dir_name] = (signatures, blob)
+
+    @property
+    def dirty(self):
+        """True if update_app() stored apps that are not written yet."""
+        return bool(self._pending)
+
+    def flush(self, data_dir):
+        """Write the apps stored by update_app() into the snapshot file.
+
+        Blobs of the other apps are copied over unchanged; apps whose
+        directory no longer exists in data_dir are dropped. The file is
+        rewritten once per flush however many apps changed, and lookups
+        keep being served while it is written.
+
+        Returns:
+            bool: True if a new snapshot was written.
+        """
+        with self._flush_lock:
+            with self._lock:
+                if not self._pending:
+                    return False
+                pending = dict(self._pending)
+                index = dict(self._read_index())
+                blob_start = self._blob_start
+
+            blobs = {}
+            try:
+                with open(self.snapshot_file, 'rb') as f:
+                    for name, entry in index.items():
+                        if name in pending or not os.path.isdir(os.path.join(data_dir, name)):
+                            continue
+                        f.seek(blob_start + entry['offset'])
+                        blobs[name] = (entry['files'], f.read(entry['length']))
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                print(f"[DEBUG] Error copying hotkey snapshot, rebuilding from scratch: {e}")
+                blobs = {}
+            blobs.update(pending)
+            written = self._write(blobs)
+
+            with self._lock:
+                if written is None:
+                    self._index = None  # Re-read whatever is on disk next time
+                    return False
+                self._index, self._blob_start = written
+                # Keep apps that were updated again while the file was written
+                for name, value in pending.items():
+                    if self._pending.get(name) is value:
+                        del self._pending[name]
+            return True
+
+    def _write(self, blobs):
+        """Write a new snapshot atomically from {dir_name: (signatures, blob)}.
+
+        Returns:
+            tuple: (index, blob start) of the new file, or None if it could not be written.
+        """
+        apps = {}
+        offset = 0
+        for name, (signatures, blob) in blobs.items():
+            apps[name] = {'offset': offset, 'length': len(blob), 'files': signatures}
+            offset += len(blob)
+        header = marshal.dumps({'version': SNAPSHOT_VERSION, 'python': self._tag(), 'apps': apps})
+
+        tmp_file = f"{self.snapshot_file}.tmp"
+        try:
+            with open(tmp_file, 'wb') as f:
+                f.write(_HEADER.pack(SNAPSHOT_MAGIC, len(header)))
+                f.write(header)
+                for _, blob in blobs.values():
+                    f.write(blob)
+            os.replace(tmp_file, self.snapshot_file)
+            return apps, _HEADER.size + len(header)
+        except Exception as e:
+            print(f"[DEBUG] Error writing hotkey snapshot: {e}")
+            return None
+
+    def clear(self):
+        """Forget the in-memory index so the next lookup re-reads the file."""
+        with self._lock:
+            self._index = None
@@ -0,0 +1,47 @@
+"""Background change tracking for the data/hotkeys tree."""
+import threading
+
+
+class HotkeyChangeTracker:
+    """Polls the hotkey files with os.stat and hot-reloads only what changed.
+
+    Stat polling is used instead of directory change notifications so the
+    tracker behaves the same on every platform and needs no extra handles.
+    """
+
+    def __init__(self, hotkey_loader, interval=2.0, on_change=None):
+        """Initialize the tracker.
+
+        Args:
+            hotkey_loader: The HotkeyLoader whose cache is kept up to date.
+            interval: Seconds between two polls.
+            on_change: Optional callback receiving the list of changed app names.
+        """
+        self.hotkey_loader = hotkey_loader
+        self.interval = interval
+        self.on_change = on_change
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """Start polling on a daemon thread."""
+        if self._thread is not None or self.interval <= 0:
+            return
+        self._thread = threading.Thread(target=self._run, name='HotkeyChangeTracker', daemon=True)
+        self._thread.start()
+        print(f"[DEBUG] Watching hotkey files every {self.interval}s")
+
+    def stop(self):
+        """Stop polling."""
+        self._stop_event.set()
+        self._thread = None
+
+    def _run(self):
+        """Poll loop."""
+        while not self._stop_event.wait(self.interval):
+            try:
+                changed_apps = self.hotkey_loader.refresh()
+                if changed_apps and self.on_change:
+                    self.on_change(changed_apps)
+            except Exception as e:
+                print(f"[DEBUG] Error polling hotkey files: {e}")
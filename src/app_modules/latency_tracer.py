@@ -0,0 +1,123 @@
+"""In-memory latency tracing of the popup path, from toggle hotkey to painted results."""
+import threading
+import time
+from collections import deque
+
+# Stages of the popup path, in the order they are marked
+STAGE_WINDOW_CONTEXT = 'window_context'  # Foreground window and process lookup (hotkey thread)
+STAGE_LOAD = 'load'                      # Loading the initial results (hotkey thread)
+STAGE_DISPATCH = 'dispatch'              # Until the Tk main loop runs the show
+STAGE_WINDOW_SHOW = 'window_show'        # Positioning, showing and focusing the popup
+STAGE_RENDER = 'render'                  # UIManager.update_results and selection
+STAGE_PAINT = 'paint'                    # Until Tk is idle again, i.e. the results are painted
+STAGE_TOTAL = 'total'
+STAGES = (STAGE_WINDOW_CONTEXT, STAGE_LOAD, STAGE_DISPATCH, STAGE_WINDOW_SHOW,
+          STAGE_RENDER, STAGE_PAINT, STAGE_TOTAL)
+
+# Upper bounds in milliseconds of the histogram buckets; a last bucket takes the rest
+HISTOGRAM_BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500)
+_BARS = ' ▁▂▃▄▅▆▇█'
+
+
+class LatencyTracer:
+    """Records the duration of each stage of recent popups into a ring buffer.
+
+    A trace is started with begin() when the toggle hotkey fires; each
+    mark() attributes the time since the previous mark to a stage, and
+    finish() stores the trace. Marks without an active trace are ignored,
+    so the same code paths can run untraced (e.g. a retry after reload).
+    """
+
+    def __init__(self, capacity=200, clock=time.perf_counter):
+        """Initialize the tracer.
+
+        Args:
+            capacity: Number of finished traces to keep.
+            clock: Monotonic clock returning seconds.
+        """
+        self.clock = clock
+        self._traces = deque(maxlen=capacity)
+        self._lock = threading.Lock()
+        self._active = None  # [start, last mark, {stage: seconds}]
+
+    def begin(self):
+        """Start a new trace, dropping an unfinished one."""
+        now = self.clock()
+        with self._lock:
+            self._active = [now, now, {}]
+
+    def mark(self, stage):
+        """Attribute the time since the previous mark to stage."""
+        now = self.clock()
+        with self._lock:
+            if self._active is None:
+                return
+            stages = self._active[2]
+            stages[stage] = stages.get(stage, 0.0) + now - self._active[1]
+            self._active[1] = now
+
+    def finish(self, stage=None):
+        """Optionally mark a last stage, then store the active trace."""
+        if stage is not None:
+            self.mark(stage)
+        now = self.clock()
+        with self._lock:
+            if self._active is None:
+                return
+            start, _, stages = self._active
+            stages[STAGE_TOTAL] = now - start
+            self._traces.append(stages)
+            self._active = None
+
+    def cancel(self):
+        """Drop the active trace, e.g. when the popup was not shown."""
+        with self._lock:
+            self._active = None
+
+    def stage_durations(self):
+        """Return {stage: [milliseconds, ...]} over the stored traces."""
+        with self._lock:
+            traces = list(self._traces)
+        durations = {}
+        for stages in traces:
+            for stage, seconds in stages.items():
+                durations.setdefault(stage, []).append(seconds * 1000)
+        return durations
+
+    def format_stats(self):
+        """Return a text table with count, percentiles and a histogram per stage."""
+        durations = self.stage_durations()
+        if not durations:
+            return "No popups traced yet"
+        labels = [f"<{bound}" for bound in HISTOGRAM_BUCKETS_MS] + [f">={HISTOGRAM_BUCKETS_MS[-1]}"]
+        lines = [f"{'stage':15}{'n':>5}{'p50':>8}{'p95':>8}{'max':>8}  histogram (ms: {' '.join(labels)})"]
+        ordered = [stage for stage in STAGES if stage in durations]
+        ordered += sorted(stage for stage in durations if stage not in STAGES)
+        for stage in ordered:
+            values = sorted(durations[stage])
+            p50 = values[(len(values) - 1) // 2]
+            p95 = values[min(len(values) - 1, int(len(values) * 0.95))]
+            lines.append(f"{stage:15}{len(values):>5}{p50:>8.1f}{p95:>8.1f}{values[-1]:>8.1f}  "
+                         f"{_histogram(values)}")
+        return '\n'.join(lines)
+
+
+def _histogram(values):
+    """One bar character per bucket, scaled to the fullest bucket."""
+    counts = [0] * (len(HISTOGRAM_BUCKETS_MS) + 1)
+    for value in values:
+        bucket = 0
+        while bucket < len(HISTOGRAM_BUCKETS_MS) and value >= HISTOGRAM_BUCKETS_MS[bucket]:
+            bucket += 1
+        counts[bucket] += 1
+    top = max(counts)
+    return ''.join(_BARS[max(1, round(count * (len(_BARS) - 1) / top))] if count else '·'
+                   for count in counts)
+
+
+_default_tracer = LatencyTracer()
+
+
+def get_tracer():
+    """Return the process-wide tracer of the popup path."""
+    return _default_tracer
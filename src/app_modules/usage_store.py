@@ -0,0 +1,153 @@
+"""Persisted hotkey usage, used to rank frequently and recently used hotkeys first."""
+import json
+import math
+import os
+import threading
+import time
+
+USAGE_VERSION = 1
+SECONDS_PER_DAY = 86400.0
+
+
+class UsageStore:
+    """Frecency scores of executed hotkeys per application.
+
+    Each entry keeps one score that decays exponentially with a half-life
+    and grows by one on every use, so it blends how often and how recently
+    a hotkey was used in a single number. Uses are recorded in memory; a
+    daemon thread writes them to disk in batches, at most once per
+    flush_delay seconds, and compacts the store on every write by dropping
+    entries that decayed to nearly nothing and keeping only the best
+    max_entries.
+    """
+
+    # Entries whose decayed score falls below this are dropped when compacting
+    MIN_SCORE = 0.05
+
+    def __init__(self, usage_file='data/usage.json', flush_delay=5.0, half_life_days=14.0, max_entries=2000):
+        """Initialize the store and load the usage file if it exists.
+
+        Args:
+            usage_file: Path of the JSON usage file.
+            flush_delay: Seconds to collect uses before they are written.
+            half_life_days: Days after which an unused score has halved.
+            max_entries: Entries kept over all applications.
+        """
+        self.usage_file = usage_file
+        self.flush_delay = flush_delay
+        self.half_life = half_life_days * SECONDS_PER_DAY
+        self.max_entries = max_entries
+        self._usage = {}  # app name -> {entry name: [score, last update time]}
+        self._lock = threading.Lock()
+        self._dirty = threading.Event()
+        self._stop_event = threading.Event()
+        self._thread = None
+        self.load()
+
+    def _decayed(self, score, updated, now):
+        """Score after decaying from updated until now."""
+        return score * 0.5 ** (max(0.0, now - updated) / self.half_life)
+
+    def load(self):
+        """Read the usage file; a missing or broken file starts an empty store."""
+        try:
+            with open(self.usage_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') != USAGE_VERSION:
+                return
+            usage = {}
+            for app_name, entries in data.get('apps', {}).items():
+                usage[app_name] = {name: [float(score), float(updated)] for name, (score, updated) in entries.items()}
+            with self._lock:
+                self._usage = usage
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, TypeError, AttributeError) as e:
+            print(f"[DEBUG] Ignoring unreadable usage file {self.usage_file}: {e}")
+
+    def start(self):
+        """Start the background writer."""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name='UsageStore', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop the background writer and write pending uses."""
+        self._stop_event.set()
+        self._dirty.set()  # Wake the writer so it can exit
+        self._thread = None
+        self.flush()
+
+    def record(self, app_name, entry_name, now=None):
+        """Count one use of a hotkey; returns immediately, the write happens later."""
+        if not app_name or not entry_name:
+            return
+        now = time.time() if now is None else now
+        with self._lock:
+            entries = self._usage.setdefault(app_name, {})
+            entry = entries.get(entry_name)
+            if entry is None:
+                entries[entry_name] = [1.0, now]
+            else:
+                entry[0] = self._decayed(entry[0], entry[1], now) + 1.0
+                entry[1] = now
+            self._dirty.set()
+
+    def frecency(self, app_name, now=None):
+        """Return {entry name: decayed score} of the used hotkeys of an app."""
+        now = time.time() if now is None else now
+        with self._lock:
+            entries = self._usage.get(app_name)
+            if not entries:
+                return {}
+            return {name: self._decayed(score, updated, now) for name, (score, updated) in entries.items()}
+
+    def boosts(self, app_name, weight, now=None):
+        """Return {entry name: ranking bonus} for an app, weight * log2(1 + frecency)."""
+        if weight <= 0:
+            return {}
+        return {name: weight * math.log2(1.0 + score) for name, score in self.frecency(app_name, now).items()}
+
+    def _compact(self, now):
+        """Drop faded entries and keep the best max_entries. The caller holds the lock."""
+        scored = []
+        for app_name, entries in self._usage.items():
+            for name, (score, updated) in entries.items():
+                decayed = self._decayed(score, updated, now)
+                if decayed >= self.MIN_SCORE:
+                    scored.append((decayed, app_name, name))
+        scored.sort(reverse=True)
+        usage = {}
+        for _, app_name, name in scored[:self.max_entries]:
+            usage.setdefault(app_name, {})[name] = self._usage[app_name][name]
+        self._usage = usage
+
+    def flush(self):
+        """Compact the store and write it to disk if uses were recorded since the last write."""
+        with self._lock:
+            if not self._dirty.is_set():
+                return
+            self._dirty.clear()
+            self._compact(time.time())
+            data = {'version': USAGE_VERSION, 'apps': self._usage}
+            payload = json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+        try:
+            directory = os.path.dirname(self.usage_file)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            # Write to a temporary file first so a crash never leaves a truncated store
+            temp_file = self.usage_file + '.tmp'
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                f.write(payload)
+            os.replace(temp_file, self.usage_file)
+        except OSError as e:
+            print(f"[DEBUG] Could not write usage file {self.usage_file}: {e}")
+
+    def _run(self):
+        """Writer loop: wait for a use, collect more for flush_delay seconds, write once."""
+        while not self._stop_event.is_set():
+            self._dirty.wait()
+            if self._stop_event.wait(self.flush_delay):
+                return
+            self.flush()
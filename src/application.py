@@ -0,0 +1,92 @@
+"""The resident application: search window, global hotkey and background services."""
+import sys
+import atexit
+from src.app_modules.config_manager import ConfigManager
+from src.backends import create_backend, set_backend
+from src.app_modules.hotkey_loader import HotkeyLoader
+from src.app_modules.hotkey_watcher import HotkeyChangeTracker
+from src.app_modules.hotkey_preloader import HotkeyPreloader
+from src.app_modules.usage_store import UsageStore
+from src.hotkeys.hotkey_executor import HotkeyExecutor
+from src.hotkeys.execution_worker import ExecutionWorker
+from src.hotkeys.hotkey_manager import HotkeyManager
+from src.process.process_manager import ProcessManager
+from src.process.single_instance import InstanceServer
+from src.gui.search_window import SearchWindow
+
+
+def run(startup_command=None, startup_text=None):
+    """Start the resident instance and run the Tk main loop.
+
+    Args:
+        startup_command: Optional instance command (e.g. 'search') to run once started.
+        startup_text: Search text of the startup command.
+    """
+    # Initialize components for normal operation
+    config_manager = ConfigManager()
+    # Window queries, key injection and global hotkeys go through this backend
+    set_backend(create_backend(config_manager.get_setting('Platform', 'backend', 'auto')))
+    process_manager = ProcessManager()
+    hotkey_loader = HotkeyLoader(search_mode=config_manager.get_setting('Search', 'mode', 'fuzzy'))
+    hotkey_executor = HotkeyExecutor(
+        config_manager.get_setting('Execution', 'timing_profile', 'safe'),
+        focus_timeout=config_manager.get_float_setting('Execution', 'focus_timeout_ms', 500) / 1000
+    )
+    # Run hotkeys and sequences on a worker thread so the popup stays responsive
+    execution_worker = ExecutionWorker(
+        hotkey_executor,
+        config_manager.get_setting('Execution', 'overlap_policy', 'queue')
+    )
+    
+    # Executed hotkeys rank higher; uses are written in the background
+    usage_store = UsageStore()
+    usage_store.start()
+    atexit.register(usage_store.stop)
+
+    # Create search window
+    search_window = SearchWindow(
+        config_manager,
+        process_manager,
+        hotkey_loader,
+        execution_worker,
+        usage_store
+    )
+    
+    # Own the instance address so later launches forward their commands here
+    instance_server = InstanceServer(search_window.handle_instance_command)
+    if not instance_server.start():
+        print("[ERROR] FastHotkeyExecuter is already running")
+        sys.exit(1)
+    atexit.register(instance_server.stop)
+
+    # Get toggle hotkey from config
+    toggle_hotkey = config_manager.get_hotkey('toggle_search')
+    if not toggle_hotkey:
+        print("[ERROR] No toggle hotkey configured")
+        sys.exit(1)
+        
+    # Initialize hotkey manager and register toggle hotkey
+    hotkey_manager = HotkeyManager()
+    hotkey_manager.register_hotkey(toggle_hotkey, search_window.show)
+
+    # Hot-reload changed hotkey files in the background
+    change_tracker = HotkeyChangeTracker(
+        hotkey_loader,
+        config_manager.get_float_setting('Loader', 'reload_interval', 2.0)
+    )
+    change_tracker.start()
+
+    # Warm the hotkey cache for applications that are already running
+    preloader = HotkeyPreloader(
+        hotkey_loader,
+        config_manager.get_float_setting('Loader', 'preload_interval', 30.0)
+    )
+    preloader.start()
+    # Parsed apps are written to the snapshot by the preloader; catch the rest at exit
+    atexit.register(hotkey_loader.save_snapshot)
+    
+    if startup_command:
+        search_window.handle_instance_command(startup_command, startup_text)
+
+    # Start main loop
+    search_window.run()
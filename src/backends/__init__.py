@@ -0,0 +1,43 @@
+"""Platform backends for window queries, key injection and global hotkeys."""
+import sys
+
+BACKEND_AUTO = 'auto'
+BACKEND_WINDOWS = 'windows'
+BACKEND_SIMULATED = 'simulated'
+BACKENDS = (BACKEND_AUTO, BACKEND_WINDOWS, BACKEND_SIMULATED)
+
+_default_backend = None
+
+
+def create_backend(name=BACKEND_AUTO):
+    """Create a backend by name.
+
+    'auto' picks the Windows backend on Windows and the simulated backend
+    elsewhere. Backend modules are imported on demand, so the simulated
+    backend works without pywin32, keyboard or winhotkeys installed.
+    """
+    if name not in BACKENDS:
+        print(f"[DEBUG] Unknown backend '{name}', using '{BACKEND_AUTO}'")
+        name = BACKEND_AUTO
+    if name == BACKEND_AUTO:
+        name = BACKEND_WINDOWS if sys.platform == 'win32' else BACKEND_SIMULATED
+    if name == BACKEND_WINDOWS:
+        from .windows import WindowsBackend
+        return WindowsBackend()
+    from .simulated import SimulatedBackend
+    return SimulatedBackend()
+
+
+def get_backend():
+    """Return the process-wide backend, creating the 'auto' backend on first use."""
+    global _default_backend
+    if _default_backend is None:
+        _default_backend = create_backend()
+    return _default_backend
+
+
+def set_backend(backend):
+    """Make backend the one returned by get_backend()."""
+    global _default_backend
+    _default_backend = backend
+    return backend
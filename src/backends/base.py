@@ -0,0 +1,76 @@
+"""Interface shared by all platform backends."""
+from abc import ABC, abstractmethod
+
+
+class PlatformBackend(ABC):
+    """Operating system services used by the popup, the executor and the hotkey manager.
+
+    Window handles and process ids are opaque values of the backend.
+    Query methods return None when the window or process is gone or not
+    accessible instead of raising. All methods are abstract, so a backend
+    that misses one fails when it is created.
+    """
+
+    name = 'base'
+
+    # Window and process queries
+
+    @abstractmethod
+    def get_foreground_window(self):
+        """Return the handle of the foreground window, or None."""
+
+    @abstractmethod
+    def set_foreground_window(self, hwnd):
+        """Bring a window to the foreground."""
+
+    @abstractmethod
+    def get_window_pid(self, hwnd):
+        """Return the process id owning a window, or None."""
+
+    @abstractmethod
+    def get_window_rect(self, hwnd):
+        """Return (left, top, right, bottom) of a window, or None."""
+
+    @abstractmethod
+    def get_window_title(self, hwnd):
+        """Return the title of a window ('' if it has none)."""
+
+    @abstractmethod
+    def get_process_name(self, pid):
+        """Return the executable name of a process (e.g. 'Code.exe'), or None."""
+
+    @abstractmethod
+    def list_process_names(self):
+        """Return the set of executable names of all running processes."""
+
+    # Input
+
+    @abstractmethod
+    def press_key(self, key):
+        """Press a key given by its keyboard library name."""
+
+    @abstractmethod
+    def release_key(self, key):
+        """Release a key given by its keyboard library name."""
+
+    @abstractmethod
+    def scroll_wheel(self, delta):
+        """Scroll the mouse wheel; positive is up."""
+
+    @abstractmethod
+    def is_key_down(self, virtual_key):
+        """Return whether a key, given by its Windows virtual-key code, is physically held."""
+
+    @abstractmethod
+    def open_file(self, path):
+        """Open a file with its associated application."""
+
+    # Global hotkeys
+
+    @abstractmethod
+    def register_hotkey(self, hotkey, callback):
+        """Call callback whenever hotkey is pressed anywhere; return a registration handle."""
+
+    @abstractmethod
+    def unregister_hotkey(self, handle):
+        """Remove a registration returned by register_hotkey()."""
@@ -0,0 +1,149 @@
+"""In-memory backend for headless runs and benchmarks."""
+import time
+from .base import PlatformBackend
+
+# Event kinds recorded by SimulatedBackend
+EVENT_PRESS = 'press'
+EVENT_RELEASE = 'release'
+EVENT_WHEEL = 'wheel'
+EVENT_FOCUS = 'focus'
+EVENT_OPEN = 'open'
+
+
+class SimulatedWindow:
+    """A fake top-level window owned by a fake process."""
+
+    __slots__ = ('hwnd', 'pid', 'process_name', 'title', 'rect')
+
+    def __init__(self, hwnd, pid, process_name, title='', rect=(0, 0, 800, 600)):
+        self.hwnd = hwnd
+        self.pid = pid
+        self.process_name = process_name
+        self.title = title
+        self.rect = rect
+
+    def __repr__(self):
+        return f"SimulatedWindow({self.hwnd}, {self.process_name!r}, {self.title!r})"
+
+
+class SimulatedBackend(PlatformBackend):
+    """Backend without an operating system behind it.
+
+    Windows are added with add_window() and focused with focus(). Every
+    injected key, wheel, focus change and opened file is appended to
+    events as (timestamp, kind, value), with timestamps from
+    time.perf_counter(), so benchmarks can check both what was sent and
+    when. Global hotkeys fire through trigger().
+    """
+
+    name = 'simulated'
+
+    def __init__(self, clock=time.perf_counter):
+        self.clock = clock
+        self.windows = {}
+        self.foreground = None
+        self.events = []
+        self.keys_down = set()  # Virtual-key codes reported as held by is_key_down()
+        self.hotkeys = {}
+        self._next_hwnd = 1
+        self._next_pid = 1000
+
+    # Scenario setup
+
+    def add_window(self, process_name, title='', rect=(0, 0, 800, 600), pid=None):
+        """Create a window and return its handle; windows of one process share a pid if given."""
+        hwnd = self._next_hwnd
+        self._next_hwnd += 1
+        if pid is None:
+            pid = self._next_pid
+            self._next_pid += 1
+        self.windows[hwnd] = SimulatedWindow(hwnd, pid, process_name, title, rect)
+        if self.foreground is None:
+            self.foreground = hwnd
+        return hwnd
+
+    def close_window(self, hwnd):
+        """Remove a window; its process disappears with it."""
+        self.windows.pop(hwnd, None)
+        if self.foreground == hwnd:
+            self.foreground = None
+
+    def focus(self, hwnd):
+        """Make a window the foreground window."""
+        self.set_foreground_window(hwnd)
+
+    def trigger(self, hotkey):
+        """Simulate the user pressing a registered global hotkey."""
+        callback = self.hotkeys.get(hotkey.lower())
+        if callback is None:
+            raise KeyError(f"Hotkey not registered: {hotkey}")
+        callback()
+
+    def clear_events(self):
+        """Forget the recorded events."""
+        self.events = []
+
+    def injected_keys(self):
+        """Return the (kind, value) pairs of recorded key and wheel events."""
+        return [(kind, value) for _, kind, value in self.events
+                if kind in (EVENT_PRESS, EVENT_RELEASE, EVENT_WHEEL)]
+
+    def _record(self, kind, value):
+        self.events.append((self.clock(), kind, value))
+
+    def _process_window(self, pid):
+        for window in self.windows.values():
+            if window.pid == pid:
+                return window
+        return None
+
+    # PlatformBackend
+
+    def get_foreground_window(self):
+        return self.foreground
+
+    def set_foreground_window(self, hwnd):
+        if hwnd in self.windows:
+            self.foreground = hwnd
+            self._record(EVENT_FOCUS, hwnd)
+
+    def get_window_pid(self, hwnd):
+        window = self.windows.get(hwnd)
+        return window.pid if window else None
+
+    def get_window_rect(self, hwnd):
+        window = self.windows.get(hwnd)
+        return window.rect if window else None
+
+    def get_window_title(self, hwnd):
+        window = self.windows.get(hwnd)
+        return window.title if window else ''
+
+    def get_process_name(self, pid):
+        window = self._process_window(pid)
+        return window.process_name if window else None
+
+    def list_process_names(self):
+        return {window.process_name for window in self.windows.values()}
+
+    def press_key(self, key):
+        self._record(EVENT_PRESS, key)
+
+    def release_key(self, key):
+        self._record(EVENT_RELEASE, key)
+
+    def scroll_wheel(self, delta):
+        self._record(EVENT_WHEEL, delta)
+
+    def is_key_down(self, virtual_key):
+        return virtual_key in self.keys_down
+
+    def open_file(self, path):
+        self._record(EVENT_OPEN, path)
+
+    def register_hotkey(self, hotkey, callback):
+        self.hotkeys[hotkey.lower()] = callback
+        return hotkey.lower()
+
+    def unregister_hotkey(self, handle):
+        self.hotkeys.pop(handle, None)
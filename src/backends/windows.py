@@ -0,0 +1,80 @@
+"""Backend for Windows built on pywin32, keyboard, mouse and winhotkeys."""
+import os
+import keyboard
+import mouse
+import psutil
+import win32api
+import win32gui
+import win32process
+try:
+    from winhotkeys import HotkeyHandler
+except ImportError:
+    # Fallback to local import if needed
+    from hotkey import HotkeyHandler
+from .base import PlatformBackend
+
+
+class WindowsBackend(PlatformBackend):
+    """The real desktop: Win32 window queries, injected key events and suppressed global hotkeys."""
+
+    name = 'windows'
+
+    def get_foreground_window(self):
+        return win32gui.GetForegroundWindow() or None
+
+    def set_foreground_window(self, hwnd):
+        win32gui.SetForegroundWindow(hwnd)
+
+    def get_window_pid(self, hwnd):
+        _, pid = win32process.GetWindowThreadProcessId(hwnd)
+        return pid or None
+
+    def get_window_rect(self, hwnd):
+        try:
+            return win32gui.GetWindowRect(hwnd)
+        except Exception as e:
+            print(f"[DEBUG] Could not get window rect: {e}")
+            return None
+
+    def get_window_title(self, hwnd):
+        try:
+            return win32gui.GetWindowText(hwnd)
+        except Exception:
+            return ''
+
+    def get_process_name(self, pid):
+        try:
+            return psutil.Process(pid).name()
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            return None
+
+    def list_process_names(self):
+        names = set()
+        for process in psutil.process_iter(['name']):
+            name = process.info.get('name')
+            if name:
+                names.add(name)
+        return names
+
+    def press_key(self, key):
+        keyboard.press(key)
+
+    def release_key(self, key):
+        keyboard.release(key)
+
+    def scroll_wheel(self, delta):
+        mouse.wheel(delta)
+
+    def is_key_down(self, virtual_key):
+        return bool(win32api.GetAsyncKeyState(virtual_key) & 0x8000)
+
+    def open_file(self, path):
+        os.startfile(path)
+
+    def register_hotkey(self, hotkey, callback):
+        handler = HotkeyHandler(hotkey, callback, suppress=True)
+        handler.start()
+        return handler
+
+    def unregister_hotkey(self, handle):
+        handle.stop()
@@ -1,9 +1,10 @@
 import tkinter as tk
 
 class EventManager:
-    def __init__(self, search_entry, results_listbox, on_search_change, on_hotkey_selected, on_hide):
+    def __init__(self, search_entry, results_view, on_search_change, on_hotkey_selected, on_hide):
         self.search_entry = search_entry
-        self.results_listbox = results_listbox
+        self.results_view = results_view  # ResultsView; indexes refer to the full result list
+        self.results_listbox = results_view.listbox
         self.on_search_change = on_search_change
         self.on_hotkey_selected = on_hotkey_selected
         self.on_hide = on_hide
@@ -57,30 +58,30 @@ class EventManager:
 
     def _handle_up(self, event):
         """Navigate up in results."""
-        if self.results_listbox.size() > 0:
+        if self.results_view.size() > 0:
             self.selected_index = max(0, self.selected_index - 1)
             self._update_selection()
         return 'break'
 
     def _handle_down(self, event):
         """Navigate down in results."""
-        if self.results_listbox.size() > 0:
-            self.selected_index = min(self.results_listbox.size() - 1, 
+        if self.results_view.size() > 0:
+            self.selected_index = min(self.results_view.size() - 1, 
                                     self.selected_index + 1)
             self._update_selection()
         return 'break'
 
     def _handle_page_up(self, event):
         """Move up by page."""
-        if self.results_listbox.size() > 0:
+        if self.results_view.size() > 0:
             self.selected_index = max(0, self.selected_index - 5)
             self._update_selection()
         return 'break'
 
     def _handle_page_down(self, event):
         """Move down by page."""
-        if self.results_listbox.size() > 0:
-            self.selected_index = min(self.results_listbox.size() - 1, 
+        if self.results_view.size() > 0:
+            self.selected_index = min(self.results_view.size() - 1, 
                                     self.selected_index + 5)
             self._update_selection()
         return 'break'
@@ -115,7 +116,7 @@ class EventManager:
 
     def _handle_home(self, event):
         """Jump to first result."""
-        if self.results_listbox.size() > 0:
+        if self.results_view.size() > 0:
             cursor_pos = self.search_entry.index(tk.INSERT)
             self.selected_index = 0
             self._update_selection()
@@ -124,18 +125,18 @@ class EventManager:
 
     def _handle_end(self, event):
         """Jump to last result."""
-        if self.results_listbox.size() > 0:
+        if self.results_view.size() > 0:
             cursor_pos = self.search_entry.index(tk.INSERT)
-            self.selected_index = self.results_listbox.size() - 1
+            self.selected_index = self.results_view.size() - 1
             self._update_selection()
             self.search_entry.icursor(cursor_pos)
         return 'break'
 
     def _handle_listbox_click(self, event):
         """Handle listbox click without losing focus."""
-        if self.results_listbox.size() > 0:
-            index = self.results_listbox.nearest(event.y)
-            if 0 <= index < self.results_listbox.size():
+        if self.results_view.size() > 0:
+            index = self.results_view.nearest(event.y)
+            if 0 <= index < self.results_view.size():
                 self.selected_index = index
                 self._update_selection()
                 self.search_entry.focus()
@@ -143,16 +144,16 @@ class EventManager:
 
     def _handle_listbox_double_click(self, event):
         """Handle listbox double-click to execute hotkey."""
-        if self.results_listbox.size() > 0:
-            index = self.results_listbox.nearest(event.y)
-            if 0 <= index < self.results_listbox.size():
+        if self.results_view.size() > 0:
+            index = self.results_view.nearest(event.y)
+            if 0 <= index < self.results_view.size():
                 self.selected_index = index
                 self.on_hotkey_selected(self.selected_index)
         return 'break'
 
     def _handle_mouse_wheel(self, event):
         """Handle mouse wheel scrolling."""
-        if self.results_listbox.size() > 0:
+        if self.results_view.size() > 0:
             ctrl_pressed = event.state & 0x4
             
             if event.num == 5 or event.delta < 0:  # Scroll down
@@ -171,14 +172,12 @@ class EventManager:
 
     def _update_selection(self):
         """Update listbox selection and ensure visibility."""
-        self.results_listbox.selection_clear(0, tk.END)
-        self.results_listbox.selection_set(self.selected_index)
-        self.results_listbox.see(self.selected_index)
+        self.results_view.select(self.selected_index)
 
     def reset_selection(self):
         """Reset selection to first item."""
         self.selected_index = 0
-        if self.results_listbox.size() > 0:
+        if self.results_view.size() > 0:
             self._update_selection()
 
     def get_selected_index(self):
@@ -8,6 +8,10 @@ class InternalCommandManager:
             {
                 "name": "reload - reload configuration",
                 "command": "reload"
+            },
+            {
+                "name": "stats - show popup latency statistics",
+                "command": "stats"
             }
         ]
 
@@ -28,4 +32,6 @@ class InternalCommandManager:
             return "exit"
         if command["command"] == "reload":
             return "reload"
+        if command["command"] == "stats":
+            return "stats"
         return None
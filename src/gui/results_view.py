@@ -0,0 +1,113 @@
+import tkinter as tk
+
+class ResultsView:
+    """Virtualized view of the results list on top of a tk.Listbox.
+
+    Only a window of rows around the visible ones is inserted into the
+    listbox. Indexes used by callers always refer to the full result list;
+    the view maps them to listbox rows and slides its window when the
+    selection leaves it. Changes are applied as row-level diffs.
+    """
+
+    VISIBLE_ROWS = 5
+    MARGIN_ROWS = 5
+
+    def __init__(self, listbox):
+        self.listbox = listbox
+        self.labels = []  # Display labels of all results
+        self.offset = 0  # Result index of the first listbox row
+        self.rendered = []  # Labels currently inserted into the listbox
+        self.placeholder = None
+
+    def size(self):
+        """Number of results (a placeholder message does not count)."""
+        return len(self.labels)
+
+    def _window_length(self):
+        """Number of rows kept in the listbox."""
+        return self.VISIBLE_ROWS + 2 * self.MARGIN_ROWS
+
+    def get_label(self, result):
+        """Return the display label of a result."""
+        # Internal commands are plain dicts; hotkey entries carry a prebuilt label
+        if isinstance(result, dict):
+            return result['name']
+        return result.label
+
+    def set_results(self, results, placeholder_message="No results"):
+        """Show a new result list, touching only the listbox rows that change."""
+        self.labels = [self.get_label(result) for result in results]
+        self.offset = 0
+        if self.labels:
+            self._apply(self.labels[:self._window_length()])
+            self.placeholder = None
+        else:
+            self._apply([placeholder_message])
+            self.placeholder = placeholder_message
+            self.listbox.itemconfig(0, fg='#666666')  # Gray out message
+
+    def _apply(self, rows):
+        """Diff the rendered rows against rows and update the listbox in place."""
+        if self.placeholder is not None:
+            # The placeholder row carries its own colour; never reuse it
+            self.listbox.delete(0, tk.END)
+            self.rendered = []
+            self.placeholder = None
+
+        self.listbox.selection_clear(0, tk.END)
+        common = min(len(rows), len(self.rendered))
+        for row in range(common):
+            if rows[row] != self.rendered[row]:
+                self.listbox.delete(row)
+                self.listbox.insert(row, rows[row])
+        if len(self.rendered) > len(rows):
+            self.listbox.delete(len(rows), tk.END)
+        elif len(rows) > common:
+            self.listbox.insert(tk.END, *rows[common:])
+        self.rendered = list(rows)
+
+    def _slide_to(self, index):
+        """Move the rendered window so that result index is inside it."""
+        window_length = self._window_length()
+        new_offset = max(0, min(index - self.MARGIN_ROWS, len(self.labels) - window_length))
+        shift = new_offset - self.offset
+        if shift == 0:
+            return
+        new_rows = self.labels[new_offset:new_offset + window_length]
+
+        self.listbox.selection_clear(0, tk.END)
+        if 0 < shift < len(self.rendered):
+            # Scrolled down: drop rows at the top, append the new ones
+            self.listbox.delete(0, shift - 1)
+            self.listbox.insert(tk.END, *new_rows[len(self.rendered) - shift:])
+        elif 0 < -shift < len(self.rendered):
+            # Scrolled up: drop rows at the bottom, prepend the new ones
+            kept = len(self.rendered) + shift
+            self.listbox.delete(kept, tk.END)
+            self.listbox.insert(0, *new_rows[:-shift])
+        else:
+            self.listbox.delete(0, tk.END)
+            self.listbox.insert(tk.END, *new_rows)
+        self.rendered = new_rows
+        self.offset = new_offset
+
+    def select(self, index):
+        """Select result index and make sure it is visible."""
+        if not 0 <= index < len(self.labels):
+            return
+        if not self.offset <= index < self.offset + len(self.rendered):
+            self._slide_to(index)
+        elif index - self.offset < self.VISIBLE_ROWS // 2 and self.offset > 0:
+            self._slide_to(index)
+        elif self.offset + len(self.rendered) - index <= self.VISIBLE_ROWS // 2:
+            self._slide_to(index)
+        row = index - self.offset
+        self.listbox.selection_clear(0, tk.END)
+        self.listbox.selection_set(row)
+        self.listbox.see(row)
+
+    def nearest(self, y):
+        """Return the result index of the row nearest to y, or -1 if there is none."""
+        if not self.labels:
+            return -1
+        return self.offset + self.listbox.nearest(y)
@@ -1,5 +1,8 @@
+from src.app_modules.latency_tracer import get_tracer, STAGE_LOAD, STAGE_RENDER
+
 class SearchManager:
-    def __init__(self, hotkey_loader, ui_manager, event_manager, window_manager, hotkey_executor, internal_command_manager, exit_callback, reload_callback=None):
+    def __init__(self, hotkey_loader, ui_manager, event_manager, window_manager, hotkey_executor, internal_command_manager, exit_callback, reload_callback=None, max_results=None, debounce_ms=0, usage_store=None, usage_weight=0):
+        # hotkey_executor is usually an ExecutionWorker, so execution never blocks the Tk thread
         self.hotkey_loader = hotkey_loader
         self.ui_manager = ui_manager
         self.event_manager = event_manager
@@ -8,11 +11,51 @@ class SearchManager:
         self.internal_command_manager = internal_command_manager
         self.exit_callback = exit_callback
         self.reload_callback = reload_callback
+        self.max_results = max_results  # Best fuzzy matches kept per search (None for all)
+        self.debounce_ms = debounce_ms  # Quiet time after a key press before searching
+        self.usage_store = usage_store  # UsageStore recording executed hotkeys, or None
+        self.usage_weight = usage_weight  # Ranking bonus per log2 of usage (0 ranks by match only)
         self.current_results = []
         self.is_command_mode = False
+        self._pending_search = None  # Tk after() id of the scheduled search
 
         # Bind search change event
-        self.ui_manager.get_search_var().trace('w', self.on_search_change)
+        self.ui_manager.get_search_var().trace('w', self._schedule_search)
+
+    def _schedule_search(self, *args):
+        """Debounce search input: only the last query typed within debounce_ms is searched."""
+        if self.debounce_ms <= 0:
+            self.on_search_change()
+            return
+        # Cancel the superseded search before it runs
+        self.cancel_pending_search()
+        self._pending_search = self.window_manager.window.after(self.debounce_ms, self._run_pending_search)
+
+    def _run_pending_search(self):
+        """Run the scheduled search, unless the window was hidden in the meantime."""
+        self._pending_search = None
+        # Hiding (Esc, focus loss, execution) forgets the app; searching now would report it missing
+        if self.window_manager.get_current_app() is None:
+            return
+        self.on_search_change()
+
+    def cancel_pending_search(self):
+        """Drop a scheduled search, e.g. when the results are rendered directly."""
+        if self._pending_search is not None:
+            self.window_manager.window.after_cancel(self._pending_search)
+            self._pending_search = None
+
+    def flush_pending_search(self):
+        """Run a scheduled search immediately.
+
+        Returns:
+            bool: True if a search was pending and has now been rendered.
+        """
+        if self._pending_search is None:
+            return False
+        self.cancel_pending_search()
+        self.on_search_change()
+        return True
 
     def _show_no_hotkeys_dialog(self, message):
         """Show the 'no hotkeys found' dialog with OK, Reload, and Exit buttons."""
@@ -44,9 +87,11 @@ class SearchManager:
         if self.window_manager.show():
             current_app = self.window_manager.get_current_app()
             if current_app:
-                self.current_results = self.hotkey_loader.get_hotkeys_for_app(current_app)
+                window_title = self.window_manager.get_current_window_title()
+                self.current_results = self._all_hotkeys(current_app, window_title)
                 if self.current_results:
                     self.ui_manager.clear_search()
+                    self.cancel_pending_search()
                     self.ui_manager.update_results(self.current_results)
                     self.event_manager.reset_selection()
                     self.ui_manager.get_search_entry().focus()
@@ -55,6 +100,19 @@ class SearchManager:
                 f'No hotkeys found for "{current_app}"' if current_app else "No hotkeys found for this application"
             )
 
+    def _usage_boosts(self, current_app):
+        """Ranking bonuses of the app's used hotkeys, or None when usage ranking is off."""
+        if self.usage_store is None or self.usage_weight <= 0:
+            return None
+        return self.usage_store.boosts(current_app, self.usage_weight) or None
+
+    def _all_hotkeys(self, current_app, window_title):
+        """All hotkeys of the app, the most frequently and recently used ones first."""
+        boosts = self._usage_boosts(current_app)
+        if boosts:
+            return self.hotkey_loader.search_hotkeys(current_app, '', None, window_title, boosts)
+        return self.hotkey_loader.get_hotkeys_for_app(current_app, window_title)
+
     def on_search_change(self, *args):
         """Handle search input changes."""
         search_text = self.ui_manager.get_search_var().get()
@@ -74,12 +132,16 @@ class SearchManager:
         self.is_command_mode = False
         current_app = self.window_manager.get_current_app()
         if current_app:
+            # Files with a window_title pattern only apply to matching windows
+            window_title = self.window_manager.get_current_window_title()
             # Get search results
             if not search_text:
                 # Show all hotkeys when search is empty
-                self.current_results = self.hotkey_loader.get_hotkeys_for_app(current_app)
+                self.current_results = self._all_hotkeys(current_app, window_title)
             else:
-                self.current_results = self.hotkey_loader.search_hotkeys(current_app, search_text)
+                self.current_results = self.hotkey_loader.search_hotkeys(
+                    current_app, search_text, self.max_results, window_title, self._usage_boosts(current_app)
+                )
         else:
             print("[DEBUG] No application was detected when window was shown")
             self.current_results = []
@@ -95,14 +157,33 @@ class SearchManager:
         # Reset selection
         self.event_manager.reset_selection()
 
-    def show_initial_results(self):
-        """Show initial results when window is displayed."""
+    def prepare_initial_results(self, context):
+        """Load the results shown before typing for a window context.
+
+        Does not touch Tk, so it can run on the hotkey thread before the
+        window is shown.
+        """
+        results = self._all_hotkeys(context['name'], context['title'])
+        get_tracer().mark(STAGE_LOAD)
+        return results
+
+    def show_initial_results(self, results=None):
+        """Show initial results when window is displayed.
+
+        Args:
+            results: Results from prepare_initial_results(), or None to load them now.
+        """
         current_app = self.window_manager.get_current_app()
         if not current_app:
             return False
 
         # Get all hotkeys for the current app
-        self.current_results = self.hotkey_loader.get_hotkeys_for_app(current_app)
+        tracer = get_tracer()
+        if results is None:
+            window_title = self.window_manager.get_current_window_title()
+            results = self._all_hotkeys(current_app, window_title)
+            tracer.mark(STAGE_LOAD)
+        self.current_results = results
         
         if not self.current_results:
             self._show_no_hotkeys_dialog(f'No hotkeys found for "{current_app}"')
@@ -110,12 +191,17 @@ class SearchManager:
             
         # Clear search and update UI
         self.ui_manager.clear_search()
+        self.cancel_pending_search()
         self.ui_manager.update_results(self.current_results)
         self.event_manager.reset_selection()
+        tracer.mark(STAGE_RENDER)
         return True
 
     def execute_selected_hotkey(self, index):
         """Execute the selected hotkey or command."""
+        # Act on the results of what was typed, not on a stale list
+        if self.flush_pending_search():
+            index = self.event_manager.get_selected_index()
         if 0 <= index < len(self.current_results):
             if self.is_command_mode:
                 selected_command = self.current_results[index]
@@ -126,17 +212,25 @@ class SearchManager:
                     self.exit_callback()
                 elif result == "reload" and self.reload_callback:
                     self.reload_callback()
+                elif result == "stats":
+                    self._show_stats()
             else:
                 selected_hotkey = self.current_results[index]
-                if 'run' in selected_hotkey:
-                    hotkey_desc = f"run: {selected_hotkey['run']}"
-                elif 'hotkey' in selected_hotkey:
-                    hotkey_desc = selected_hotkey['hotkey']
-                else:
-                    hotkey_desc = 'sequence'
-                print(f"[DEBUG] Executing hotkey: {selected_hotkey['name']} ({hotkey_desc})")
+                print(f"[DEBUG] Executing hotkey: {selected_hotkey.name} ({selected_hotkey.describe()})")
+                if self.usage_store is not None:
+                    # In memory only; the store writes it to disk in the background
+                    self.usage_store.record(self.window_manager.get_current_app(), selected_hotkey.name)
+                # hide() forgets the window, so take it first; keys go there once it has focus again
+                target_window = self.window_manager.get_current_window()
                 self.window_manager.hide()
-                self.hotkey_executor.execute_hotkey(selected_hotkey)
+                self.hotkey_executor.execute_hotkey(selected_hotkey, target_window=target_window)
+
+    def _show_stats(self):
+        """Show the latency histograms of recent popups in a dialog."""
+        stats = get_tracer().format_stats()
+        print(f"[DEBUG] Popup latency (ms):\n{stats}")
+        dialog = self.ui_manager.create_dialog(stats, monospace=True)
+        self.ui_manager.show_dialog(dialog)
 
     def get_current_results(self):
         """Get the current search results."""
@@ -6,9 +6,10 @@ from .event_manager import EventManager
 from .ui_manager import UIManager
 from .search_manager import SearchManager
 from .internal_command_manager import InternalCommandManager
+from src.app_modules.latency_tracer import get_tracer, STAGE_DISPATCH, STAGE_PAINT
 
 class SearchWindow:
-    def __init__(self, config_manager, process_manager, hotkey_loader, hotkey_executor):
+    def __init__(self, config_manager, process_manager, hotkey_loader, hotkey_executor, usage_store=None):
         self.hotkey_loader = hotkey_loader
         self.internal_command_manager = InternalCommandManager()
         # Configure global theme settings before creating root window
@@ -26,7 +27,7 @@ class SearchWindow:
         # Initialize event manager with callbacks
         self.event_manager = EventManager(
             self.ui_manager.get_search_entry(),
-            self.ui_manager.get_results_listbox(),
+            self.ui_manager.get_results_view(),
             None,  # Search change is handled by SearchManager
             self._on_hotkey_selected,
             self.hide
@@ -41,26 +42,83 @@ class SearchWindow:
             hotkey_executor,
             self.internal_command_manager,
             self.exit_application,
-            self.reload_configuration
+            self.reload_configuration,
+            int(config_manager.get_float_setting('Search', 'max_results', 100)) or None,
+            int(config_manager.get_float_setting('Search', 'debounce_ms', 40)),
+            usage_store,
+            config_manager.get_float_setting('Search', 'usage_weight', 12)
         )
         
         # Bind focus loss to window manager
         root.bind('<FocusOut>', self.window_manager.handle_focus_loss)
 
-    def show(self):
+    def show(self, search_text=None):
         """Show the search window (thread-safe)."""
+        tracer = get_tracer()
+        tracer.begin()
+        # Resolve the foreground app and load its results on the calling
+        # (winhotkeys) thread, so the main thread only has to show and render
+        context = self.window_manager.resolve_context()
+        if not context:
+            tracer.cancel()
+            return
+        results = self.search_manager.prepare_initial_results(context)
         # Schedule the actual show operation on the main thread
-        # This is necessary because winhotkeys callbacks run in a separate thread
-        self.window_manager.window.after(0, self._show_internal)
+        # This is necessary because Tk may only be used from the thread running mainloop
+        self.window_manager.window.after(0, lambda: self._show_internal(search_text, context, results))
 
-    def _show_internal(self):
-        """Internal method to show window - must be called from main thread."""
-        if self.window_manager.show():
-            if self.search_manager.show_initial_results():
-                self.ui_manager.get_search_entry().focus()
+    def _show_internal(self, search_text=None, context=None, results=None):
+        """Internal method to show window - must be called from main thread.
+
+        Args:
+            search_text: Optional text to enter into the search field.
+            context: Prepared foreground window context (None resolves it here).
+            results: Prepared initial results (None loads them here).
+        """
+        tracer = get_tracer()
+        tracer.mark(STAGE_DISPATCH)
+        if self.window_manager.show(context):
+            if self.search_manager.show_initial_results(results):
+                search_entry = self.ui_manager.get_search_entry()
+                if search_text:
+                    self.ui_manager.get_search_var().set(search_text)
+                    # Render the results for the text now instead of after the debounce
+                    self.search_manager.flush_pending_search()
+                    search_entry.icursor(tk.END)
+                search_entry.focus()
+                # Idle callbacks run after Tk's pending redraws
+                self.window_manager.window.after_idle(lambda: tracer.finish(STAGE_PAINT))
+                return
+        tracer.cancel()
+
+    def _toggle_internal(self):
+        """Hide the window if it is shown, otherwise show it - must be called from main thread."""
+        if self.window_manager.window.state() != 'withdrawn':
+            self.window_manager.hide()
+            return
+        get_tracer().begin()
+        self._show_internal()
+
+    def handle_instance_command(self, command, text=None):
+        """Run a command forwarded by a later launch (called on the listener thread).
+
+        Returns:
+            bool: True, the command is scheduled on the main thread.
+        """
+        print(f"[DEBUG] Instance command: {command}")
+        window = self.window_manager.window
+        if command == 'toggle':
+            window.after(0, self._toggle_internal)
+        elif command == 'reload':
+            window.after(0, self.reload_configuration)
+        else:
+            # 'show' and 'search'
+            self.show(text)
+        return True
 
     def hide(self, event=None):
         """Hide the search window."""
+        self.search_manager.cancel_pending_search()
         self.window_manager.hide()
 
     def _on_hotkey_selected(self, index):
@@ -68,10 +126,10 @@ class SearchWindow:
         self.search_manager.execute_selected_hotkey(index)
 
     def reload_configuration(self):
-        """Reload all hotkey configuration files from disk."""
-        self.hotkey_loader.clear_cache()
+        """Reload the hotkey configuration files that changed on disk."""
+        self.hotkey_loader.refresh()
         self.window_manager.hide()
-        print("[DEBUG] Configuration reloaded - hotkey cache cleared")
+        print("[DEBUG] Configuration reloaded")
 
     def exit_application(self):
         """Exit the application."""
@@ -1,5 +1,6 @@
 import tkinter as tk
 from tkinter import ttk
+from .results_view import ResultsView
 
 class UIManager:
     def __init__(self, root, theme_manager):
@@ -9,7 +10,9 @@ class UIManager:
         self.search_entry = None
         self.search_var = None
         self.results_listbox = None
+        self.results_view = None
         self.base_height = self.theme_manager.settings['height']
+        self._geometry = None  # Last size set by update_results
         self._create_ui()
 
     def _create_ui(self):
@@ -41,6 +44,7 @@ class UIManager:
             takefocus=0  # Prevent listbox from taking focus
         )
         self.results_listbox.pack(fill=tk.BOTH, expand=True, padx=5)
+        self.results_view = ResultsView(self.results_listbox)
 
     def get_search_entry(self):
         """Get the search entry widget."""
@@ -54,37 +58,37 @@ class UIManager:
         """Get the results listbox widget."""
         return self.results_listbox
 
+    def get_results_view(self):
+        """Get the virtualized view over the results listbox."""
+        return self.results_view
+
     def update_results(self, results, placeholder_message="No results"):
         """Update the results listbox with new items."""
-        self.results_listbox.delete(0, tk.END)
-        
+        # Only the rows around the visible ones are rendered, as a diff
+        self.results_view.set_results(results, placeholder_message)
+
         if results:
-            for result in results:
-                # Check if it's a hotkey sequence, single hotkey, or command
-                if 'hotkeys' in result:
-                    self.results_listbox.insert(tk.END, f"{result['name']} (sequence)")
-                elif 'run' in result:
-                    import os
-                    filename = os.path.basename(result['run'])
-                    self.results_listbox.insert(tk.END, f"{result['name']} (run: {filename})")
-                elif 'hotkey' in result:
-                    self.results_listbox.insert(tk.END, f"{result['name']} ({result['hotkey']})")
-                else:
-                    self.results_listbox.insert(tk.END, result['name'])
-            list_height = min(5, len(results))
-            self.results_listbox.configure(height=list_height)
+            list_height = min(ResultsView.VISIBLE_ROWS, len(results))
             # Calculate total height based on base height plus additional space for results
             total_height = self.base_height + (list_height * 20)  # Approximate 20 pixels per list item
-            self.window.geometry(f"{self.theme_manager.settings['width']}x{total_height}")
         else:
-            self.results_listbox.insert(tk.END, placeholder_message)
-            self.results_listbox.itemconfig(0, fg='#666666')  # Gray out message
-            self.results_listbox.configure(height=1)
+            list_height = 1
             # Use base height for empty results
-            self.window.geometry(f"{self.theme_manager.settings['width']}x{self.base_height}")
+            total_height = self.base_height
+        geometry = f"{self.theme_manager.settings['width']}x{total_height}"
+        if geometry != self._geometry:
+            self.results_listbox.configure(height=list_height)
+            self.window.geometry(geometry)
+            self._geometry = geometry
+
+    def create_dialog(self, message, on_ok=None, monospace=False):
+        """Create and return a styled dialog window.
 
-    def create_dialog(self, message, on_ok=None):
-        """Create and return a styled dialog window."""
+        Args:
+            message: The message to display
+            on_ok: Optional callback of the OK button (default: close the dialog)
+            monospace: Show the message unwrapped in a fixed-width font, e.g. for tables
+        """
         dialog = tk.Toplevel(self.window)
         dialog.withdraw()
         dialog.title("Message")
@@ -100,8 +104,9 @@ class UIManager:
             text=message,
             bg=self.theme_manager.settings['input_background_color'],
             fg=self.theme_manager.settings['input_text_color'],
-            font=('Arial', self.theme_manager.settings['font_size']),
-            wraplength=300,
+            font=('Consolas' if monospace else 'Arial', self.theme_manager.settings['font_size']),
+            wraplength=0 if monospace else 300,
+            justify=tk.LEFT if monospace else tk.CENTER,
             padx=10,
             pady=10
         )
@@ -1,5 +1,5 @@
 import tkinter as tk
-import time
+from src.app_modules.latency_tracer import get_tracer, STAGE_WINDOW_CONTEXT, STAGE_WINDOW_SHOW
 
 class WindowManager:
     def __init__(self, root, config_manager, process_manager):
@@ -7,6 +7,7 @@ class WindowManager:
         self.config_manager = config_manager
         self.process_manager = process_manager
         self.current_app = None
+        self.current_context = None  # Foreground window context of the last show()
         self._configure_window()
         self.search_entry = None  # Will be set by set_search_entry
         self._showing = False  # Flag to prevent focus loss during show
@@ -32,17 +33,31 @@ class WindowManager:
         """Set the search entry widget for focus management."""
         self.search_entry = entry
 
-    def show(self):
-        """Show the search window centered on the active window."""
-        try:
-            self.current_app = self.process_manager.get_active_window_process()
-            if not self.current_app:
-                return False
+    def resolve_context(self):
+        """Resolve the foreground window the search window is shown for.
+
+        Does not touch Tk, so it can run on the hotkey thread.
+        """
+        # Resolve the active window's process and position in one pass
+        context = self.process_manager.get_active_window_context()
+        get_tracer().mark(STAGE_WINDOW_CONTEXT)
+        return context
+
+    def show(self, context=None):
+        """Show the search window centered on the active window.
 
-            # Get active window position
-            active_pos = self.process_manager.get_active_window_position()
-            if not active_pos:
+        Args:
+            context: Foreground window context from resolve_context(), or
+                None to resolve it now.
+        """
+        try:
+            if context is None:
+                context = self.resolve_context()
+            if not context:
                 return False
+            self.current_context = context
+            self.current_app = context['name']
+            active_pos = context['rect']
 
             # Calculate center position
             settings = self.config_manager.get_window_settings()
@@ -66,6 +81,7 @@ class WindowManager:
             # Clear the showing flag after a short delay
             self.window.after(100, self._clear_showing_flag)
 
+            get_tracer().mark(STAGE_WINDOW_SHOW)
             return True
 
         except Exception as e:
@@ -73,11 +89,14 @@ class WindowManager:
             return False
 
     def hide(self):
-        """Hide the search window."""
+        """Hide the search window.
+
+        Returns at once; the executor waits until focus is back on the target
+        window before it injects keys.
+        """
         self.window.withdraw()
-        self.window.update()
-        time.sleep(0.1)
         self.current_app = None
+        self.current_context = None
 
     def _clear_showing_flag(self):
         """Clear the showing flag after window is fully shown."""
@@ -116,6 +135,14 @@ class WindowManager:
         """Get the current application name."""
         return self.current_app
 
+    def get_current_window(self):
+        """Get the handle of the window the search window was shown for."""
+        return self.current_context['hwnd'] if self.current_context else None
+
+    def get_current_window_title(self):
+        """Get the title of the window the search window was shown for."""
+        return self.current_context['title'] if self.current_context else None
+
     def update_size(self, height):
         """Update window height while maintaining width."""
         settings = self.config_manager.get_window_settings()
@@ -0,0 +1,105 @@
+"""Abort-key detection that only exists while a sequence runs."""
+import threading
+from src.backends import get_backend
+from .action_plan import split_hotkey
+
+# Windows virtual-key codes of the named keys an abort combination may use
+VIRTUAL_KEY_CODES = {
+    'esc': 0x1B, 'enter': 0x0D, 'tab': 0x09, 'space': 0x20, 'backspace': 0x08,
+    'delete': 0x2E, 'insert': 0x2D, 'home': 0x24, 'end': 0x23,
+    'pageup': 0x21, 'pagedown': 0x22,
+    'left': 0x25, 'up': 0x26, 'right': 0x27, 'down': 0x28,
+    'ctrl': 0x11, 'shift': 0x10, 'alt': 0x12, 'win': 0x5B, 'windows': 0x5B,
+    'left ctrl': 0xA2, 'right ctrl': 0xA3, 'left shift': 0xA0, 'right shift': 0xA1,
+    'left alt': 0xA4, 'right alt': 0xA5, 'left windows': 0x5B, 'right windows': 0x5C,
+}
+VIRTUAL_KEY_CODES.update({f'f{i}': 0x6F + i for i in range(1, 13)})
+VIRTUAL_KEY_CODES.update({chr(c): ord(chr(c).upper()) for c in range(ord('a'), ord('z') + 1)})
+VIRTUAL_KEY_CODES.update({str(i): ord(str(i)) for i in range(10)})
+
+
+def to_virtual_keys(hotkey):
+    """Return the virtual-key codes of a hotkey, or None if a key has no known code."""
+    codes = []
+    for key in split_hotkey(hotkey.lower()):
+        code = VIRTUAL_KEY_CODES.get(key)
+        if code is None:
+            return None
+        codes.append(code)
+    return tuple(codes)
+
+
+class AbortKeyWatcher:
+    """Polls the abort keys (GetAsyncKeyState on Windows) and aborts a token when one is pressed.
+
+    Unlike a keyboard hook, nothing is installed system-wide: the polling
+    thread lives only between start() and stop(), so keystrokes cost nothing
+    while no sequence runs. Combinations are only checked while the executor
+    is not injecting keys itself, and only a fresh press (not held during the
+    previous poll) counts.
+    """
+
+    POLL_INTERVAL = 0.02  # seconds
+
+    def __init__(self, token, hotkeys=('esc',), backend=None):
+        """Initialize the watcher.
+
+        Args:
+            token: CancellationToken to abort.
+            hotkeys: Key combinations that abort, e.g. ('esc', 'ctrl+q').
+            backend: PlatformBackend reporting the key state (default: get_backend()).
+        """
+        self.token = token
+        self.backend = backend or get_backend()
+        self.combinations = []
+        for hotkey in hotkeys:
+            codes = to_virtual_keys(hotkey)
+            if codes:
+                self.combinations.append(codes)
+            else:
+                print(f"[DEBUG] Cannot watch abort hotkey: {hotkey}")
+        self.injecting = False  # Set by the executor while it sends keys
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def start(self):
+        """Start watching."""
+        if self._thread is None and self.combinations:
+            self._thread = threading.Thread(target=self._run, name='AbortKeyWatcher', daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        """Stop watching and end the polling thread."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(self.POLL_INTERVAL * 5)
+            self._thread = None
+
+    def _is_down(self, combination):
+        """Return whether all keys of a combination are currently held."""
+        return all(self.backend.is_key_down(code) for code in combination)
+
+    def _run(self):
+        """Poll loop."""
+        # Keys already held when the sequence starts (e.g. Enter) do not abort it
+        held = {combination for combination in self.combinations if self._is_down(combination)}
+        while not self._stop_event.wait(self.POLL_INTERVAL):
+            if self.injecting:
+                # Our own key events must be released before they can count as a press
+                held.update(self.combinations)
+                continue
+            for combination in self.combinations:
+                if self._is_down(combination):
+                    if combination not in held:
+                        self.token.abort()
+                        print("[DEBUG] Sequence execution aborted")
+                        return
+                else:
+                    held.discard(combination)
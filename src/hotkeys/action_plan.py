@@ -0,0 +1,148 @@
+"""Compilation of hotkey strings into immutable press/release plans."""
+import time
+from collections import namedtuple
+from functools import lru_cache
+from .key_aliases import KEY_ALIASES, VALID_KEYS, MODIFIER_KEYS
+
+# Step operations
+PRESS = 'press'
+RELEASE = 'release'
+WHEEL = 'wheel'
+
+# Which pause follows a step (None for no pause)
+DELAY_PRESS = 'press'      # after pressing a modifier
+DELAY_HOLD = 'hold'        # while the final key is held down
+DELAY_RELEASE = 'release'  # after releasing a modifier
+
+MOUSE_ACTIONS = {
+    'wheelup': 1,     # Positive for scroll up
+    'wheeldown': -1   # Negative for scroll down
+}
+
+# Built once instead of on every validation
+ALL_VALID_KEYS = frozenset(MODIFIER_KEYS | VALID_KEYS)
+
+PlanStep = namedtuple('PlanStep', ['op', 'key', 'delay'])
+
+
+class ActionPlan:
+    """Resolved steps of one hotkey combination, ready to be replayed."""
+
+    __slots__ = ('hotkey', 'steps')
+
+    def __init__(self, hotkey, steps):
+        self.hotkey = hotkey
+        self.steps = tuple(steps)
+
+    def __repr__(self):
+        return f"ActionPlan({self.hotkey!r}, {len(self.steps)} steps)"
+
+
+def _key_name(key):
+    """Name the keyboard library expects for a key."""
+    # Use 'windows' instead of 'win'
+    return 'windows' if key == 'win' else key
+
+
+def split_hotkey(hotkey):
+    """Split a hotkey string into normalized key names."""
+    # Split and handle special case for '+' key
+    if '++' in hotkey:
+        # Handle ctrl++ case
+        parts = hotkey.split('++')
+        keys = parts[0].split('+') + ['+']  # Add '+' as the final key
+    else:
+        # Normal case
+        keys = hotkey.split('+')
+
+    # Clean up keys and filter out empty strings
+    keys = [key.strip() for key in keys if key.strip()]
+
+    # Map key aliases to standard forms, but preserve '?' key
+    return [k if k == '?' else KEY_ALIASES.get(k, k) for k in keys]
+
+
+def _final_key_steps(key):
+    """Steps that press and release the final key of a combination."""
+    # Handle '?' key specially (shift+ß on a German keyboard layout)
+    if key == '?':
+        return [PlanStep(PRESS, 'shift', None), PlanStep(PRESS, 'ß', DELAY_HOLD),
+                PlanStep(RELEASE, 'ß', None), PlanStep(RELEASE, 'shift', None)]
+    # Handle ';' key specially for German keyboard layout (shift+comma)
+    if key == ';':
+        return [PlanStep(PRESS, 'shift', None), PlanStep(PRESS, ',', DELAY_HOLD),
+                PlanStep(RELEASE, ',', None), PlanStep(RELEASE, 'shift', None)]
+    key = _key_name(key)
+    return [PlanStep(PRESS, key, DELAY_HOLD), PlanStep(RELEASE, key, None)]
+
+
+@lru_cache(maxsize=None)
+def compile_hotkey(hotkey):
+    """Compile a hotkey string such as 'ctrl+shift+p' into an ActionPlan.
+
+    Plans are immutable, so entries with the same hotkey share one plan.
+
+    Raises:
+        ValueError: If the hotkey is empty or contains an unknown key.
+    """
+    hotkey = hotkey.lower()
+
+    # Special case for standalone semicolon
+    if hotkey == ';':
+        return ActionPlan(hotkey, _final_key_steps(';'))
+
+    keys = split_hotkey(hotkey)
+    if not keys:
+        raise ValueError("Empty hotkey")
+
+    # Only the last key may be a mouse wheel action
+    for key in keys[:-1]:
+        if key not in ALL_VALID_KEYS:
+            raise ValueError(f"Invalid key: {key}")
+    last_key = keys[-1]
+    if last_key not in ALL_VALID_KEYS and last_key not in MOUSE_ACTIONS:
+        raise ValueError(f"Invalid key: {last_key}")
+
+    modifiers = [_key_name(key) for key in keys[:-1]]
+    steps = [PlanStep(PRESS, key, DELAY_PRESS) for key in modifiers]
+    if last_key in MOUSE_ACTIONS:
+        steps.append(PlanStep(WHEEL, MOUSE_ACTIONS[last_key], DELAY_HOLD))
+    else:
+        steps.extend(_final_key_steps(last_key))
+    # Release modifiers in reverse order
+    steps.extend(PlanStep(RELEASE, key, DELAY_RELEASE) for key in reversed(modifiers))
+    return ActionPlan(hotkey, steps)
+
+
+def play_plan(plan, profile, press, release, wheel, sleep=time.sleep):
+    """Replay an ActionPlan with the pauses of a TimingProfile.
+
+    Args:
+        plan: The ActionPlan to replay.
+        profile: TimingProfile providing the pause after each step.
+        press: Callable(key) pressing a key.
+        release: Callable(key) releasing a key.
+        wheel: Callable(delta) scrolling the mouse wheel.
+        sleep: Callable(seconds) used for the pauses.
+    """
+    if profile.batched:
+        # Zero-delay profile: send every event back to back
+        for op, key, _ in plan.steps:
+            if op == PRESS:
+                press(key)
+            elif op == RELEASE:
+                release(key)
+            else:
+                wheel(key)
+        return
+
+    for step in plan.steps:
+        if step.op == PRESS:
+            press(step.key)
+        elif step.op == RELEASE:
+            release(step.key)
+        elif step.op == WHEEL:
+            wheel(step.key)
+        delay = profile.delay_for(step.delay)
+        if delay:
+            sleep(delay)
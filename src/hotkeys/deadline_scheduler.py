@@ -0,0 +1,75 @@
+"""Drift-free timing for hotkey sequences."""
+import time
+
+
+class DeadlineScheduler:
+    """Schedules sequence steps against deadlines measured from the sequence start.
+
+    Every pause advances a cursor on a timeline that starts when the
+    scheduler is created, and waiting always targets start + cursor on the
+    monotonic clock. Overshooting one pause therefore shortens the next one
+    instead of accumulating, and the lateness (jitter) of each step is kept
+    for reporting.
+    """
+
+    # Below this many seconds before a deadline, spin instead of sleeping,
+    # since OS sleeps can overshoot by a full timer tick
+    SPIN_THRESHOLD = 0.002
+
+    def __init__(self, token=None, clock=time.perf_counter):
+        """Initialize the scheduler.
+
+        Args:
+            token: Optional CancellationToken; waiting stops early when it is cancelled.
+            clock: Monotonic clock returning seconds.
+        """
+        self.token = token
+        self.clock = clock
+        self.start = clock()
+        self.cursor = 0.0  # Seconds from start of the next deadline
+        self.steps = []  # (label, jitter in seconds)
+
+    def advance(self, seconds):
+        """Move the next deadline later without waiting."""
+        self.cursor += seconds
+
+    def wait(self):
+        """Wait until the current deadline.
+
+        Returns:
+            bool: True if the wait was interrupted by cancellation.
+        """
+        deadline = self.start + self.cursor
+        while True:
+            remaining = deadline - self.clock()
+            if remaining <= 0:
+                return False
+            if remaining > self.SPIN_THRESHOLD:
+                sleep_for = remaining - self.SPIN_THRESHOLD
+                if self.token is not None:
+                    if self.token.wait(sleep_for):
+                        return True
+                else:
+                    time.sleep(sleep_for)
+            elif self.token is not None and self.token.cancelled:
+                return True
+
+    def sleep(self, seconds):
+        """Advance the deadline and wait for it; usable as the sleep of play_plan()."""
+        self.advance(seconds)
+        self.wait()
+
+    def mark(self, label):
+        """Record how late the current step started relative to its deadline."""
+        self.steps.append((label, self.clock() - (self.start + self.cursor)))
+
+    def report(self):
+        """Return a one-line summary of the per-step jitter in milliseconds."""
+        if not self.steps:
+            return "no steps"
+        jitters = [jitter * 1000 for _, jitter in self.steps]
+        elapsed = (self.clock() - self.start) * 1000
+        per_step = ', '.join(f"{label} {jitter:+.1f}" for (label, _), jitter in zip(self.steps, jitters))
+        return (f"{len(jitters)} steps, jitter mean {sum(jitters) / len(jitters):.1f} ms, "
+                f"max {max(jitters):.1f} ms, planned {self.cursor * 1000:.0f} ms, "
+                f"took {elapsed:.0f} ms [{per_step}]")
@@ -0,0 +1,124 @@
+"""Worker thread that executes hotkeys off the Tk main thread."""
+import queue
+import threading
+
+OVERLAP_QUEUE = 'queue'      # Run new triggers after the current one
+OVERLAP_REPLACE = 'replace'  # Cancel the current and pending jobs, then run the new one
+OVERLAP_REJECT = 'reject'    # Ignore new triggers while a job is running or pending
+OVERLAP_POLICIES = (OVERLAP_QUEUE, OVERLAP_REPLACE, OVERLAP_REJECT)
+
+
+class CancellationToken:
+    """Cancellation flag for one execution job; sleeps on it wake up when cancelled."""
+
+    def __init__(self):
+        self._event = threading.Event()
+        self.aborted = False  # Cancelled by the user's abort key rather than by the worker
+
+    def cancel(self):
+        """Request cancellation."""
+        self._event.set()
+
+    def abort(self):
+        """Cancel on behalf of the user; the worker then also drops the queued jobs."""
+        self.aborted = True
+        self._event.set()
+
+    @property
+    def cancelled(self):
+        """True once cancel() was called."""
+        return self._event.is_set()
+
+    def wait(self, timeout):
+        """Sleep up to timeout seconds; return True early if the job was cancelled."""
+        return self._event.wait(timeout)
+
+
+class ExecutionWorker:
+    """Runs HotkeyExecutor jobs one at a time on a dedicated thread.
+
+    Has the same execute_hotkey() entry point as HotkeyExecutor, but only
+    queues the job, so long sequences never block the caller.
+    """
+
+    def __init__(self, hotkey_executor, overlap_policy=OVERLAP_QUEUE):
+        """Initialize the worker.
+
+        Args:
+            hotkey_executor: The HotkeyExecutor that performs the jobs.
+            overlap_policy: What to do when a hotkey is triggered while another
+                one is still running: 'queue', 'replace' or 'reject'.
+        """
+        if overlap_policy not in OVERLAP_POLICIES:
+            print(f"[DEBUG] Unknown overlap policy '{overlap_policy}', using '{OVERLAP_QUEUE}'")
+            overlap_policy = OVERLAP_QUEUE
+        self.hotkey_executor = hotkey_executor
+        self.overlap_policy = overlap_policy
+        self._jobs = queue.Queue()
+        self._lock = threading.Lock()
+        # Tokens of the queued and running jobs. A job stays listed from
+        # execute_hotkey() until it has finished, so there is no gap between
+        # dequeuing and running in which the worker looks idle.
+        self._unfinished = []
+        self._thread = threading.Thread(target=self._run, name='ExecutionWorker', daemon=True)
+        self._thread.start()
+
+    def is_busy(self):
+        """Return whether a job is running or waiting."""
+        with self._lock:
+            return bool(self._unfinished)
+
+    def execute_hotkey(self, hotkey_data, target_window=None):
+        """Queue a HotkeyEntry for execution according to the overlap policy.
+
+        Args:
+            hotkey_data: The HotkeyEntry to execute.
+            target_window: Window that must have focus before keys are injected, or None.
+
+        Returns:
+            bool: False if the job was rejected.
+        """
+        with self._lock:
+            busy = bool(self._unfinished)
+            if busy and self.overlap_policy == OVERLAP_REJECT:
+                print(f"[DEBUG] Ignoring {hotkey_data.name}: another hotkey is still running")
+                return False
+            if busy and self.overlap_policy == OVERLAP_REPLACE:
+                self._cancel_locked()
+            token = CancellationToken()
+            self._unfinished.append(token)
+            self._jobs.put((hotkey_data, token, target_window))
+        return True
+
+    def cancel(self):
+        """Cancel the running job and drop all pending ones."""
+        with self._lock:
+            self._cancel_locked()
+
+    def _cancel_locked(self):
+        """Cancel everything; the caller holds the lock."""
+        try:
+            while True:
+                _, token, _ = self._jobs.get_nowait()
+                self._unfinished.remove(token)
+        except queue.Empty:
+            pass
+        # Left: the running job, or one the worker has dequeued but not started
+        for token in self._unfinished:
+            token.cancel()
+
+    def _run(self):
+        """Worker loop."""
+        while True:
+            hotkey_data, token, target_window = self._jobs.get()
+            try:
+                if not token.cancelled:
+                    self.hotkey_executor.execute_hotkey(hotkey_data, token, target_window)
+            except Exception as e:
+                print(f"[DEBUG] Error in execution worker: {e}")
+            finally:
+                with self._lock:
+                    self._unfinished.remove(token)
+            if token.aborted:
+                # The user stopped this job with the abort key; do not start the ones queued behind it
+                self.cancel()
@@ -1,220 +1,168 @@
-import keyboard
-import mouse
 import os
 import time
-import win32gui
-import win32con
-from .key_aliases import KEY_ALIASES, VALID_KEYS
+from src.backends import get_backend
+from .action_plan import play_plan
+from .timing_profiles import get_timing_profile, DEFAULT_PROFILE
+from .execution_worker import CancellationToken
+from .deadline_scheduler import DeadlineScheduler
+from .abort_watcher import AbortKeyWatcher
+from src.app_modules.hotkey_entry import HotkeyEntry, KIND_RUN, KIND_SEQUENCE
 
 class HotkeyExecutor:
-    def __init__(self):
-        """Initialize the hotkey executor."""
-        self.mouse_actions = {
-            'wheelup': 1,     # Positive for scroll up
-            'wheeldown': -1   # Negative for scroll down
-        }
-        self.abort_sequence = False
-        self._setup_abort_listeners()
-        
-    def _setup_abort_listeners(self):
-        """Setup keyboard listeners for sequence abort."""
-        keyboard.on_press_key('esc', self._abort_sequence_callback)
-        
-    def _abort_sequence_callback(self, e):
-        """Callback for abort key press."""
-        self.abort_sequence = True
-        print("[DEBUG] Sequence execution aborted")
-        
-    def _validate_keys(self, keys):
-        """Validate that all keys in the combination are valid keyboard keys."""
-        valid_keys = keyboard.all_modifiers.union(VALID_KEYS)
-        
-        for key in keys:
-            key = key.lower()
-            if key not in valid_keys:
-                raise ValueError(f"Invalid key: {key}")
-        return True
+    # Seconds between foreground checks while waiting for the target window
+    FOCUS_POLL_INTERVAL = 0.002
+
+    def __init__(self, timing_profile=DEFAULT_PROFILE, backend=None, focus_timeout=0.5):
+        """Initialize the hotkey executor.
+
+        Args:
+            timing_profile: Name of the timing profile used when an entry does not set one.
+            backend: PlatformBackend that injects the key events (default: get_backend()).
+            focus_timeout: Seconds to wait for the target window to regain focus.
+        """
+        self.backend = backend or get_backend()
+        self.default_timing = get_timing_profile(timing_profile)
+        self.focus_timeout = focus_timeout
 
-    def execute_hotkey(self, hotkey_data):
-        """Execute a hotkey by simulating key presses, or run an external file."""
+    def execute_hotkey(self, hotkey_data, token=None, target_window=None):
+        """Execute a HotkeyEntry by simulating key presses, or run an external file.
+
+        Args:
+            hotkey_data: The HotkeyEntry to execute.
+            token: CancellationToken that aborts a running sequence.
+            target_window: Window that must have focus before keys are injected,
+                e.g. the one the search window was shown for. None injects at once.
+        """
+        if token is None:
+            token = CancellationToken()
         try:
-            if not isinstance(hotkey_data, dict):
+            if not isinstance(hotkey_data, HotkeyEntry):
                 raise ValueError("Invalid hotkey data format")
 
             # Handle run file action
-            if 'run' in hotkey_data:
-                run_path = hotkey_data['run']
+            if hotkey_data.kind == KIND_RUN:
+                run_path = hotkey_data.run
                 print(f"[DEBUG] Running file: {run_path}")
                 if not os.path.exists(run_path):
                     print(f"[DEBUG] Error: file not found: {run_path}")
                     return
-                os.startfile(run_path)
+                self.backend.open_file(run_path)
+                return
+
+            # Per-app profile from the JSON metadata, else the configured default
+            profile = get_timing_profile(hotkey_data.timing, self.default_timing.name)
+
+            # The popup was just hidden; keys must not reach it or a window in between
+            if not self._wait_for_focus(target_window, token):
                 return
 
             # Handle new format with array of actions
-            if 'hotkeys' in hotkey_data and isinstance(hotkey_data['hotkeys'], list):
-                print(f"[DEBUG] Executing hotkey sequence for: {hotkey_data['name']}")
-                # Reset abort flag at start of sequence
-                self.abort_sequence = False
-                
-                # Setup abort listener for the main hotkey if it exists
-                main_hotkey = hotkey_data['hotkeys'][0].get('hotkey')
+            if hotkey_data.kind == KIND_SEQUENCE:
+                print(f"[DEBUG] Executing hotkey sequence for: {hotkey_data.name}")
+
+                # Esc and the main hotkey abort the sequence. They are only watched
+                # while it runs, so idle keystrokes never pass through Python.
+                abort_hotkeys = ['esc']
+                main_hotkey = hotkey_data.actions[0].hotkey if hotkey_data.actions else None
                 if main_hotkey:
-                    # Split the hotkey into individual keys
-                    keys = main_hotkey.lower().split('+')
-                    # Create a hotkey combination for abort
-                    keyboard.add_hotkey('+'.join(keys), self._abort_sequence_callback)
-                
-                try:
-                    for action in hotkey_data['hotkeys']:
-                        if self.abort_sequence:
+                    abort_hotkeys.append(main_hotkey)
+                with AbortKeyWatcher(token, abort_hotkeys, self.backend) as watcher:
+                    # Every step runs at a deadline measured from the sequence start,
+                    # so sleeps and key pauses do not add up to drift
+                    scheduler = DeadlineScheduler(token)
+                    for action in hotkey_data.actions:
+                        if token.cancelled:
                             print("[DEBUG] Sequence aborted by user")
                             break
-                            
-                        if 'sleep' in action:
-                            time.sleep(action['sleep'] / 1000)  # Convert milliseconds to seconds
+
+                        if action.sleep is not None:
+                            # Convert milliseconds to seconds
+                            scheduler.advance(action.sleep / 1000)
+                            continue
+
+                        # Invalid steps were reported when the hotkeys were loaded
+                        if action.plan is None:
+                            print(f"[DEBUG] Skipping invalid hotkey: {action.hotkey}")
                             continue
-                        
-                        if 'hotkey' not in action:
+
+                        # Wait for the step's deadline; wakes up early when aborted
+                        if scheduler.wait():
                             continue
+                        scheduler.mark(action.hotkey)
 
                         # Execute single hotkey
-                        self._execute_single_hotkey(action['hotkey'].lower())
-                finally:
-                    # Remove the main hotkey listener if it was set
-                    if main_hotkey:
-                        keyboard.remove_hotkey('+'.join(keys))
-                    # Reset abort flag after sequence
-                    self.abort_sequence = False
+                        self._play_plan(action.plan, profile, scheduler.sleep, watcher)
+                    print(f"[DEBUG] Sequence timing: {scheduler.report()}")
                 return
 
             # Handle old format with single hotkey
-            if 'hotkey' not in hotkey_data:
-                raise ValueError("Invalid hotkey data format - missing hotkey")
+            if hotkey_data.plan is None:
+                print(f"[DEBUG] Invalid hotkey combination: {hotkey_data.hotkey}")
+                return
 
             # Execute single hotkey
-            hotkey = hotkey_data['hotkey'].lower()
-            print(f"[DEBUG] Executing hotkey: {hotkey}")
-            self._execute_single_hotkey(hotkey)
+            print(f"[DEBUG] Executing hotkey: {hotkey_data.plan.hotkey} ({profile.name} timing)")
+            self._play_plan(hotkey_data.plan, profile)
 
         except Exception as e:
             print(f"[DEBUG] Error executing hotkey: {e}")
 
-    def _execute_single_hotkey(self, hotkey):
-        """Execute a single hotkey combination."""
+    def _wait_for_focus(self, target_window, token):
+        """Wait until target_window is the foreground window, at most focus_timeout seconds.
+
+        Asks for the window to be activated once if the system gave focus to
+        another window when the popup was hidden. Times out with a debug
+        message and lets the keys go to whatever window has focus then.
+
+        Returns:
+            bool: False if the job was cancelled while waiting.
+        """
+        if not target_window:
+            return True
+        start = time.perf_counter()
+        deadline = start + self.focus_timeout
+        requested = False
+        while self.backend.get_foreground_window() != target_window:
+            if not requested:
+                requested = True
+                try:
+                    self.backend.set_foreground_window(target_window)
+                except Exception as e:
+                    print(f"[DEBUG] Could not activate target window: {e}")
+                continue
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                print(f"[DEBUG] Target window did not regain focus within {self.focus_timeout * 1000:.0f} ms")
+                return True
+            if token.wait(min(self.FOCUS_POLL_INTERVAL, remaining)):
+                return False
+        if requested:
+            print(f"[DEBUG] Target window focused after {(time.perf_counter() - start) * 1000:.1f} ms")
+        return True
+
+    def _play_plan(self, plan, profile, sleep=None, watcher=None):
+        """Replay the press/release steps of a compiled hotkey.
+
+        Args:
+            plan: The ActionPlan to replay.
+            profile: TimingProfile for the pauses between key events.
+            sleep: Optional sleep callable, e.g. DeadlineScheduler.sleep within sequences.
+            watcher: AbortKeyWatcher of the running sequence, told to ignore our own key events.
+        """
         try:
-            # Special case for standalone semicolon
-            if hotkey == ';':
-                # For German keyboard, semicolon is shift+comma
-                keyboard.press('shift')
-                keyboard.press(',')
-                time.sleep(0.05)
-                keyboard.release(',')
-                keyboard.release('shift')
-                print("[DEBUG] Hotkey executed successfully")
-                return
-                
-            # Split and handle special case for '+' key
-            if '++' in hotkey:
-                # Handle ctrl++ case
-                parts = hotkey.split('++')
-                keys = parts[0].split('+') + ['+']  # Add '+' as the final key
-            else:
-                # Normal case
-                keys = hotkey.split('+')
-            
-            # Clean up keys and filter out empty strings
-            keys = [key.strip() for key in keys if key.strip()]
-            
-            # Map key aliases to standard forms, but preserve '?' key
-            keys = [k if k == '?' else KEY_ALIASES.get(k, k) for k in keys]
-            
-            # Validate keys before execution
+            if watcher is not None:
+                watcher.injecting = True
             try:
-                self._validate_keys(keys)
-            except ValueError as e:
-                print(f"[DEBUG] Invalid hotkey combination: {e}")
-                return
-            
-            # Get the foreground window
-            foreground_window = win32gui.GetForegroundWindow()
-            
-            # Check if last key is a mouse wheel action
-            last_key = keys[-1]
-            if last_key in self.mouse_actions:
-                # Press all modifier keys
-                modifiers = []
-                for key in keys[:-1]:  # All except last key
-                    # Handle Windows key specifically
-                    if key == 'win':
-                        keyboard.press('windows')  # Use 'windows' instead of 'win'
-                    else:
-                        keyboard.press(key)
-                    modifiers.append(key)
-                    time.sleep(0.05)  # Small delay between key presses
-
-                # Simulate mouse wheel
-                mouse.wheel(self.mouse_actions[last_key])
-                time.sleep(0.05)
-
-                # Release modifiers in reverse order
-                for key in reversed(modifiers):
-                    # Handle Windows key specifically
-                    if key == 'win':
-                        keyboard.release('windows')  # Use 'windows' instead of 'win'
-                    else:
-                        keyboard.release(key)
-                    time.sleep(0.05)
-            else:
-                # Handle regular keyboard shortcuts
-                modifiers = []
-                for key in keys[:-1]:  # All except last key
-                    # Handle Windows key specifically
-                    if key == 'win':
-                        keyboard.press('windows')  # Use 'windows' instead of 'win'
-                    else:
-                        keyboard.press(key)
-                    modifiers.append(key)
-                    time.sleep(0.05)  # Small delay between key presses
-                
-                # Press and release the final key
-                if keys[-1] == 'win':
-                    keyboard.press('windows')
-                    time.sleep(0.05)
-                    keyboard.release('windows')
+                backend = self.backend
+                if sleep is None:
+                    play_plan(plan, profile, backend.press_key, backend.release_key, backend.scroll_wheel)
                 else:
-                    # Handle '?' key specially
-                    if keys[-1] == '?':
-                        keyboard.press('shift')
-                        keyboard.press('ß')
-                        time.sleep(0.05)
-                        keyboard.release('ß')
-                        keyboard.release('shift')
-                    # Handle ';' key specially for German keyboard layout
-                    elif keys[-1] == ';':
-                        keyboard.press('shift')
-                        keyboard.press(',')  # Comma key
-                        time.sleep(0.05)
-                        keyboard.release(',')
-                        keyboard.release('shift')
-                    else:
-                        keyboard.press(keys[-1])
-                        time.sleep(0.05)
-                        keyboard.release(keys[-1])
-                
-                # Release modifiers in reverse order
-                for key in reversed(modifiers):
-                    # Handle Windows key specifically
-                    if key == 'win':
-                        keyboard.release('windows')  # Use 'windows' instead of 'win'
-                    else:
-                        keyboard.release(key)
-                    time.sleep(0.05)
-            
-            # Restore our window as foreground
-            win32gui.SetForegroundWindow(foreground_window)
-                
+                    play_plan(plan, profile, backend.press_key, backend.release_key, backend.scroll_wheel, sleep)
+            finally:
+                if watcher is not None:
+                    watcher.injecting = False
+
             print("[DEBUG] Hotkey executed successfully")
-            
+
         except Exception as e:
             print(f"[DEBUG] Error executing hotkey: {e}")
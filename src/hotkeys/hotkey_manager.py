@@ -1,20 +1,21 @@
-"""Module for managing global hotkeys with WinHotkeys library."""
+"""Module for managing global hotkeys through the platform backend."""
 
-from typing import Callable, Dict
-try:
-    from winhotkeys import HotkeyHandler
-except ImportError:
-    # Fallback to local import if needed
-    from hotkey import HotkeyHandler
+from typing import Any, Callable, Dict
+from src.backends import get_backend
 
 
 class HotkeyManager:
-    """Class for managing global hotkeys with WinHotkeys library."""
+    """Class for managing global hotkeys; the Windows backend uses the WinHotkeys library."""
 
-    def __init__(self):
-        """Initialize the hotkey manager."""
+    def __init__(self, backend=None):
+        """Initialize the hotkey manager.
+
+        Args:
+            backend: PlatformBackend that registers the hotkeys (default: get_backend()).
+        """
+        self.backend = backend or get_backend()
         self.registered_callbacks: Dict[str, Callable] = {}
-        self.registered_handlers: Dict[str, HotkeyHandler] = {}
+        self.registered_handlers: Dict[str, Any] = {}
 
     def register_hotkey(self, hotkey: str, callback: Callable) -> None:
         """Register a hotkey with a callback function.
@@ -29,8 +30,7 @@ class HotkeyManager:
             print(f"[DEBUG] Registering hotkey: {hotkey} (mapped to: {mapped_hotkey})")
             
             # Create a hotkey handler
-            handler = HotkeyHandler(mapped_hotkey, callback, suppress=True)
-            handler.start()
+            handler = self.backend.register_hotkey(mapped_hotkey, callback)
             
             # Store handler and callback for reference
             self.registered_handlers[hotkey] = handler
@@ -41,7 +41,7 @@ class HotkeyManager:
             # Continue running even if registration fails
 
     def _map_hotkey(self, hotkey: str) -> str:
-        """Map hotkey to format expected by WinHotkeys.
+        """Map hotkey to the format expected by the backend (WinHotkeys syntax).
         
         Args:
             hotkey (str): The original hotkey string
@@ -73,6 +73,6 @@ class HotkeyManager:
         """Cleanup by stopping all hotkey handlers."""
         try:
             for handler in self.registered_handlers.values():
-                handler.stop()
+                self.backend.unregister_hotkey(handler)
         except Exception as e:
             print(f"[DEBUG] Error during cleanup: {e}")
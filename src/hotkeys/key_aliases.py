@@ -18,6 +18,13 @@ KEY_ALIASES = {
     'pgdown': 'pagedown'
 }
 
+# Modifier names known to the keyboard library (keyboard.all_modifiers)
+MODIFIER_KEYS = frozenset({
+    'alt', 'alt gr', 'ctrl', 'shift', 'windows',
+    'left alt', 'left ctrl', 'left shift', 'left windows',
+    'right alt', 'right ctrl', 'right shift', 'right windows'
+})
+
 # Set of valid keys for validation
 VALID_KEYS = {
     'esc', 'enter', 'tab', 'space', 'backspace', 'delete',
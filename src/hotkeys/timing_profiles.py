@@ -0,0 +1,50 @@
+"""Named timing profiles for key injection."""
+from .action_plan import DELAY_PRESS, DELAY_HOLD, DELAY_RELEASE
+
+DEFAULT_PROFILE = 'safe'
+
+
+class TimingProfile:
+    """Pauses in seconds after modifier presses, while holding the final key and after modifier releases."""
+
+    __slots__ = ('name', 'delays')
+
+    def __init__(self, name, press_delay, hold_delay, release_delay):
+        self.name = name
+        self.delays = {
+            DELAY_PRESS: press_delay,
+            DELAY_HOLD: hold_delay,
+            DELAY_RELEASE: release_delay,
+        }
+
+    @property
+    def batched(self):
+        """True if all events are sent back to back without any pause."""
+        return not any(self.delays.values())
+
+    def delay_for(self, delay):
+        """Return the pause in seconds for a PlanStep delay tag."""
+        return self.delays.get(delay, 0) if delay else 0
+
+    def __repr__(self):
+        return f"TimingProfile({self.name!r})"
+
+
+TIMING_PROFILES = {
+    # 50 ms everywhere: works with every application tested so far
+    'safe': TimingProfile('safe', 0.05, 0.05, 0.05),
+    # Short pauses for applications that read input quickly
+    'fast': TimingProfile('fast', 0.01, 0.02, 0.01),
+    # No pauses at all; all events are sent in one burst
+    'batched': TimingProfile('batched', 0, 0, 0),
+}
+
+
+def get_timing_profile(name, default=DEFAULT_PROFILE):
+    """Return the profile with the given name, falling back to default for unknown names."""
+    if name:
+        profile = TIMING_PROFILES.get(str(name).lower())
+        if profile is not None:
+            return profile
+        print(f"[DEBUG] Unknown timing profile '{name}', using '{default}'")
+    return TIMING_PROFILES.get(default, TIMING_PROFILES[DEFAULT_PROFILE])
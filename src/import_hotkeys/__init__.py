@@ -1,17 +1,20 @@
-"""Import hotkeys package for extracting keyboard shortcuts from web pages."""
+"""Import hotkeys package for extracting keyboard shortcuts from web pages.
 
-from .web.ChromeWebCrawler import ChromeWebCrawler
-from .web.content_cleaner import ContentCleaner
-from .openai.api_client import OpenAIClient
-from .openai.prompt_builder import PromptBuilder
-from .data.config_loader import ConfigLoader
-from .data.json_writer import JsonWriter
+The classes below are imported on first access, so importing the package
+or one of its light modules does not load selenium, openai or BeautifulSoup.
+"""
+from ._lazy import lazy_exports
 
-__all__ = [
-    'ChromeWebCrawler',
-    'ContentCleaner',
-    'OpenAIClient',
-    'PromptBuilder',
-    'ConfigLoader',
-    'JsonWriter'
-]
+_EXPORTS = {
+    'ChromeWebCrawler': '.web.ChromeWebCrawler',
+    'ContentCleaner': '.web.content_cleaner',
+    'OpenAIClient': '.openai.api_client',
+    'PromptBuilder': '.openai.prompt_builder',
+    'ConfigLoader': '.data.config_loader',
+    'JsonWriter': '.data.json_writer',
+    'BatchImporter': '.batch',
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -13,6 +13,7 @@ from src.import_hotkeys.openai.api_client import OpenAIClient
 from src.import_hotkeys.openai.prompt_builder import PromptBuilder
 from src.import_hotkeys.data.config_loader import ConfigLoader
 from src.import_hotkeys.data.json_writer import JsonWriter
+from src.import_hotkeys.batch import run_batch
 
 
 def parse_arguments() -> argparse.Namespace:
@@ -44,9 +45,40 @@ def parse_arguments() -> argparse.Namespace:
         '--window-title',
         help='Window title pattern to match'
     )
+    parser.add_argument(
+        '--batch',
+        metavar='MANIFEST',
+        help='Import all jobs of a JSON manifest without prompting'
+    )
+    parser.add_argument(
+        '--overwrite',
+        action='store_true',
+        help='With --batch, replace existing hotkey files instead of skipping the job'
+    )
+    parser.add_argument(
+        '--fetch-workers',
+        type=int,
+        default=2,
+        help='With --batch, number of pages fetched at the same time'
+    )
+    parser.add_argument(
+        '--clean-workers',
+        type=int,
+        help='With --batch, number of processes cleaning HTML (defaults to the number of CPUs)'
+    )
+    parser.add_argument(
+        '--extract-workers',
+        type=int,
+        default=4,
+        help='With --batch, number of OpenAI requests running at the same time'
+    )
     
     # Parse known args first to handle optional arguments
     args, _ = parser.parse_known_args()
+
+    # The manifest provides everything in batch mode
+    if args.batch:
+        return args
     
     # Prompt for missing arguments
     if not args.name:
@@ -61,11 +93,42 @@ def parse_arguments() -> argparse.Namespace:
     return args
 
 
+def get_api_key(config_loader: ConfigLoader) -> str:
+    """Return the OpenAI API key, or exit with instructions if it is not configured.
+
+    Args:
+        config_loader (ConfigLoader): Loader of settings.ini.
+
+    Returns:
+        str: The OpenAI API key.
+    """
+    api_key = config_loader.get_openai_key()
+    if not api_key:
+        print("Error: OpenAI API key not found in settings.ini")
+        print("Please add your API key to the [OpenAI] section:")
+        print("api_key = your_key_here")
+        sys.exit(1)
+    return api_key
+
+
 def main() -> None:
     """Main function to run the hotkey import process."""
     try:
         # Parse command line arguments
         args = parse_arguments()
+
+        if args.batch:
+            config_loader = ConfigLoader()
+            succeeded = run_batch(
+                args.batch,
+                get_api_key(config_loader),
+                config_loader.get_chromium_driver_path(),
+                fetch_workers=args.fetch_workers,
+                clean_workers=args.clean_workers,
+                extract_workers=args.extract_workers,
+                overwrite=args.overwrite
+            )
+            sys.exit(0 if succeeded else 1)
         
         # Construct output path and check for file existence early
         app_dir = Path('data/hotkeys') / args.name
@@ -100,12 +163,7 @@ def main() -> None:
 
         # Initialize components
         config_loader = ConfigLoader()
-        api_key = config_loader.get_openai_key()
-        if not api_key:
-            print("Error: OpenAI API key not found in settings.ini")
-            print("Please add your API key to the [OpenAI] section:")
-            print("api_key = your_key_here")
-            sys.exit(1)
+        api_key = get_api_key(config_loader)
 
         # Get Chrome driver path from settings if available
         driver_path = config_loader.get_chromium_driver_path()
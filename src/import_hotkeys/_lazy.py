@@ -0,0 +1,28 @@
+"""Lazy attribute exports for packages with heavy optional dependencies."""
+import sys
+from importlib import import_module
+
+
+def lazy_exports(module_name, mapping):
+    """Build module-level __getattr__ and __dir__ that import exports on first access.
+
+    Args:
+        module_name: __name__ of the package, used to resolve relative modules.
+        mapping: {exported name: module that defines it, e.g. '.web.content_cleaner'}.
+
+    Returns:
+        tuple: (__getattr__, __dir__) to assign in the package.
+    """
+    def __getattr__(name):
+        module = mapping.get(name)
+        if module is None:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+        value = getattr(import_module(module, module_name), name)
+        # Later lookups find the attribute without going through __getattr__
+        setattr(sys.modules[module_name], name, value)
+        return value
+
+    def __dir__():
+        return sorted(set(vars(sys.modules[module_name])) | set(mapping))
+
+    return __getattr__, __dir__
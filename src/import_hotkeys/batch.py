@@ -0,0 +1,326 @@
+"""Module for importing the hotkeys of many applications from a manifest.
+
+The manifest is a JSON list of jobs (or an object with a "jobs" list):
+
+    [
+        {"app": "code", "url": "https://code.visualstudio.com/docs/getstarted/keybindings"},
+        {"app": "chrome", "url": "https://support.google.com/chrome/answer/157179",
+         "filename": "chrome_tabs", "prefix": "Tabs", "window_title": ""}
+    ]
+
+Every job passes through three stages: fetching the page with Chrome,
+cleaning the HTML and extracting the hotkeys with OpenAI. The stages run
+concurrently for different jobs, each with its own number of workers.
+Cleaning runs in worker processes because parsing HTML is CPU bound;
+fetching and extracting wait on the browser and the network and run in
+threads.
+"""
+
+import json
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from typing import Any, List, Optional, Tuple
+from bs4 import BeautifulSoup
+
+from src.import_hotkeys.web.ChromeWebCrawler import ChromeWebCrawler
+from src.utils.StringUtils import StringUtils
+from src.import_hotkeys.web.content_cleaner import ContentCleaner
+from src.import_hotkeys.openai.api_client import OpenAIClient
+from src.import_hotkeys.openai.prompt_builder import PromptBuilder
+from src.import_hotkeys.data.json_writer import JsonWriter
+
+STAGE_FETCH = 'fetch'
+STAGE_CLEAN = 'clean'
+STAGE_EXTRACT = 'extract'
+STAGES = (STAGE_FETCH, STAGE_CLEAN, STAGE_EXTRACT)
+
+STATUS_PENDING = 'pending'
+STATUS_DONE = 'done'
+STATUS_SKIPPED = 'skipped'
+STATUS_FAILED = 'failed'
+
+MANIFEST_FIELDS = ('app', 'url', 'filename', 'prefix', 'window_title')
+
+
+class ImportJob:
+    """One application page to import, with its progress."""
+
+    def __init__(self, number: int, app: str, url: str, filename: Optional[str] = None,
+                 prefix: str = "", window_title: str = ""):
+        """Initialize the job.
+
+        Args:
+            number (int): Position of the job in the manifest, starting at 1.
+            app (str): Name of the application (used for directory name).
+            url (str): URL of the webpage containing hotkeys.
+            filename (Optional[str], optional): Name for the output JSON file.
+                Defaults to the app name.
+            prefix (str, optional): Prefix to add to all hotkey names.
+            window_title (str, optional): Window title pattern to match.
+        """
+        self.number = number
+        self.app = app
+        self.url = url
+        self.filename = filename or app
+        self.prefix = prefix or ""
+        self.window_title = window_title or ""
+        self.status = STATUS_PENDING
+        self.error = None
+        self.durations = {}  # stage -> seconds of work
+        self.hotkey_count = 0
+        self.output_path = None
+
+    @property
+    def label(self) -> str:
+        """Short name of the job for progress output."""
+        return self.app if self.filename == self.app else f"{self.app}/{self.filename}"
+
+
+def load_manifest(path: str) -> List[ImportJob]:
+    """Read the jobs of a manifest file.
+
+    Args:
+        path (str): Path of the JSON manifest.
+
+    Returns:
+        List[ImportJob]: The jobs in manifest order.
+
+    Raises:
+        ValueError: If the manifest is not valid.
+    """
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except OSError as e:
+        raise ValueError(f"Cannot read manifest {path}: {e}")
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Manifest {path} is not valid JSON: {e}")
+
+    if isinstance(data, dict):
+        data = data.get('jobs')
+    if not isinstance(data, list):
+        raise ValueError("Manifest must be a list of jobs or an object with a 'jobs' list")
+
+    jobs = []
+    for number, entry in enumerate(data, 1):
+        if not isinstance(entry, dict):
+            raise ValueError(f"Job {number} must be an object")
+        unknown = sorted(set(entry) - set(MANIFEST_FIELDS))
+        if unknown:
+            raise ValueError(f"Job {number} has unknown fields: {', '.join(unknown)}")
+        for field, value in entry.items():
+            if value is not None and not isinstance(value, str):
+                raise ValueError(f"Job {number}: '{field}' must be a string")
+        missing = [field for field in ('app', 'url') if not (entry.get(field) or '').strip()]
+        if missing:
+            raise ValueError(f"Job {number} is missing: {', '.join(missing)}")
+        fields = {field: value.strip() for field, value in entry.items() if value is not None}
+        jobs.append(ImportJob(number, **fields))
+    return jobs
+
+
+def fetch_page(url: str, driver_path: Optional[str] = None) -> str:
+    """Fetch the HTML of a page with a Chrome driver of its own.
+
+    Args:
+        url (str): URL of the webpage.
+        driver_path (Optional[str], optional): Path of the Chrome driver.
+
+    Returns:
+        str: The page HTML.
+
+    Raises:
+        Exception: If the page could not be fetched.
+    """
+    with ChromeWebCrawler(driver_path) as crawler:
+        result = crawler.execute(url)
+    if not result['success']:
+        raise Exception("Failed to fetch webpage content")
+    return result['text']
+
+
+def clean_html(html: str) -> str:
+    """Reduce fetched HTML to the text sent to OpenAI. Runs in a worker process.
+
+    Args:
+        html (str): The page HTML.
+
+    Returns:
+        str: Cleaned content, or the text without tags if cleaning found nothing.
+    """
+    cleaned_content = ContentCleaner().clean(BeautifulSoup(html, 'html.parser'))
+    return cleaned_content or StringUtils.strip_html_tags(html)
+
+
+def _timed(function, *args) -> Tuple[Any, float]:
+    """Call function and return (result, seconds), measured inside the worker."""
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+class BatchImporter:
+    """Class for running import jobs through the concurrent fetch/clean/extract pipeline."""
+
+    def __init__(self, api_key: str, driver_path: Optional[str] = None, fetch_workers: int = 2,
+                 clean_workers: Optional[int] = None, extract_workers: int = 4, overwrite: bool = False):
+        """Initialize the BatchImporter.
+
+        Args:
+            api_key (str): OpenAI API key.
+            driver_path (Optional[str], optional): Path of the Chrome driver.
+            fetch_workers (int, optional): Chrome windows open at the same time.
+            clean_workers (Optional[int], optional): Processes cleaning HTML.
+                Defaults to the number of CPUs.
+            extract_workers (int, optional): OpenAI requests running at the same time.
+            overwrite (bool, optional): Replace existing hotkey files instead of skipping the job.
+        """
+        self.driver_path = driver_path
+        self.fetch_workers = max(1, fetch_workers)
+        self.clean_workers = max(1, clean_workers) if clean_workers else None
+        self.extract_workers = max(1, extract_workers)
+        self.overwrite = overwrite
+        self.cleaner = ContentCleaner()
+        self.prompt_builder = PromptBuilder()
+        self.openai_client = OpenAIClient(api_key)
+        self.json_writer = JsonWriter()
+        self._total = 0
+
+    def _progress(self, job: ImportJob, message: str) -> None:
+        """Print one progress line of a job."""
+        print(f"[{job.number}/{self._total}] {job.label}: {message}")
+
+    def _skip_existing(self, jobs: List[ImportJob]) -> None:
+        """Skip jobs whose file exists, and jobs writing the same file as an earlier one."""
+        claimed = {}
+        for job in jobs:
+            output_path = self.json_writer.get_output_path(job.app, job.filename)
+            if output_path in claimed:
+                job.status = STATUS_FAILED
+                job.error = f"same output file as job {claimed[output_path].number}"
+            elif output_path.exists() and not self.overwrite:
+                job.status = STATUS_SKIPPED
+                job.error = f"{output_path} exists (use --overwrite)"
+            claimed.setdefault(output_path, job)
+            if job.status != STATUS_PENDING:
+                self._progress(job, f"{job.status}: {job.error}")
+
+    def _extract(self, job: ImportJob, content: str) -> Tuple[str, int]:
+        """Extract the hotkeys of cleaned content and save them. Runs in an extract thread."""
+        prompt = self.prompt_builder.build_extraction_prompt(content)
+        # The name also keys the saved raw response, so keep the files of one app apart
+        hotkeys = self.openai_client.extract_hotkeys(prompt, job.label.replace('/', '_'))
+        output_path = self.json_writer.save_hotkeys(
+            job.app,
+            hotkeys,
+            filename=job.filename,
+            url=job.url,
+            prefix=job.prefix,
+            window_title=job.window_title
+        )
+        return output_path, len(hotkeys)
+
+    def run(self, jobs: List[ImportJob]) -> List[ImportJob]:
+        """Run the jobs; a failing job does not stop the others.
+
+        Args:
+            jobs (List[ImportJob]): Jobs from load_manifest().
+
+        Returns:
+            List[ImportJob]: The same jobs with status, error, durations and output path.
+        """
+        self._total = len(jobs)
+        self._skip_existing(jobs)
+        pending = {}  # future -> (job, stage)
+
+        with ThreadPoolExecutor(self.fetch_workers, thread_name_prefix='fetch') as fetch_pool, \
+                ProcessPoolExecutor(self.clean_workers) as clean_pool, \
+                ThreadPoolExecutor(self.extract_workers, thread_name_prefix='extract') as extract_pool:
+            for job in jobs:
+                if job.status == STATUS_PENDING:
+                    pending[fetch_pool.submit(_timed, fetch_page, job.url, self.driver_path)] = (job, STAGE_FETCH)
+
+            try:
+                # Hand each finished stage to the next pool as soon as it is done
+                while pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        job, stage = pending.pop(future)
+                        try:
+                            result, seconds = future.result()
+                        except Exception as e:
+                            job.status = STATUS_FAILED
+                            job.error = f"{stage}: {e}"
+                            self._progress(job, f"failed in {stage}: {e}")
+                            continue
+                        job.durations[stage] = seconds
+
+                        if stage == STAGE_FETCH:
+                            self._progress(job, f"fetched in {seconds:.1f} s")
+                            self.cleaner.save_html(result, job.app, job.filename)
+                            pending[clean_pool.submit(_timed, clean_html, result)] = (job, STAGE_CLEAN)
+                        elif stage == STAGE_CLEAN:
+                            self._progress(job, f"cleaned in {seconds:.1f} s")
+                            pending[extract_pool.submit(_timed, self._extract, job, result)] = (job, STAGE_EXTRACT)
+                        else:
+                            job.output_path, job.hotkey_count = result
+                            job.status = STATUS_DONE
+                            self._progress(job, f"{job.hotkey_count} hotkeys saved to {job.output_path}")
+            except KeyboardInterrupt:
+                # Drop queued work; the pools still wait for the running stages
+                for future in pending:
+                    future.cancel()
+                raise
+
+        return jobs
+
+
+def format_summary(jobs: List[ImportJob], elapsed: float) -> str:
+    """Format a table with the outcome and stage durations of every job.
+
+    Args:
+        jobs (List[ImportJob]): Jobs returned by BatchImporter.run().
+        elapsed (float): Seconds the whole batch took.
+
+    Returns:
+        str: The summary.
+    """
+    counts = {status: 0 for status in (STATUS_DONE, STATUS_SKIPPED, STATUS_FAILED)}
+    width = max([len(job.label) for job in jobs] + [3])
+    lines = [f"{'job':{width}}  {'status':8}{'hotkeys':>8}" + ''.join(f"{stage:>9}" for stage in STAGES)]
+    for job in jobs:
+        counts[job.status] = counts.get(job.status, 0) + 1
+        durations = ''.join(
+            f"{job.durations[stage]:>8.1f}s" if stage in job.durations else f"{'-':>9}" for stage in STAGES
+        )
+        hotkeys = str(job.hotkey_count) if job.status == STATUS_DONE else '-'
+        line = f"{job.label:{width}}  {job.status:8}{hotkeys:>8}{durations}"
+        if job.error:
+            line += f"  {job.error}"
+        lines.append(line)
+    lines.append(
+        f"{len(jobs)} jobs in {elapsed:.1f} s: {counts[STATUS_DONE]} imported, "
+        f"{counts[STATUS_SKIPPED]} skipped, {counts[STATUS_FAILED]} failed"
+    )
+    return '\n'.join(lines)
+
+
+def run_batch(manifest_path: str, api_key: str, driver_path: Optional[str] = None,
+              fetch_workers: int = 2, clean_workers: Optional[int] = None,
+              extract_workers: int = 4, overwrite: bool = False) -> bool:
+    """Import all jobs of a manifest and print progress and a summary.
+
+    Returns:
+        bool: True if no job failed.
+
+    Raises:
+        ValueError: If the manifest is not valid.
+    """
+    jobs = load_manifest(manifest_path)
+    print(f"Importing {len(jobs)} jobs from {manifest_path}")
+    start = time.perf_counter()
+    importer = BatchImporter(api_key, driver_path, fetch_workers, clean_workers, extract_workers, overwrite)
+    importer.run(jobs)
+    print()
+    print(format_summary(jobs, time.perf_counter() - start))
+    return all(job.status != STATUS_FAILED for job in jobs)
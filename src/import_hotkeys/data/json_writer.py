@@ -37,14 +37,8 @@ class JsonWriter:
             Exception: If failed to write the JSON file.
         """
         try:
-            # Clean the app name for directory
-            clean_name = self._clean_filename(name)
-            app_dir = self.output_dir / clean_name
-            app_dir.mkdir(parents=True, exist_ok=True)
-
-            # Clean the filename and create full path
-            clean_filename = self._clean_filename(filename)
-            output_path = app_dir / f"{clean_filename}.json"
+            output_path = self.get_output_path(name, filename)
+            output_path.parent.mkdir(parents=True, exist_ok=True)
 
             # Ensure the data is properly formatted
             validated_hotkeys = self._validate_hotkeys(hotkeys)
@@ -69,6 +63,18 @@ class JsonWriter:
         except Exception as e:
             raise Exception(f"Failed to save hotkeys to JSON: {e}")
 
+    def get_output_path(self, name: str, filename: str = "default") -> Path:
+        """Return the path save_hotkeys() writes an application's file to.
+
+        Args:
+            name (str): Name of the application (used for directory name).
+            filename (str, optional): Name of the JSON file. Defaults to "default".
+
+        Returns:
+            Path: Path of the JSON file.
+        """
+        return self.output_dir / self._clean_filename(name) / f"{self._clean_filename(filename)}.json"
+
     def _clean_filename(self, name: str) -> str:
         """Clean a string to be used as a filename.
 
@@ -1,6 +1,12 @@
 """OpenAI module for extracting hotkeys from webpage content."""
+from .._lazy import lazy_exports
 
-from .api_client import OpenAIClient
-from .prompt_builder import PromptBuilder
+# The openai SDK loads only with OpenAIClient
+_EXPORTS = {
+    'OpenAIClient': '.api_client',
+    'PromptBuilder': '.prompt_builder',
+}
 
-__all__ = ['OpenAIClient', 'PromptBuilder']
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
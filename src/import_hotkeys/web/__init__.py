@@ -1,6 +1,12 @@
 """Web module for fetching and cleaning webpage content."""
+from .._lazy import lazy_exports
 
-from .ChromeWebCrawler import ChromeWebCrawler
-from .content_cleaner import ContentCleaner
+# selenium loads only with ChromeWebCrawler
+_EXPORTS = {
+    'ChromeWebCrawler': '.ChromeWebCrawler',
+    'ContentCleaner': '.content_cleaner',
+}
 
-__all__ = ['ChromeWebCrawler', 'ContentCleaner']
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -1,69 +1,85 @@
-import win32gui
-import win32process
-import psutil
 import os
+from src.backends import get_backend
 
 class ProcessManager:
-    def __init__(self):
-        """Initialize the process manager."""
+    # Upper bound of cached window -> name entries before the cache is pruned
+    MAX_CACHED_WINDOWS = 256
+
+    def __init__(self, backend=None):
+        """Initialize the process manager.
+
+        Args:
+            backend: PlatformBackend for window and process queries (default: get_backend()).
+        """
+        self.backend = backend or get_backend()
         self.last_window = None
         self.last_process = None
-    
-    def get_active_window_process(self):
-        """Get the process name of the currently active window."""
+        # (hwnd, pid) -> process name. A window dies with its process, so as long as the
+        # backend still reports pid as the owner of hwnd, the process is the same one.
+        self._name_cache = {}
+
+    def get_active_window_context(self):
+        """Resolve the foreground window in one pass.
+
+        Returns:
+            dict: 'hwnd', 'pid', 'name' (lowercase process name without
+            extension), 'title' (window title) and 'rect' (dict with x, y,
+            width and height), or None if there is no usable foreground window.
+        """
         try:
             # Get foreground window handle
-            hwnd = win32gui.GetForegroundWindow()
+            hwnd = self.backend.get_foreground_window()
             if not hwnd:
                 print("[DEBUG] No foreground window found")
                 return None
-                
+
             # Get process ID from window handle
-            _, pid = win32process.GetWindowThreadProcessId(hwnd)
+            pid = self.backend.get_window_pid(hwnd)
             if not pid:
                 print("[DEBUG] Could not get process ID")
                 return None
-                
-            # Get process name
-            try:
-                process = psutil.Process(pid)
-                process_name = process.name().lower()
-                # Remove extension
-                process_name = os.path.splitext(process_name)[0]
-                return process_name
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                print("[DEBUG] Could not access process")
+
+            name = self._get_process_name(hwnd, pid)
+            if not name:
                 return None
-                
-        except Exception as e:
-            print(f"[DEBUG] Error getting active window process: {e}")
-            return None
-            
-    def get_active_window_position(self):
-        """Get the position and size of the currently active window."""
-        try:
-            # Get foreground window handle
-            hwnd = win32gui.GetForegroundWindow()
-            if not hwnd:
-                print("[DEBUG] No foreground window found")
+
+            rect = self.backend.get_window_rect(hwnd)
+            if not rect:
                 return None
-                
-            # Get window rect
-            try:
-                left, top, right, bottom = win32gui.GetWindowRect(hwnd)
-                width = right - left
-                height = bottom - top
-                
-                return {
+            left, top, right, bottom = rect
+
+            self.last_window = hwnd
+            self.last_process = name
+            return {
+                'hwnd': hwnd,
+                'pid': pid,
+                'name': name,
+                'title': self.backend.get_window_title(hwnd),
+                'rect': {
                     'x': left,
                     'y': top,
-                    'width': width,
-                    'height': height
+                    'width': right - left,
+                    'height': bottom - top
                 }
-            except Exception as e:
-                print(f"[DEBUG] Could not get window rect: {e}")
-                return None
-                
+            }
+
         except Exception as e:
-            print(f"[DEBUG] Error getting window position: {e}")
+            print(f"[DEBUG] Error getting active window context: {e}")
+            return None
+
+    def _get_process_name(self, hwnd, pid):
+        """Return the normalized process name of the window's owner, cached per (hwnd, pid)."""
+        key = (hwnd, pid)
+        name = self._name_cache.get(key)
+        if name is not None:
+            return name
+        name = self.backend.get_process_name(pid)
+        if not name:
+            print("[DEBUG] Could not access process")
             return None
+        # Remove extension
+        name = os.path.splitext(name.lower())[0]
+        if len(self._name_cache) >= self.MAX_CACHED_WINDOWS:
+            self._name_cache.clear()
+        self._name_cache[key] = name
+        return name
@@ -0,0 +1,211 @@
+"""Single-instance control over a local pipe.
+
+The first process becomes the resident instance: it owns the global hotkey
+and listens on a named pipe (a Unix socket outside Windows). Later launches
+connect, forward their command and exit without starting Tk. Connections
+are authenticated with a random key that the resident instance writes to
+a file only the current user can read.
+"""
+import getpass
+import os
+import re
+import sys
+import tempfile
+import threading
+import time
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client, Listener
+from pathlib import Path
+
+COMMAND_PING = 'ping'
+COMMAND_SHOW = 'show'
+COMMAND_TOGGLE = 'toggle'
+COMMAND_RELOAD = 'reload'
+COMMAND_SEARCH = 'search'
+COMMANDS = (COMMAND_PING, COMMAND_SHOW, COMMAND_TOGGLE, COMMAND_RELOAD, COMMAND_SEARCH)
+
+# Next to the other data files, whatever the working directory of the launch
+DEFAULT_KEY_FILE = str(Path(__file__).resolve().parents[2] / 'data' / 'instance.key')
+
+# A pipe of a crashed instance can outlive it briefly; retry claiming it this long
+CLAIM_TIMEOUT = 2.0
+
+
+def instance_address():
+    """Return (address, family) of the resident instance of the current user."""
+    user = re.sub(r'[^A-Za-z0-9_.-]', '_', getpass.getuser())
+    if sys.platform == 'win32':
+        return rf'\\.\pipe\FastHotkeyExecuter-{user}', 'AF_PIPE'
+    return os.path.join(tempfile.gettempdir(), f'FastHotkeyExecuter-{user}.sock'), 'AF_UNIX'
+
+
+def _read_key(key_file):
+    try:
+        with open(key_file, 'rb') as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def _instance_running(address, family, key_file):
+    """Return True if a live process listens on the instance address.
+
+    A listener that rejects the key still counts: it is running, just with
+    another key file.
+    """
+    authkey = _read_key(key_file) or os.urandom(32)
+    try:
+        with Client(address, family, authkey=authkey) as connection:
+            connection.send({'command': COMMAND_PING, 'text': None})
+            connection.recv()
+        return True
+    except AuthenticationError:
+        return True
+    except (OSError, EOFError):
+        return False
+
+
+def send_command(command, text=None, key_file=DEFAULT_KEY_FILE):
+    """Forward a command to the resident instance.
+
+    Returns:
+        dict: The reply, e.g. {'ok': True}, or None if no instance is running.
+    """
+    authkey = _read_key(key_file)
+    if not authkey:
+        return None
+    address, family = instance_address()
+    try:
+        with Client(address, family, authkey=authkey) as connection:
+            connection.send({'command': command, 'text': text})
+            return connection.recv()
+    except (OSError, EOFError):
+        # No listener (or a stale socket file): there is no resident instance
+        return None
+    except AuthenticationError:
+        print("[DEBUG] Resident instance rejected the instance key")
+        return None
+
+
+class InstanceServer:
+    """Listens for commands of later launches and passes them to a handler."""
+
+    def __init__(self, handler, key_file=DEFAULT_KEY_FILE):
+        """Initialize the server.
+
+        Args:
+            handler: Callable(command, text) returning True if the command was
+                accepted. Called on the listener thread.
+            key_file: File receiving the authentication key for clients.
+        """
+        self.handler = handler
+        self.key_file = key_file
+        self._listener = None
+        self._thread = None
+
+    def start(self):
+        """Claim the instance address and start listening.
+
+        An address left behind by a process that did not exit cleanly is
+        taken over: a stale socket file is removed, a stale pipe is retried
+        until the system releases it.
+
+        Returns:
+            bool: False if another process already owns the address or the
+                key file cannot be written safely.
+        """
+        address, family = instance_address()
+        authkey = os.urandom(32)
+        deadline = time.monotonic() + CLAIM_TIMEOUT
+        while True:
+            if family == 'AF_UNIX' and os.path.exists(address):
+                if _instance_running(address, family, self.key_file):
+                    return False
+                # Left behind by a process that did not exit cleanly
+                try:
+                    os.unlink(address)
+                except OSError:
+                    # Reported by the Listener below
+                    pass
+            try:
+                # The first pipe instance is exclusive, so a concurrent start fails here
+                self._listener = Listener(address, family, authkey=authkey)
+                break
+            except OSError as e:
+                if _instance_running(address, family, self.key_file) or time.monotonic() > deadline:
+                    print(f"[DEBUG] Could not claim the instance address: {e}")
+                    return False
+                print(f"[DEBUG] Instance address is stale, retrying: {e}")
+                time.sleep(0.1)
+
+        try:
+            self._write_key(authkey)
+        except OSError as e:
+            print(f"[ERROR] Could not write the instance key: {e}")
+            self.stop()
+            return False
+
+        self._thread = threading.Thread(target=self._run, name='InstanceServer', daemon=True)
+        self._thread.start()
+        return True
+
+    def _write_key(self, authkey):
+        """Write the key to a new file only the current user can read.
+
+        Raises:
+            OSError: If the file cannot be created or ends up accessible to others.
+        """
+        directory = os.path.dirname(self.key_file)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # A file left by an earlier run keeps its mode (and may be a link); start over
+        try:
+            os.unlink(self.key_file)
+        except FileNotFoundError:
+            pass
+        descriptor = os.open(self.key_file, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with os.fdopen(descriptor, 'wb') as f:
+            # Windows has no mode bits for other users; the data directory's ACL applies
+            if sys.platform != 'win32' and os.fstat(f.fileno()).st_mode & 0o077:
+                raise OSError(f"Instance key file is accessible to other users: {self.key_file}")
+            f.write(authkey)
+
+    def stop(self):
+        """Stop listening and remove the key file."""
+        listener, self._listener = self._listener, None
+        if listener is None:
+            return
+        try:
+            listener.close()
+        except OSError:
+            pass
+        try:
+            os.remove(self.key_file)
+        except OSError:
+            pass
+
+    def _run(self):
+        """Accept loop; one short-lived connection per command."""
+        while self._listener is not None:
+            try:
+                connection = self._listener.accept()
+            except AuthenticationError:
+                print("[DEBUG] Rejected an instance connection with a wrong key")
+                continue
+            except EOFError:
+                # The client hung up during the handshake, e.g. a liveness probe
+                continue
+            except OSError:
+                # The listener was closed by stop()
+                return
+            try:
+                with connection:
+                    request = connection.recv()
+                    command = request.get('command') if isinstance(request, dict) else None
+                    if command not in COMMANDS:
+                        connection.send({'ok': False, 'error': f"Unknown command: {command}"})
+                        continue
+                    accepted = command == COMMAND_PING or self.handler(command, request.get('text'))
+                    connection.send({'ok': bool(accepted)})
+            except (OSError, EOFError) as e:
+                print(f"[DEBUG] Instance connection failed: {e}")
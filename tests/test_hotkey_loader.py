@@ -0,0 +1,142 @@
+import json
+import os
+import tempfile
+import unittest
+
+from src.app_modules.hotkey_loader import HotkeyLoader, compile_title_pattern
+from src.app_modules.hotkey_snapshot import scan_app_dir
+
+
+class HotkeyLoaderRefreshTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.data_dir = os.path.join(self._tmp.name, 'hotkeys')
+        self.app_dir = os.path.join(self.data_dir, 'app')
+        os.makedirs(self.app_dir)
+        self._write('good.json', {'hotkeys': [{'name': 'Save', 'hotkey': 'ctrl+s'}]})
+        with open(os.path.join(self.app_dir, 'bad.json'), 'w', encoding='utf-8') as f:
+            f.write('{"hotkeys": [')
+        self.loader = HotkeyLoader(self.data_dir, os.path.join(self._tmp.name, 'hotkeys.snapshot'))
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _write(self, filename, data):
+        with open(os.path.join(self.app_dir, filename), 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+
+    def test_broken_file_is_not_reloaded_until_it_changes(self):
+        self.assertEqual([hotkey.name for hotkey in self.loader.get_hotkeys_for_app('app')], ['Save'])
+        self.assertEqual(self.loader.refresh(), [])
+        self.assertEqual(self.loader.refresh(), [])
+
+    def test_fixed_file_is_reloaded(self):
+        self.loader.get_hotkeys_for_app('app')
+        self._write('bad.json', {'hotkeys': [{'name': 'Open', 'hotkey': 'ctrl+o'}]})
+        self.assertEqual(self.loader.refresh(), ['app'])
+        self.assertEqual(sorted(hotkey.name for hotkey in self.loader.get_hotkeys_for_app('app')), ['Open', 'Save'])
+
+
+
+class HotkeyLoaderSnapshotTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.data_dir = os.path.join(self._tmp.name, 'hotkeys')
+        self.snapshot_file = os.path.join(self._tmp.name, 'hotkeys.snapshot')
+        for app in ('one', 'two'):
+            os.makedirs(os.path.join(self.data_dir, app))
+            with open(os.path.join(self.data_dir, app, 'keys.json'), 'w', encoding='utf-8') as f:
+                json.dump({'hotkeys': [{'name': f'Save {app}', 'hotkey': 'ctrl+s'}]}, f)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_parsed_apps_are_written_once_on_save(self):
+        loader = HotkeyLoader(self.data_dir, self.snapshot_file)
+        loader.get_hotkeys_for_app('one')
+        loader.get_hotkeys_for_app('two')
+        self.assertFalse(os.path.exists(self.snapshot_file))
+        self.assertTrue(loader.snapshot.dirty)
+
+        self.assertTrue(loader.save_snapshot())
+        self.assertFalse(loader.snapshot.dirty)
+        self.assertFalse(loader.save_snapshot())
+
+        reloaded = HotkeyLoader(self.data_dir, self.snapshot_file)
+        for app in ('one', 'two'):
+            signatures = scan_app_dir(os.path.join(self.data_dir, app))
+            self.assertIsNotNone(reloaded.snapshot.load_app(app, signatures))
+            self.assertEqual([hotkey.name for hotkey in reloaded.get_hotkeys_for_app(app)], [f'Save {app}'])
+
+
+class HotkeyLoaderSearchLimitTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.data_dir = os.path.join(self._tmp.name, 'hotkeys')
+        os.makedirs(os.path.join(self.data_dir, 'app'))
+        hotkeys = [{'name': f'Save copy {i}', 'hotkey': f'ctrl+{i}'} for i in range(5)]
+        with open(os.path.join(self.data_dir, 'app', 'keys.json'), 'w', encoding='utf-8') as f:
+            json.dump({'hotkeys': hotkeys}, f)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _loader(self, search_mode):
+        return HotkeyLoader(self.data_dir, os.path.join(self._tmp.name, 'hotkeys.snapshot'), search_mode)
+
+    def test_limit_caps_fuzzy_results(self):
+        self.assertEqual(len(self._loader('fuzzy').search_hotkeys('app', 'save', 2)), 2)
+
+    def test_limit_does_not_cap_substring_results(self):
+        results = self._loader('substring').search_hotkeys('app', 'save', 2)
+        self.assertEqual([hotkey.name for hotkey in results], [f'Save copy {i}' for i in range(5)])
+
+
+class CompileTitlePatternTest(unittest.TestCase):
+    def _matches(self, pattern, title):
+        return compile_title_pattern(pattern).match(title) is not None
+
+    def test_plain_pattern_matches_anywhere_literally(self):
+        self.assertTrue(self._matches('diff', 'main.py - Diff View'))
+        self.assertTrue(self._matches('[Draft]', 'Mail [draft] - Outlook'))
+        self.assertFalse(self._matches('[Draft]', 'Mail d - Outlook'))
+
+    def test_wildcards_match_anywhere(self):
+        self.assertTrue(self._matches('Diff:*', 'Code - Diff: main.py'))
+        self.assertTrue(self._matches('*.py - Code', 'main.py - Code (Admin)'))
+        self.assertTrue(self._matches('v?.0', 'Setup v2.0\nready'))
+        self.assertFalse(self._matches('Diff:*', 'Differences'))
+
+    def test_empty_pattern(self):
+        self.assertIsNone(compile_title_pattern('  '))
+        self.assertIsNone(compile_title_pattern(None))
+
+
+class HotkeyLoaderMalformedEntryTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.data_dir = os.path.join(self._tmp.name, 'hotkeys')
+        os.makedirs(os.path.join(self.data_dir, 'app'))
+        hotkeys = [
+            {'name': 'Save', 'hotkey': 'ctrl+s'},
+            {'name': 'Numeric', 'hotkey': 5},
+            {'name': 'Bad step', 'hotkeys': ['ctrl+a']},
+            {'name': 'Bad sleep', 'hotkeys': [{'hotkey': 'ctrl+a'}, {'sleep': 'long'}]},
+            {'name': 'Bad run', 'run': ['tool.exe']},
+            {'name': 'Twice', 'hotkeys': [{'hotkey': 'ctrl+d'}, {'sleep': 30}, {'hotkey': 'ctrl+d'}]},
+        ]
+        with open(os.path.join(self.data_dir, 'app', 'keys.json'), 'w', encoding='utf-8') as f:
+            json.dump({'hotkeys': hotkeys}, f)
+        self.loader = HotkeyLoader(self.data_dir, os.path.join(self._tmp.name, 'hotkeys.snapshot'))
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_malformed_entries_are_skipped(self):
+        names = [hotkey.name for hotkey in self.loader.get_hotkeys_for_app('app')]
+        self.assertEqual(names, ['Save', 'Twice'])
+        self.assertEqual([hotkey.name for hotkey in self.loader.search_hotkeys('app', 'twice')], ['Twice'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,37 @@
+import json
+import os
+import tempfile
+import unittest
+
+from src.app_modules.hotkey_loader import HotkeyLoader
+from src.app_modules.hotkey_preloader import HotkeyPreloader
+from src.backends.simulated import SimulatedBackend
+
+
+class HotkeyPreloaderTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        data_dir = os.path.join(self._tmp.name, 'hotkeys')
+        for app in ('code', 'notepad'):
+            os.makedirs(os.path.join(data_dir, app))
+            with open(os.path.join(data_dir, app, 'keys.json'), 'w', encoding='utf-8') as f:
+                json.dump({'hotkeys': [{'name': 'Save', 'hotkey': 'ctrl+s'}]}, f)
+        self.loader = HotkeyLoader(data_dir, os.path.join(self._tmp.name, 'hotkeys.snapshot'))
+        self.backend = SimulatedBackend()
+        self.backend.add_window('Code.exe', 'main.py - Visual Studio Code')
+        self.backend.add_window('explorer.exe', 'Desktop')
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_running_apps_with_hotkeys_are_loaded_once(self):
+        preloader = HotkeyPreloader(self.loader, 0, self.backend)
+        self.assertEqual(preloader.get_running_app_names(), {'code', 'explorer'})
+        self.assertEqual(preloader.preload_running_apps(), ['code'])
+        self.assertTrue(self.loader.is_cached('code'))
+        self.assertFalse(self.loader.is_cached('notepad'))
+        self.assertEqual(preloader.preload_running_apps(), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
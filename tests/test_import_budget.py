@@ -0,0 +1,32 @@
+import json
+import subprocess
+import sys
+import unittest
+
+from benchmarks.import_budget import PROJECT_ROOT, is_forbidden
+
+
+def imported_modules(statement):
+    """Run statement in a fresh interpreter and return the names in its sys.modules."""
+    result = subprocess.run(
+        [sys.executable, '-c', f"{statement}; import json, sys; print(json.dumps(sorted(sys.modules)))"],
+        cwd=PROJECT_ROOT, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise AssertionError(f"{statement!r} failed:\n{result.stderr}")
+    return json.loads(result.stdout.splitlines()[-1])
+
+
+class ImportBudgetTest(unittest.TestCase):
+    def test_main_does_not_import_the_import_pipeline(self):
+        forbidden = [module for module in imported_modules('import main') if is_forbidden(module)]
+        self.assertEqual(forbidden, [])
+
+    def test_import_packages_load_their_dependencies_lazily(self):
+        statement = 'import src.import_hotkeys, src.import_hotkeys.web, src.import_hotkeys.openai'
+        forbidden = [module for module in imported_modules(statement) if is_forbidden(module)]
+        self.assertEqual(forbidden, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
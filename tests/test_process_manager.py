@@ -0,0 +1,40 @@
+import unittest
+from unittest import mock
+
+from src.backends.simulated import SimulatedBackend
+from src.process.process_manager import ProcessManager
+
+
+class ProcessManagerContextTest(unittest.TestCase):
+    def setUp(self):
+        self.backend = SimulatedBackend()
+        self.process_manager = ProcessManager(self.backend)
+
+    def test_context_of_foreground_window(self):
+        hwnd = self.backend.add_window('Code.exe', 'main.py - Code', rect=(10, 20, 110, 220))
+        context = self.process_manager.get_active_window_context()
+        self.assertEqual(context['hwnd'], hwnd)
+        self.assertEqual(context['name'], 'code')
+        self.assertEqual(context['title'], 'main.py - Code')
+        self.assertEqual(context['rect'], {'x': 10, 'y': 20, 'width': 100, 'height': 200})
+
+    def test_process_name_is_looked_up_once_per_window(self):
+        self.backend.add_window('Code.exe', 'main.py - Code')
+        with mock.patch.object(self.backend, 'get_process_name', wraps=self.backend.get_process_name) as lookup:
+            for _ in range(3):
+                self.assertEqual(self.process_manager.get_active_window_context()['name'], 'code')
+            self.assertEqual(lookup.call_count, 1)
+
+    def test_new_window_reusing_a_pid_is_looked_up_again(self):
+        old = self.backend.add_window('Code.exe', 'main.py - Code', pid=4000)
+        self.assertEqual(self.process_manager.get_active_window_context()['name'], 'code')
+        self.backend.close_window(old)
+        self.backend.focus(self.backend.add_window('Notepad.exe', 'notes.txt', pid=4000))
+        self.assertEqual(self.process_manager.get_active_window_context()['name'], 'notepad')
+
+    def test_no_foreground_window(self):
+        self.assertIsNone(self.process_manager.get_active_window_context())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+import unittest
+from unittest import mock
+
+from benchmarks.headless import HeadlessEventManager, HeadlessTheme, HeadlessUIManager
+from src.gui.search_manager import SearchManager
+
+
+class QueuedWindow:
+    """A toplevel whose after() callbacks run only when fire() is called."""
+
+    def __init__(self):
+        self.callbacks = {}
+        self._next_id = 0
+
+    def geometry(self, geometry=None):
+        pass
+
+    def after(self, ms, callback):
+        self._next_id += 1
+        self.callbacks[self._next_id] = callback
+        return self._next_id
+
+    def after_cancel(self, after_id):
+        self.callbacks.pop(after_id, None)
+
+    def fire(self):
+        callbacks, self.callbacks = self.callbacks, {}
+        for callback in callbacks.values():
+            callback()
+
+
+class FakeWindowManager:
+    def __init__(self):
+        self.window = QueuedWindow()
+        self.current_app = 'app'
+
+    def get_current_app(self):
+        return self.current_app
+
+    def get_current_window_title(self):
+        return None
+
+    def hide(self):
+        self.current_app = None
+
+
+class PendingSearchTest(unittest.TestCase):
+    def setUp(self):
+        self.loader = mock.Mock()
+        self.loader.search_hotkeys.return_value = []
+        self.window_manager = FakeWindowManager()
+        self.ui_manager = HeadlessUIManager(self.window_manager.window, HeadlessTheme())
+        event_manager = HeadlessEventManager(None, self.ui_manager.get_results_view(), None, None, None)
+        self.search_manager = SearchManager(
+            self.loader, self.ui_manager, event_manager, self.window_manager, None,
+            None, lambda: None, max_results=10, debounce_ms=40
+        )
+        self.search_manager._show_no_hotkeys_dialog = mock.Mock()
+
+    def test_search_runs_after_debounce(self):
+        self.ui_manager.get_search_var().set('save')
+        self.loader.search_hotkeys.assert_not_called()
+        self.window_manager.window.fire()
+        self.loader.search_hotkeys.assert_called_once()
+
+    def test_search_pending_when_hidden_is_dropped(self):
+        self.ui_manager.get_search_var().set('save')
+        # e.g. focus loss, which hides through the window manager directly
+        self.window_manager.hide()
+        self.window_manager.window.fire()
+        self.loader.search_hotkeys.assert_not_called()
+        self.search_manager._show_no_hotkeys_dialog.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
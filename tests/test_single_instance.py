@@ -0,0 +1,58 @@
+import os
+import socket
+import stat
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+from src.process import single_instance
+from src.process.single_instance import InstanceServer, send_command, COMMAND_SHOW
+
+
+@unittest.skipIf(sys.platform == 'win32', "Unix socket address")
+class InstanceServerStartTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.address = os.path.join(self._tmp.name, 'instance.sock')
+        self.key_file = os.path.join(self._tmp.name, 'data', 'instance.key')
+        patcher = mock.patch.object(single_instance, 'instance_address', return_value=(self.address, 'AF_UNIX'))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.commands = []
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _server(self):
+        server = InstanceServer(lambda command, text: self.commands.append((command, text)) or True, self.key_file)
+        self.addCleanup(server.stop)
+        return server
+
+    def test_stale_socket_is_taken_over(self):
+        # A socket file without a listener, as left by a crashed instance
+        stale = socket.socket(socket.AF_UNIX)
+        stale.bind(self.address)
+        stale.close()
+
+        self.assertTrue(self._server().start())
+        self.assertEqual(send_command(COMMAND_SHOW, 'abc', self.key_file), {'ok': True})
+        self.assertEqual(self.commands, [(COMMAND_SHOW, 'abc')])
+
+    def test_running_instance_is_not_taken_over(self):
+        self.assertTrue(self._server().start())
+        self.assertFalse(self._server().start())
+
+    def test_key_file_is_private_even_if_it_existed(self):
+        os.makedirs(os.path.dirname(self.key_file))
+        with open(self.key_file, 'wb') as f:
+            f.write(b'old')
+        os.chmod(self.key_file, 0o644)
+
+        self.assertTrue(self._server().start())
+        self.assertEqual(stat.S_IMODE(os.stat(self.key_file).st_mode), 0o600)
+        self.assertNotEqual(single_instance._read_key(self.key_file), b'old')
+
+
+if __name__ == '__main__':
+    unittest.main()